@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Hook engine for PreToolUse checks.
+
+Runs the checks of prevent-secret-writes.sh and git-safety-check.sh (and
+any other rule sets you configure) in a single process per event: the hook
+JSON is parsed once, without forking jq, and every rule set is compiled
+into one combined regular expression instead of being looped over pattern
+by pattern.
+
+Rules are read from the "rules" key of one or more hook config files (see
+hook-engine.json):
+
+    "rules": {
+      "secret-protection": {
+        "tools": "Write|Edit",
+        "field": "file_path",
+        "match": "basename-substring",
+        "patterns": [".env", "id_rsa", ...],
+        "message": "🚫 Blocked: ... {value}",
+        "passed": "Secret protection check passed"
+      }
+    }
+
+- tools: hook matcher for tool_name (rule is skipped for other tools)
+- field: tool_input field to check; the rule is skipped when it is empty
+- match: "substring", "basename-substring" or "regex" (POSIX ERE, searched
+  like bash's [[ =~ ]])
+- require: optional regex the value must match for the rule to apply
+- message: printed to stderr when blocked; {value} is the checked value
+  ({basename} is also available); any other braces are printed as-is
+- passed: optional message printed to stdout when the check passes
+
+Exit codes follow the shell hooks: 0 = approve, 2 = block, 1 = bad input
+or configuration (non-blocking error).
+
+Usage:
+    hook_engine.py --config hook-engine.json [--config other.json] < event.json
+"""
+
+import json
+import os
+import re
+import sys
+
+
+MATCH_MODES = ("substring", "basename-substring", "regex")
+MESSAGE_FIELD_RE = re.compile(r"\{(value|basename)\}")
+
+
+class RuleError(ValueError):
+    """Raised when a rule set in a hook config is malformed."""
+
+
+class Rule:
+    """One rule set compiled into a single combined matcher."""
+
+    def __init__(self, name, spec):
+        """
+        Args:
+            name: Rule set name (key under "rules")
+            spec: Rule set definition from the config
+
+        Raises:
+            RuleError: If the definition is malformed
+        """
+        if not isinstance(spec, dict):
+            raise RuleError(f"rule '{name}' must be an object")
+        field = spec.get("field")
+        patterns = spec.get("patterns")
+        mode = spec.get("match", "regex")
+        if not isinstance(field, str) or not field:
+            raise RuleError(f"rule '{name}': 'field' must be a non-empty string")
+        if not isinstance(patterns, list) or not patterns or not all(isinstance(p, str) for p in patterns):
+            raise RuleError(f"rule '{name}': 'patterns' must be a non-empty list of strings")
+        if mode not in MATCH_MODES:
+            raise RuleError(f"rule '{name}': 'match' must be one of: {', '.join(MATCH_MODES)}")
+
+        self.name = name
+        self.field = field
+        self.basename = mode == "basename-substring"
+        self.message = spec.get("message", f"Blocked by rule '{name}': {{value}}")
+        self.passed = spec.get("passed")
+
+        try:
+            if mode == "regex":
+                # Bash [[ =~ ]] uses POSIX ERE, where '.' also matches a newline
+                combined = "|".join(f"(?:{p})" for p in patterns)
+            else:
+                combined = "|".join(re.escape(p) for p in patterns)
+            self._matcher = re.compile(combined, re.DOTALL)
+            self._tools = re.compile(spec["tools"]) if spec.get("tools") not in (None, "", "*") else None
+            self._require = re.compile(spec["require"], re.DOTALL) if spec.get("require") else None
+        except re.error as e:
+            raise RuleError(f"rule '{name}': invalid pattern: {e}") from None
+
+    def applies_to(self, tool_name):
+        """Return True if the rule should run for the given tool_name."""
+        return self._tools is None or not tool_name or self._tools.fullmatch(tool_name) is not None
+
+    def check(self, tool_input):
+        """
+        Check an event's tool_input against the rule.
+
+        Returns:
+            None if the rule does not apply, otherwise (blocked, value, basename)
+        """
+        value = _field_text(tool_input.get(self.field))
+        if not value:
+            return None
+        if self._require is not None and not self._require.search(value):
+            return None
+
+        basename = _basename(value)
+        blocked = self._matcher.search(basename if self.basename else value) is not None
+        return blocked, value, basename
+
+
+def _field_text(value):
+    """Render a tool_input value the way `jq -r '.field // empty'` does."""
+    if value is None or value is False:
+        return ""
+    if isinstance(value, str):
+        # Command substitution strips trailing newlines
+        return value.rstrip("\n")
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _basename(path):
+    """Return the last path component like basename(1)."""
+    stripped = path.rstrip("/")
+    return os.path.basename(stripped) if stripped else path[:1]
+
+
+def load_rules(config_paths):
+    """
+    Load and compile the rule sets from hook config files.
+
+    Args:
+        config_paths: Paths to JSON hook configs with a "rules" key
+
+    Returns:
+        List of compiled rules, in config order
+
+    Raises:
+        RuleError: If a config cannot be read or a rule is malformed
+    """
+    rules = []
+    for path in config_paths:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                config = json.load(f)
+        except (OSError, ValueError) as e:
+            raise RuleError(f"cannot load {path}: {e}") from None
+        specs = config.get("rules", {}) if isinstance(config, dict) else None
+        if not isinstance(specs, dict):
+            raise RuleError(f"{path}: 'rules' must be an object")
+        rules.extend(Rule(name, spec) for name, spec in specs.items())
+    return rules
+
+
+def evaluate(rules, event):
+    """
+    Evaluate all rules against one hook event.
+
+    Args:
+        rules: Compiled rules
+        event: Parsed hook input
+
+    Returns:
+        Tuple of (exit_code, stdout_lines, stderr_lines)
+    """
+    tool_input = event.get("tool_input") if isinstance(event, dict) else None
+    if not isinstance(tool_input, dict):
+        return 0, [], []
+    tool_name = event.get("tool_name")
+
+    passed = []
+    for rule in rules:
+        if not rule.applies_to(tool_name):
+            continue
+        result = rule.check(tool_input)
+        if result is None:
+            continue
+        blocked, value, basename = result
+        if blocked:
+            fields = {"value": value, "basename": basename}
+            # Substitute in one pass so braces in the message or the value are kept
+            message = MESSAGE_FIELD_RE.sub(lambda m: fields[m.group(1)], rule.message)
+            return 2, [], message.splitlines()
+        if rule.passed:
+            passed.append(rule.passed)
+    return 0, passed, []
+
+
+def main():
+    """Main entry point."""
+    args = sys.argv[1:]
+    config_paths = []
+    while args:
+        if args[0] == "--config" and len(args) > 1:
+            config_paths.append(args[1])
+            args = args[2:]
+        else:
+            print("usage: hook_engine.py --config hook-config.json [--config ...] < event.json", file=sys.stderr)
+            sys.exit(1)
+    if not config_paths:
+        print("usage: hook_engine.py --config hook-config.json [--config ...] < event.json", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        rules = load_rules(config_paths)
+    except RuleError as e:
+        print(f"hook_engine: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        event = json.load(sys.stdin)
+    except ValueError as e:
+        print(f"hook_engine: invalid hook input: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    code, out, err = evaluate(rules, event)
+    for line in out:
+        print(line)
+    for line in err:
+        print(line, file=sys.stderr)
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
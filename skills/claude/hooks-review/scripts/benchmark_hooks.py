@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+Latency benchmark for the hook templates.
+
+Installs every hook configured in assets/hooks-templates/*.json into a
+throw-away project (``$CLAUDE_PROJECT_DIR/.claude/hooks``) and feeds each one
+synthetic hook payloads: short and long Bash commands, shallow and deeply
+nested file paths, and inputs that should and should not be blocked. Tool
+hooks receive both PreToolUse and PostToolUse payloads. Each hook command is
+run through ``bash -c`` like Claude Code does, with HOME pointing at a
+temporary directory so the session logging hooks do not touch your real
+``~/.claude/logs``.
+
+For every hook the report shows p50/p95/p99 latency, throughput and the exit
+codes seen, and flags hooks whose p99 latency comes close to (or exceeds)
+the ``timeout`` configured for them.
+
+Usage:
+    # Benchmark all templates
+    python3 benchmark_hooks.py
+
+    # More samples, only hooks whose command mentions "git"
+    python3 benchmark_hooks.py --repeat 200 --hook git
+
+    # Flag hooks whose p99 exceeds 25% of their timeout and save the results
+    python3 benchmark_hooks.py --near 0.25 --save hooks-bench.json
+
+Exit codes: 0 = no hook near its timeout, 1 = at least one hook flagged.
+"""
+
+import argparse
+import json
+import math
+import os
+import shutil
+import stat
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "assets" / "hooks-templates"
+
+# Tools used when a hook's matcher is a wildcard
+DEFAULT_TOOLS = ["Bash", "Write", "Edit"]
+
+
+@dataclass
+class HookTarget:
+    """One configured hook command."""
+
+    config: str
+    event: str
+    matcher: str
+    command: str
+    timeout_ms: int
+
+    @property
+    def name(self) -> str:
+        """Short display name: the first script referenced by the command."""
+        for token in self.command.split():
+            base = os.path.basename(token)
+            if base.endswith((".sh", ".py")):
+                return base
+        return self.command
+
+
+@dataclass
+class CaseResult:
+    """Latency samples for one payload fed to one hook."""
+
+    label: str
+    samples: List[float] = field(default_factory=list)
+    exit_codes: Dict[int, int] = field(default_factory=dict)
+    timeouts: int = 0
+
+
+def load_targets(templates_dir: Path) -> List[HookTarget]:
+    """
+    Collect the command hooks from every JSON config in the templates dir.
+
+    Args:
+        templates_dir: Directory containing the hook config templates
+
+    Returns:
+        Hook targets in config order (duplicates across configs are kept once)
+    """
+    targets = []
+    seen = set()
+    for config_path in sorted(templates_dir.glob("*.json")):
+        with open(config_path, "r", encoding="utf-8") as f:
+            config = json.load(f)
+        for event, matchers in config.get("hooks", {}).items():
+            for matcher, hooks in matchers.items():
+                for hook in hooks:
+                    if hook.get("type") != "command":
+                        continue
+                    key = (event, matcher, hook["command"])
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    targets.append(HookTarget(
+                        config=config_path.name,
+                        event=event,
+                        matcher=matcher,
+                        command=hook["command"],
+                        timeout_ms=int(hook.get("timeout", 60000)),
+                    ))
+    return targets
+
+
+def install_templates(templates_dir: Path, project_dir: Path) -> None:
+    """Copy the template scripts and configs to project_dir/.claude/hooks and make scripts executable."""
+    hooks_dir = project_dir / ".claude" / "hooks"
+    hooks_dir.mkdir(parents=True)
+    for source in templates_dir.iterdir():
+        if source.suffix in (".sh", ".py", ".json"):
+            target = hooks_dir / source.name
+            shutil.copyfile(source, target)
+            if source.suffix in (".sh", ".py"):
+                target.chmod(target.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+
+
+def _tools_for(matcher: str) -> List[str]:
+    """Expand a hook matcher into the tool names to generate payloads for."""
+    if matcher in ("", "*"):
+        return DEFAULT_TOOLS
+    return [tool for tool in matcher.split("|") if tool]
+
+
+def tool_inputs(tool: str, project_dir: Path) -> List[Tuple[str, Dict]]:
+    """
+    Synthetic tool_input payloads for a tool.
+
+    Returns:
+        List of (label, tool_input)
+    """
+    if tool == "Bash":
+        long_command = "echo " + " ".join(f"arg{i}" for i in range(2000))
+        return [
+            ("short command", {"command": "ls -la"}),
+            ("long command (~14 KB)", {"command": long_command}),
+            ("safe git command", {"command": "git status --short"}),
+            ("dangerous git command", {"command": "git push origin main --force"}),
+            ("long git command", {"command": "git log --oneline " + " ".join(f"path/{i}" for i in range(1000))}),
+        ]
+
+    deep_dir = "/".join(f"level{i:02d}" for i in range(40))
+    content = "x = 1\n" * 2000
+    inputs = [
+        ("shallow path", {"file_path": str(project_dir / "src" / "app.js"), "content": "const a = 1;\n"}),
+        ("deep path (40 levels)", {"file_path": str(project_dir / deep_dir / "module.py"), "content": content}),
+        ("protected file", {"file_path": str(project_dir / ".env.production"), "content": "SECRET=1\n"}),
+        ("protected key in deep path", {"file_path": str(project_dir / deep_dir / "id_ed25519"), "content": ""}),
+    ]
+    if tool == "Edit":
+        for _, tool_input in inputs:
+            tool_input["old_string"] = tool_input.pop("content")[:64]
+            tool_input["new_string"] = "y = 2\n"
+    return inputs
+
+
+def payloads(target: HookTarget, project_dir: Path) -> List[Tuple[str, str]]:
+    """
+    Build the JSON payloads to feed to a hook.
+
+    Returns:
+        List of (label, serialized payload)
+    """
+    base = {
+        "session_id": "benchmark-session",
+        "transcript_path": str(project_dir / "transcript.jsonl"),
+        "cwd": str(project_dir),
+    }
+    result = []
+    if target.event not in ("PreToolUse", "PostToolUse"):
+        for label, extra in [("minimal", {}), ("with reason", {"reason": "clear" if target.event == "SessionEnd" else "startup"})]:
+            result.append((label, json.dumps({**base, "hook_event_name": target.event, **extra})))
+        return result
+
+    for tool in _tools_for(target.matcher):
+        for label, tool_input in tool_inputs(tool, project_dir):
+            for event in ("PreToolUse", "PostToolUse"):
+                payload = {**base, "hook_event_name": event, "tool_name": tool, "tool_input": tool_input}
+                if event == "PostToolUse":
+                    payload["tool_response"] = {"success": True, "stdout": "ok\n" * 500}
+                result.append((f"{event} {tool}: {label}", json.dumps(payload)))
+    return result
+
+
+def run_case(command: str, payload: str, env: Dict[str, str], cwd: Path, timeout_ms: int,
+             warmup: int, repeat: int, label: str) -> CaseResult:
+    """Run a hook command repeatedly with one payload and collect latencies (ms)."""
+    result = CaseResult(label)
+    for i in range(warmup + repeat):
+        start = time.perf_counter()
+        try:
+            proc = subprocess.run(
+                ["bash", "-c", command],
+                input=payload.encode("utf-8"),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                env=env,
+                cwd=cwd,
+                timeout=timeout_ms / 1000,
+            )
+            code = proc.returncode
+        except subprocess.TimeoutExpired:
+            code = None
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if i < warmup:
+            continue
+        result.samples.append(elapsed_ms)
+        if code is None:
+            result.timeouts += 1
+        else:
+            result.exit_codes[code] = result.exit_codes.get(code, 0) + 1
+    return result
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(samples)
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def summarize(target: HookTarget, cases: List[CaseResult], near: float) -> Dict:
+    """
+    Aggregate the case results of one hook.
+
+    Args:
+        target: The hook
+        cases: Per-payload results
+        near: Fraction of the timeout at which a hook is flagged
+
+    Returns:
+        Summary dictionary (latencies in ms, throughput in runs/s)
+    """
+    samples = [s for case in cases for s in case.samples]
+    exit_codes: Dict[int, int] = {}
+    for case in cases:
+        for code, count in case.exit_codes.items():
+            exit_codes[code] = exit_codes.get(code, 0) + count
+    timeouts = sum(case.timeouts for case in cases)
+    p99 = percentile(samples, 99)
+
+    status = "ok"
+    if timeouts or p99 >= target.timeout_ms:
+        status = "over-timeout"
+    elif p99 >= target.timeout_ms * near:
+        status = "near-timeout"
+
+    return {
+        "hook": target.name,
+        "config": target.config,
+        "event": target.event,
+        "matcher": target.matcher,
+        "timeout_ms": target.timeout_ms,
+        "runs": len(samples),
+        "p50_ms": round(percentile(samples, 50), 2),
+        "p95_ms": round(percentile(samples, 95), 2),
+        "p99_ms": round(p99, 2),
+        "max_ms": round(max(samples), 2),
+        "throughput_per_sec": round(len(samples) / (sum(samples) / 1000), 1),
+        "exit_codes": {str(code): count for code, count in sorted(exit_codes.items())},
+        "timeouts": timeouts,
+        "status": status,
+        "cases": [
+            {
+                "label": case.label,
+                "p50_ms": round(percentile(case.samples, 50), 2),
+                "p99_ms": round(percentile(case.samples, 99), 2),
+                "exit_codes": {str(code): count for code, count in sorted(case.exit_codes.items())},
+                "timeouts": case.timeouts,
+            }
+            for case in cases
+        ],
+    }
+
+
+def print_report(summaries: List[Dict], near: float, verbose: bool) -> None:
+    """Print the benchmark results as a table."""
+    header = f"{'hook':<26} {'event':<13} {'matcher':<16} {'p50':>8} {'p95':>8} {'p99':>8} {'runs/s':>8} {'timeout':>8}  exit codes"
+    print(header)
+    print("-" * len(header))
+    for summary in summaries:
+        codes = " ".join(f"{code}×{count}" for code, count in summary["exit_codes"].items())
+        if summary["timeouts"]:
+            codes += f" timeout×{summary['timeouts']}"
+        print(
+            f"{summary['hook']:<26} {summary['event']:<13} {summary['matcher']:<16} "
+            f"{summary['p50_ms']:>6.1f}ms {summary['p95_ms']:>6.1f}ms {summary['p99_ms']:>6.1f}ms "
+            f"{summary['throughput_per_sec']:>8.1f} {summary['timeout_ms']:>6}ms  {codes}"
+        )
+        if verbose:
+            for case in summary["cases"]:
+                case_codes = " ".join(f"{code}×{count}" for code, count in case["exit_codes"].items())
+                print(f"    {case['label']:<58} p50 {case['p50_ms']:>6.1f}ms  p99 {case['p99_ms']:>6.1f}ms  {case_codes}")
+
+    flagged = [s for s in summaries if s["status"] != "ok"]
+    print()
+    if not flagged:
+        print(f"✅ All hooks stay below {near:.0%} of their configured timeout (p99)")
+        return
+    for summary in flagged:
+        if summary["status"] == "over-timeout":
+            print(f"❌ {summary['hook']} ({summary['event']} {summary['matcher']}): "
+                  f"p99 {summary['p99_ms']:.1f}ms reaches its {summary['timeout_ms']}ms timeout "
+                  f"({summary['timeouts']} runs killed)")
+        else:
+            print(f"⚠️  {summary['hook']} ({summary['event']} {summary['matcher']}): "
+                  f"p99 {summary['p99_ms']:.1f}ms is {summary['p99_ms'] / summary['timeout_ms']:.0%} "
+                  f"of its {summary['timeout_ms']}ms timeout")
+
+
+def run_benchmarks(args: argparse.Namespace) -> List[Dict]:
+    """Install the templates in a sandbox and benchmark every selected hook."""
+    targets = load_targets(args.templates_dir)
+    if args.hook:
+        targets = [t for t in targets if args.hook in t.command]
+    if not targets:
+        raise SystemExit("No hooks selected")
+
+    with tempfile.TemporaryDirectory(prefix="hooks-bench-") as tmp:
+        sandbox = Path(tmp)
+        project_dir = sandbox / "project"
+        home_dir = sandbox / "home"
+        home_dir.mkdir()
+        install_templates(args.templates_dir, project_dir)
+        env = {**os.environ, "HOME": str(home_dir), "CLAUDE_PROJECT_DIR": str(project_dir)}
+
+        summaries = []
+        for target in targets:
+            cases = [
+                run_case(target.command, payload, env, project_dir, target.timeout_ms,
+                         args.warmup, args.repeat, label)
+                for label, payload in payloads(target, project_dir)
+            ]
+            summaries.append(summarize(target, cases, args.near))
+            print(f"  measured {target.name} ({target.event} {target.matcher})", file=sys.stderr)
+        return summaries
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the latency of the hook templates",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--templates-dir", type=Path, default=TEMPLATES_DIR,
+                        help="Directory with the hook configs and scripts (default: assets/hooks-templates)")
+    parser.add_argument("--hook", help="Only benchmark hooks whose command contains this string")
+    parser.add_argument("--repeat", type=int, default=30, help="Measured runs per payload (default: 30)")
+    parser.add_argument("--warmup", type=int, default=2, help="Unmeasured runs per payload (default: 2)")
+    parser.add_argument("--near", type=float, default=0.5,
+                        help="Flag hooks whose p99 reaches this fraction of their timeout (default: 0.5)")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Show per-payload latencies")
+    parser.add_argument("--save", type=Path, help="Write the results as JSON to this path")
+    args = parser.parse_args()
+    if args.repeat < 1 or args.warmup < 0:
+        parser.error("--repeat must be at least 1 and --warmup at least 0")
+    if not 0 < args.near <= 1:
+        parser.error("--near must be in (0, 1]")
+    if shutil.which("jq") is None:
+        print("Warning: jq is not installed; the shell hooks will fail fast instead of doing real work",
+              file=sys.stderr)
+
+    summaries = run_benchmarks(args)
+    print_report(summaries, args.near, args.verbose)
+
+    if args.save:
+        args.save.write_text(json.dumps({"near": args.near, "hooks": summaries}, indent=2, ensure_ascii=False) + "\n")
+
+    sys.exit(1 if any(s["status"] != "ok" for s in summaries) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Tests for hook_engine.py.
+
+    python3 -m unittest discover skills/claude/hooks-review/tests
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "assets" / "hooks-templates"
+sys.path.insert(0, str(TEMPLATES_DIR))
+
+import hook_engine  # noqa: E402
+
+
+def write_event(file_path: str) -> dict:
+    """Build a Write hook event for a file path."""
+    return {"tool_name": "Write", "tool_input": {"file_path": file_path}}
+
+
+class MessageTest(unittest.TestCase):
+    """Block messages substitute {value} and {basename} and keep other braces."""
+
+    def evaluate(self, message: str, file_path: str = "config/.env"):
+        rule = hook_engine.Rule("secrets", {
+            "tools": "Write",
+            "field": "file_path",
+            "match": "basename-substring",
+            "patterns": [".env"],
+            "message": message,
+        })
+        return hook_engine.evaluate([rule], write_event(file_path))
+
+    def test_placeholders(self):
+        code, out, err = self.evaluate("Blocked {basename}\nPath: {value}")
+        self.assertEqual((code, out), (2, []))
+        self.assertEqual(err, ["Blocked .env", "Path: config/.env"])
+
+    def test_literal_braces_are_kept(self):
+        code, _, err = self.evaluate('Blocked {value}: use {"secret": "vault"} or ${HOME}/{{x}} {0} {missing}')
+        self.assertEqual(code, 2)
+        self.assertEqual(err, ['Blocked config/.env: use {"secret": "vault"} or ${HOME}/{{x}} {0} {missing}'])
+
+    def test_placeholder_in_value_is_not_expanded(self):
+        _, _, err = self.evaluate("Blocked {value}", file_path="{basename}/.env")
+        self.assertEqual(err, ["Blocked {basename}/.env"])
+
+    def test_default_message(self):
+        rule = hook_engine.Rule("secrets", {"field": "file_path", "match": "substring", "patterns": [".env"]})
+        _, _, err = hook_engine.evaluate([rule], write_event(".env"))
+        self.assertEqual(err, ["Blocked by rule 'secrets': .env"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,83 +6,1547 @@ Validates the structure and content of .claude-plugin/marketplace.json,
 with special focus on verifying that all referenced paths actually exist.
 """
 
+import argparse
+import difflib
+import errno
+import glob
+import hashlib
+import io
 import json
+import os
+import re
+import stat
 import sys
+import threading
+import time
+import urllib.parse
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Set, Tuple
+
+
+class StatCache:
+    """
+    Memoized filesystem lookups.
+
+    Each distinct path is resolved with a single os.stat() call, and the
+    result (including "does not exist") is reused for every later check.
+    A cache can be shared between validators and across plugins.
+    """
+
+    def __init__(self):
+        self._stats: Dict[str, Optional[os.stat_result]] = {}
+        # Filesystem system calls (stat, scandir, open) issued through or on
+        # behalf of this cache; used by the profiler
+        self.syscalls = 0
+
+    def stat(self, path: Path) -> Optional[os.stat_result]:
+        """
+        Return the stat result for a path, or None if it does not exist.
+
+        Args:
+            path: Path to look up
+        """
+        key = os.path.normpath(path)
+        if key not in self._stats:
+            self.syscalls += 1
+            try:
+                self._stats[key] = os.stat(key)
+            except OSError:
+                self._stats[key] = None
+        return self._stats[key]
+
+    def kind(self, path: Path) -> Optional[str]:
+        """
+        Classify a path as 'file', 'dir' or 'other'.
+
+        Returns:
+            The kind of the path, or None if it does not exist
+        """
+        st = self.stat(path)
+        if st is None:
+            return None
+        if stat.S_ISREG(st.st_mode):
+            return 'file'
+        if stat.S_ISDIR(st.st_mode):
+            return 'dir'
+        return 'other'
+
+    def clear(self) -> None:
+        """Forget all cached results."""
+        self._stats.clear()
+
+
+class RepoIndex:
+    """
+    In-memory index of the files and directories in a repository.
+
+    The index is built with a single os.scandir() walk over the top-level
+    directories that the marketplace actually references, after which every
+    path check is a set lookup. Paths outside the indexed roots, or below a
+    symlinked directory (which the walk does not follow), fall back to the
+    stat cache. The same index provides "did you mean" suggestions for
+    missing paths without touching the filesystem again.
+
+    The modification time of every listed directory (and of the repository
+    root) is recorded, so a long-lived index can be reused until changed()
+    reports that one of them gained or lost entries.
+    """
+
+    def __init__(self, repo_root: Path, roots: Iterable[str], fallback: StatCache):
+        """
+        Build the index.
+
+        Args:
+            repo_root: Repository root directory
+            roots: Top-level entries (first path components) to index
+            fallback: Stat cache used for paths the index does not cover
+        """
+        self.repo_root = repo_root
+        self.fallback = fallback
+        self.roots: Set[str] = set()
+        self.files: Set[str] = set()
+        self.dirs: Set[str] = set()
+        self._unindexed: Set[str] = set()
+        # Directories listed by the walk (what the index contents depend on)
+        self.scanned: List[str] = []
+        # Repository-relative directory -> st_mtime_ns when it was listed
+        self._stamps: Dict[str, int] = {}
+        root_st = fallback.stat(repo_root)
+        if root_st is not None:
+            self._stamps['.'] = root_st.st_mtime_ns
+        # Lookup tables for suggestions: parent -> child names, name -> paths
+        self._children: Dict[str, List[str]] = {}
+        self._by_name: Dict[str, List[str]] = {}
+
+        self.add_roots(roots)
+
+    def add_roots(self, roots: Iterable[str]) -> None:
+        """
+        Extend the index with top-level entries that are not indexed yet.
+
+        Args:
+            roots: Top-level entries (first path components) to index
+        """
+        for root in sorted(set(roots) - self.roots):
+            self.roots.add(root)
+            self._walk(root)
+
+    def _walk(self, root: str) -> None:
+        """Add root and everything below it to the index."""
+        kind = self.fallback.kind(self.repo_root / root)
+        if kind == 'file':
+            self.files.add(root)
+            return
+        if kind != 'dir':
+            return
+
+        self.dirs.add(root)
+        stack = [root]
+        while stack:
+            rel_dir = stack.pop()
+            self.scanned.append(rel_dir)
+            # Stamp before listing, so a change made during the walk is seen as one
+            dir_st = self.fallback.stat(self.repo_root / rel_dir)
+            if dir_st is not None:
+                self._stamps[rel_dir] = dir_st.st_mtime_ns
+            self.fallback.syscalls += 1
+            try:
+                entries = os.scandir(self.repo_root / rel_dir)
+            except OSError:
+                self._unindexed.add(rel_dir)
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.name == '.git':
+                        continue
+                    rel = f"{rel_dir}/{entry.name}"
+                    self._children.setdefault(rel_dir, []).append(entry.name)
+                    self._by_name.setdefault(entry.name, []).append(rel)
+                    try:
+                        if entry.is_dir():
+                            self.dirs.add(rel)
+                            if entry.is_symlink():
+                                self._unindexed.add(rel)
+                            else:
+                                stack.append(rel)
+                        elif entry.is_file():
+                            self.files.add(rel)
+                    except OSError:
+                        continue
+
+    def changed(self, stat_cache: StatCache) -> bool:
+        """
+        Check whether any indexed directory gained or lost entries since it was listed.
+
+        Costs one stat per indexed directory instead of a new walk.
+
+        Args:
+            stat_cache: Fresh stat cache to look the directories up with
+        """
+        for rel_dir, mtime_ns in self._stamps.items():
+            st = stat_cache.stat(self.repo_root / rel_dir)
+            if st is None or st.st_mtime_ns != mtime_ns:
+                return True
+        return False
+
+    def _relative(self, path: Path) -> Optional[str]:
+        """Return the repository-relative POSIX path, or None if the index does not cover it."""
+        rel = os.path.relpath(os.path.normpath(path), os.path.normpath(self.repo_root))
+        rel = rel.replace(os.sep, '/')
+        parts = rel.split('/')
+        if parts[0] not in self.roots:
+            return None
+        for i in range(1, len(parts)):
+            if '/'.join(parts[:i]) in self._unindexed:
+                return None
+        return rel
+
+    def kind(self, path: Path) -> Optional[str]:
+        """
+        Classify a path as 'file' or 'dir' using the index.
+
+        Returns:
+            The kind of the path, or None if it does not exist
+        """
+        rel = self._relative(path)
+        if rel is None:
+            return self.fallback.kind(path)
+        if rel in self.files:
+            return 'file'
+        if rel in self.dirs:
+            return 'dir'
+        return None
+
+    def suggest(self, path: Path, kind: str) -> Optional[str]:
+        """
+        Suggest the closest existing path of the given kind.
+
+        Args:
+            path: Missing path
+            kind: 'file' or 'dir'
+
+        Returns:
+            Repository-relative path of the best match, or None
+        """
+        rel = self._relative(path)
+        if rel is None:
+            return None
+        existing = self.files if kind == 'file' else self.dirs
+        parent, _, name = rel.rpartition('/')
+
+        # A similarly named sibling (typo), then the same name elsewhere (moved)
+        siblings = [c for c in self._children.get(parent, []) if f"{parent}/{c}" in existing]
+        matches = difflib.get_close_matches(name, siblings, n=1, cutoff=0.6)
+        if matches:
+            return f"{parent}/{matches[0]}"
+
+        moved = sorted(p for p in self._by_name.get(name, []) if p in existing)
+        return moved[0] if moved else None
+
+
+# Upper bound on the bytes read while looking for a frontmatter block
+FRONTMATTER_MAX_BYTES = 64 * 1024
+
+
+def read_frontmatter(path: Path, max_bytes: int = FRONTMATTER_MAX_BYTES) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Read and parse the YAML frontmatter block at the top of a Markdown file.
+
+    Only the frontmatter is read: the file is consumed line by line and
+    reading stops at the closing '---' (or after max_bytes), so the size of
+    the document body does not matter.
+
+    Args:
+        path: Markdown file to read
+        max_bytes: Maximum number of bytes to read
+
+    Returns:
+        Tuple of (fields, error). fields is None when error is set.
+    """
+    lines = []
+    consumed = 0
+    try:
+        with open(path, 'rb') as f:
+            first = f.readline(max_bytes)
+            if first.lstrip(b'\xef\xbb\xbf').rstrip(b'\r\n') != b'---':
+                return None, "no YAML frontmatter (file must start with '---')"
+            consumed = len(first)
+            while True:
+                if consumed >= max_bytes:
+                    return None, f"frontmatter is not closed within the first {max_bytes} bytes"
+                line = f.readline(max_bytes - consumed)
+                if not line:
+                    return None, "frontmatter is not closed with '---'"
+                consumed += len(line)
+                if line.rstrip(b'\r\n') == b'---':
+                    break
+                lines.append(line.decode('utf-8'))
+    except UnicodeDecodeError:
+        return None, "frontmatter is not valid UTF-8"
+    except OSError as e:
+        return None, f"cannot read file: {e.strerror}"
+
+    try:
+        return _parse_frontmatter(lines), None
+    except ValueError as e:
+        return None, f"invalid frontmatter: {e}"
+
+
+def _parse_frontmatter(lines: List[str]) -> Dict[str, Any]:
+    """
+    Parse the small YAML subset used in skill and agent frontmatter.
+
+    Supports top-level 'key: value' pairs, quoted scalars, inline lists
+    ('[a, b]'), block lists ('- item') and indented continuation lines
+    (including '|' and '>' block scalars, folded into one line).
+
+    Raises:
+        ValueError: If a line does not fit that subset
+    """
+    fields: Dict[str, Any] = {}
+    key = None
+    for raw in lines:
+        line = raw.rstrip('\r\n')
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+
+        if line[0] in ' \t' or stripped.startswith('- ') or stripped == '-':
+            if key is None:
+                raise ValueError(f"unexpected indented line: {stripped}")
+            if stripped.startswith('-') and (fields[key] == '' or isinstance(fields[key], list)):
+                if fields[key] == '':
+                    fields[key] = []
+                fields[key].append(_parse_scalar(stripped[1:].strip()))
+            elif isinstance(fields[key], str):
+                fields[key] = f"{fields[key]} {stripped}".strip()
+            else:
+                raise ValueError(f"unexpected line in '{key}': {stripped}")
+            continue
+
+        name, sep, value = line.partition(':')
+        if not sep or not name.strip():
+            raise ValueError(f"expected 'key: value', got: {stripped}")
+        key = name.strip()
+        value = value.strip()
+        fields[key] = '' if value in ('|', '|-', '>', '>-') else _parse_scalar(value)
+    return fields
+
+
+def _parse_scalar(value: str) -> Any:
+    """Parse a scalar or inline list value from frontmatter."""
+    if value.startswith('[') and value.endswith(']'):
+        return [_parse_scalar(item.strip()) for item in value[1:-1].split(',') if item.strip()]
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+        return value[1:-1]
+    return value
+
+
+# Markdown constructs recognized by the link checker
+_FENCE_RE = re.compile(r'^ {0,3}(`{3,}|~{3,})')
+_HEADING_RE = re.compile(r'^ {0,3}#{1,6}[ \t]+(.*?)(?:[ \t]+#+)?[ \t]*$')
+_CODE_SPAN_RE = re.compile(r'(`+).*?\1')
+_INLINE_LINK_RE = re.compile(
+    r'!?\[(?:[^\[\]]|\[[^\[\]]*\])*\]\(\s*(<[^>]*>|[^)\s]+)(?:\s+(?:"[^"]*"|' r"'[^']*'" r'|\([^)]*\)))?\s*\)'
+)
+_REFERENCE_DEF_RE = re.compile(r'^ {0,3}\[[^\]]+\]:\s*(<[^>]*>|\S+)')
+_HTML_ANCHOR_RE = re.compile(r'<a\s[^>]*?(?:name|id)\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+_URL_SCHEME_RE = re.compile(r'^[A-Za-z][A-Za-z0-9+.-]*:')
+
+
+def github_slug(heading: str) -> str:
+    """
+    Return the anchor GitHub generates for a heading (without the duplicate suffix).
+
+    Inline links are reduced to their text and code/emphasis markers are
+    dropped; then the text is lowercased, everything except letters, digits,
+    underscores, hyphens and spaces is removed, and spaces become hyphens.
+    """
+    text = re.sub(r'!?\[([^\]]*)\]\([^)]*\)', r'\1', heading)
+    text = text.replace('`', '').replace('*', '')
+    text = re.sub(r'<[^>]+>', '', text)
+    return re.sub(r'[^\w\- ]', '', text.lower()).replace(' ', '-')
+
+
+@dataclass
+class MarkdownDoc:
+    """Heading anchors and outgoing links of one Markdown file."""
+
+    anchors: Set[str] = field(default_factory=set)
+    # (line number, link target) for every inline link, image and reference definition
+    links: List[Tuple[int, str]] = field(default_factory=list)
+
+
+def scan_markdown(path: Path) -> MarkdownDoc:
+    """
+    Collect the heading anchors and link targets of a Markdown file.
+
+    Fenced code blocks and inline code spans are skipped. Anchors follow
+    GitHub's rules, including the -1, -2, ... suffixes for repeated
+    headings; explicit <a name/id> anchors are included. An unreadable file
+    yields an empty document.
+
+    Args:
+        path: Markdown file to scan
+    """
+    doc = MarkdownDoc()
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return doc
+
+    counts: Dict[str, int] = {}
+    fence = None
+    for lineno, line in enumerate(lines, 1):
+        match = _FENCE_RE.match(line)
+        if fence is not None:
+            if match and match.group(1)[0] == fence[0] and len(match.group(1)) >= len(fence) and not line.strip(' `~'):
+                fence = None
+            continue
+        if match:
+            fence = match.group(1)
+            continue
+
+        heading = _HEADING_RE.match(line)
+        if heading:
+            slug = github_slug(heading.group(1))
+            count = counts.get(slug, 0)
+            counts[slug] = count + 1
+            doc.anchors.add(f"{slug}-{count}" if count else slug)
+        doc.anchors.update(_HTML_ANCHOR_RE.findall(line))
+
+        text = _CODE_SPAN_RE.sub('', line)
+        reference = _REFERENCE_DEF_RE.match(text)
+        if reference:
+            doc.links.append((lineno, reference.group(1).strip('<>')))
+            continue
+        doc.links.extend((lineno, m.group(1).strip('<>')) for m in _INLINE_LINK_RE.finditer(text))
+    return doc
+
+
+@dataclass
+class SkillDocs:
+    """Result of scanning one skill directory for the link checker."""
+
+    # Normalized path -> 'file' or 'dir', for everything below the skill
+    kinds: Dict[str, str] = field(default_factory=dict)
+    # Normalized path -> parsed Markdown file
+    docs: Dict[str, MarkdownDoc] = field(default_factory=dict)
+    # Directories listed by the walk
+    scanned: List[str] = field(default_factory=list)
+    syscalls: int = 0
+
+
+def scan_skill_docs(skill_dir: Path) -> SkillDocs:
+    """
+    Index a skill directory: every file and directory, and every Markdown file's anchors and links.
+
+    One scandir walk; hidden entries are skipped and symlinked directories
+    are not followed. Safe to run in worker threads.
+
+    Args:
+        skill_dir: Skill directory to scan
+    """
+    result = SkillDocs()
+    root = os.path.normpath(skill_dir)
+    result.kinds[root] = 'dir'
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        result.scanned.append(directory)
+        result.syscalls += 1
+        try:
+            with os.scandir(directory) as entries:
+                children = list(entries)
+        except OSError:
+            continue
+        for entry in children:
+            if entry.name.startswith('.'):
+                continue
+            try:
+                if entry.is_dir():
+                    result.kinds[entry.path] = 'dir'
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+                elif entry.is_file():
+                    result.kinds[entry.path] = 'file'
+                    if entry.name.lower().endswith('.md'):
+                        result.syscalls += 1
+                        result.docs[entry.path] = scan_markdown(Path(entry.path))
+            except OSError:
+                continue
+    return result
+
+
+# Characters that can continue a JSON number
+_NUMBER_TAIL_RE = re.compile(r'[0-9+\-.eE]*')
+
+
+class MarketplaceStreamReader:
+    """
+    Incrementally decode the top level of a marketplace.json file.
+
+    The file is read in chunks and decoded with JSONDecoder.raw_decode, one
+    top-level value at a time, except that a top-level "plugins" array is
+    decoded one element at a time. The reader's own memory use is bounded by
+    the largest single value rather than by the whole document. A validator
+    consuming it still keeps the cross-plugin indexes (names and referenced
+    paths seen so far), which grow linearly with the number of plugins.
+
+    Iterating yields (key, index, value) tuples:
+        - (key, None, value) for an ordinary top-level field
+        - ("plugins", None, []) when the "plugins" array starts
+        - ("plugins", i, element) for each array element
+
+    Syntax errors raise json.JSONDecodeError with line, column and
+    character positions relative to the whole file.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, f: Any, chunk_size: int = CHUNK_SIZE):
+        """
+        Initialize reader.
+
+        Args:
+            f: Text file object to read from
+            chunk_size: Minimum number of characters per read
+        """
+        self._file = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+        # Position bookkeeping for the text already discarded from _buf
+        self._offset = 0
+        self._lines = 0
+        self._column = 0
+
+    def __iter__(self) -> Iterator[Tuple[str, Optional[int], Any]]:
+        if self._peek() != '{':
+            # Not an object: decode it (to report syntax errors) and yield nothing
+            self._value()
+        else:
+            self._pos += 1
+            if self._peek() == '}':
+                self._pos += 1
+            else:
+                yield from self._members()
+
+        if self._peek():
+            raise self._error("Extra data", self._pos)
+
+    def _members(self) -> Iterator[Tuple[str, Optional[int], Any]]:
+        """Decode the members of the root object up to and including its closing brace."""
+        while True:
+            if self._peek() != '"':
+                raise self._error("Expecting property name enclosed in double quotes", self._pos)
+            key = self._value()
+            self._expect(':', "Expecting ':' delimiter")
+
+            if key == 'plugins' and self._peek() == '[':
+                yield key, None, []
+                self._pos += 1
+                if self._peek() == ']':
+                    self._pos += 1
+                else:
+                    idx = 0
+                    while True:
+                        yield key, idx, self._value()
+                        if self._expect(',]', "Expecting ',' delimiter") == ']':
+                            break
+                        idx += 1
+            else:
+                yield key, None, self._value()
+
+            if self._expect(',}', "Expecting ',' delimiter") == '}':
+                return
+
+    def _fill(self) -> bool:
+        """
+        Discard consumed text and read more from the file.
+
+        Returns:
+            False at end of file
+        """
+        if self._eof:
+            return False
+
+        # Read at least as much as is buffered, so a value spanning many
+        # chunks is re-scanned a logarithmic number of times
+        chunk = self._file.read(max(self._chunk_size, len(self._buf) - self._pos))
+        if not chunk:
+            # Keep the buffer as it is so that error positions stay valid
+            self._eof = True
+            return False
+
+        consumed = self._buf[:self._pos]
+        if consumed:
+            newlines = consumed.count('\n')
+            if newlines:
+                self._lines += newlines
+                self._column = len(consumed) - consumed.rfind('\n') - 1
+            else:
+                self._column += len(consumed)
+            self._offset += self._pos
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        self._buf += chunk
+        return True
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of file)."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in ' \t\n\r':
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ''
+
+    def _expect(self, chars: str, message: str) -> str:
+        """Consume and return the next non-whitespace character, which must be one of chars."""
+        c = self._peek()
+        if not c or c not in chars:
+            raise self._error(message, self._pos)
+        self._pos += 1
+        return c
+
+    def _value(self) -> Any:
+        """Decode the next JSON value, reading more of the file as needed."""
+        while True:
+            if not self._peek():
+                raise self._error("Expecting value", self._pos)
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as e:
+                if self._fill():
+                    continue
+                raise self._error(e.msg, e.pos)
+            # A number cut off by the buffer end (e.g. '1' of '1e5', or '1.5'
+            # of '1.5e' followed by nothing) still decodes, so read on if only
+            # number characters follow it (matched in place, without copying)
+            if (
+                isinstance(value, (int, float))
+                and _NUMBER_TAIL_RE.fullmatch(self._buf, end)
+                and self._fill()
+            ):
+                continue
+            self._pos = end
+            return value
+
+    def _error(self, message: str, pos: int) -> json.JSONDecodeError:
+        """Build a JSONDecodeError for a position in the current buffer."""
+        before = self._buf[:pos]
+        newlines = before.count('\n')
+        error = json.JSONDecodeError(message, self._buf, pos)
+        error.pos = self._offset + pos
+        error.lineno = self._lines + newlines + 1
+        error.colno = pos - before.rfind('\n') if newlines else self._column + pos + 1
+        error.args = (f"{message}: line {error.lineno} column {error.colno} (char {error.pos})",)
+        return error
+
+
+@dataclass
+class Finding:
+    """A single validation error or warning."""
+
+    severity: str  # 'error' or 'warning'
+    code: str
+    message: str
+    plugin: Optional[str] = None
+    field: Optional[str] = None
+    path: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the finding as a JSON-serializable dict."""
+        return asdict(self)
+
+
+class ResultCache:
+    """
+    Opt-in on-disk cache of validation results, stored next to marketplace.json.
+
+    There is one entry per set of validator options. An entry holds the
+    SHA-256 of marketplace.json, the findings, and the (path, mode, size,
+    mtime) fingerprint of every filesystem input the run depended on: the
+    referenced agent, skill (and SKILL.md) and MCP server paths, plus the
+    directories listed for the orphan check and the repository index. A
+    lookup re-stats those inputs and returns the cached findings only if the
+    hash and every fingerprint still match.
+    """
+
+    FILE_NAME = ".validation-cache.json"
+    VERSION = 1
+
+    def __init__(self, marketplace_path: Path, stat_cache: StatCache):
+        """
+        Initialize cache.
+
+        Args:
+            marketplace_path: Path to the marketplace.json file
+            stat_cache: Stat cache used to fingerprint inputs
+        """
+        self.path = marketplace_path.parent / self.FILE_NAME
+        self.repo_root = marketplace_path.parent.parent
+        self.stat_cache = stat_cache
+
+    def lookup(self, options: str, digest: str) -> Optional[List[Finding]]:
+        """
+        Return the cached findings if nothing they depend on has changed.
+
+        Args:
+            options: Serialized validator options
+            digest: SHA-256 of the marketplace.json contents
+
+        Returns:
+            The cached findings, or None on a miss
+        """
+        entry = self._load().get(options)
+        try:
+            if entry["sha256"] != digest:
+                return None
+            for rel_path, state in entry["inputs"]:
+                if self._fingerprint(self.repo_root / rel_path) != state:
+                    return None
+            return [Finding(**finding) for finding in entry["findings"]]
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def store(self, options: str, digest: str, inputs: Iterable[Path], findings: List[Finding]) -> None:
+        """
+        Store the findings of a run together with the fingerprints of its inputs.
+
+        The cache is best effort: if it cannot be written, nothing happens.
+
+        Args:
+            options: Serialized validator options
+            digest: SHA-256 of the marketplace.json contents
+            inputs: Filesystem paths the run depended on
+            findings: Findings of the run
+        """
+        entries = self._load()
+        root = os.path.normpath(self.repo_root)
+        fingerprints = {
+            os.path.relpath(os.path.normpath(path), root).replace(os.sep, '/'): self._fingerprint(path)
+            for path in inputs
+        }
+        entries[options] = {
+            "sha256": digest,
+            "inputs": sorted(fingerprints.items()),
+            "findings": [finding.to_dict() for finding in findings],
+        }
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            tmp_path.write_text(json.dumps({"version": self.VERSION, "entries": entries}, ensure_ascii=False))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+    def _load(self) -> Dict[str, Any]:
+        """Read the cache file (an unreadable or outdated file counts as empty)."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != self.VERSION or not isinstance(data.get("entries"), dict):
+            return {}
+        return data["entries"]
+
+    def _fingerprint(self, path: Path) -> Optional[List[int]]:
+        """Return [mode, size, mtime_ns] of a path, or None if it does not exist."""
+        st = self.stat_cache.stat(path)
+        return [st.st_mode, st.st_size, st.st_mtime_ns] if st is not None else None
+
+
+class ValidationProfiler:
+    """
+    Collects wall time and filesystem syscall counts from a validator run.
+
+    Timings are recorded per check type ('load', 'structure', 'index',
+    'plugin', 'agents', 'skills', 'mcpServers', 'frontmatter', 'orphans',
+    'links') and per
+    plugin. Check types nest: 'plugin' includes 'agents', 'skills' and
+    'mcpServers', and 'skills'/'agents' include 'frontmatter'.
+    """
+
+    def __init__(self):
+        # check -> [calls, seconds, syscalls]
+        self.checks: Dict[str, List[float]] = {}
+        # plugin -> [seconds, syscalls]
+        self.plugins: Dict[str, List[float]] = {}
+
+    def record(self, check: str, plugin: Optional[str], seconds: float, syscalls: int) -> None:
+        """
+        Record one timed check.
+
+        Args:
+            check: Check type
+            plugin: Plugin label for the 'plugin' check, else None
+            seconds: Wall time spent
+            syscalls: Filesystem syscalls issued
+        """
+        totals = self.checks.setdefault(check, [0, 0.0, 0])
+        totals[0] += 1
+        totals[1] += seconds
+        totals[2] += syscalls
+        if check == 'plugin' and plugin is not None:
+            plugin_totals = self.plugins.setdefault(plugin, [0.0, 0])
+            plugin_totals[0] += seconds
+            plugin_totals[1] += syscalls
+
+    def print_report(self, top: int = 10, stream: Any = None) -> None:
+        """
+        Print per-check totals and the slowest plugins.
+
+        Args:
+            top: Number of plugins to list
+            stream: Output stream (default: stdout)
+        """
+        stream = stream if stream is not None else sys.stdout
+        print("=" * 70, file=stream)
+        print("Validation Profile", file=stream)
+        print("=" * 70, file=stream)
+        print(f"{'Check':<14}{'Calls':>8}{'Total ms':>12}{'Avg ms':>10}{'Syscalls':>11}", file=stream)
+        for check, (calls, seconds, syscalls) in sorted(self.checks.items(), key=lambda item: -item[1][1]):
+            print(
+                f"{check:<14}{calls:>8}{seconds * 1000:>12.2f}{seconds * 1000 / calls:>10.3f}{syscalls:>11}",
+                file=stream,
+            )
+
+        if self.plugins:
+            slowest = sorted(self.plugins.items(), key=lambda item: -item[1][0])[:top]
+            print(file=stream)
+            print(f"Slowest {len(slowest)} of {len(self.plugins)} plugin(s):", file=stream)
+            print(f"{'Plugin':<40}{'ms':>10}{'Syscalls':>11}", file=stream)
+            for plugin, (seconds, syscalls) in slowest:
+                print(f"{plugin[:39]:<40}{seconds * 1000:>10.3f}{syscalls:>11}", file=stream)
 
 
 class MarketplaceValidator:
     """Validator for marketplace.json files."""
 
-    def __init__(self, marketplace_path: Path):
+    # Number of path references above which the repository index is used
+    INDEX_THRESHOLD = 200
+
+    def __init__(
+        self,
+        marketplace_path: Path,
+        stat_cache: Optional[StatCache] = None,
+        use_index: Optional[bool] = None,
+        deep: bool = False,
+        profiler: Optional[ValidationProfiler] = None,
+        stream: bool = False,
+        cache: bool = False,
+        check_links: bool = False,
+    ):
+        """
+        Initialize validator.
+
+        Args:
+            marketplace_path: Path to the marketplace.json file
+            stat_cache: Shared stat cache (a private one is created if omitted)
+            use_index: Resolve paths from a pre-built repository index.
+                None enables it automatically when the marketplace has more
+                than INDEX_THRESHOLD path references.
+            deep: Also validate the frontmatter of referenced SKILL.md and
+                agent files
+            profiler: Receives per-check and per-plugin timings, if given
+            stream: Decode the plugins array one element at a time and
+                validate each plugin as soon as it is decoded, instead of
+                loading the whole document first. Top-level structure
+                findings are then reported after the plugin findings, and
+                use_index=None never builds the index.
+            cache: Reuse the findings stored by an earlier run in
+                .claude-plugin/.validation-cache.json when marketplace.json
+                and every input they depend on are unchanged (see
+                ResultCache), and store them after a fresh run
+            check_links: Also check the links in every Markdown file under
+                the referenced skill directories: relative links must point
+                at existing files, and '#anchor' fragments into Markdown
+                files at existing headings
+        """
+        self.marketplace_path = marketplace_path
+        self.repo_root = marketplace_path.parent.parent
+        self.stat_cache = stat_cache if stat_cache is not None else StatCache()
+        self.use_index = use_index
+        self.deep = deep
+        self.profiler = profiler
+        self.stream = stream
+        self.index: Optional[RepoIndex] = None
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+        # Structured findings not yet handed out by iter_findings()
+        self._pending: List[Finding] = []
+        self._streaming = False
+        # Cross-plugin indexes: plugin name -> first index, and normalized
+        # skill/agent path -> name of the first plugin listing it
+        self._plugin_names: Dict[str, int] = {}
+        self._path_owners: Dict[str, Dict[str, str]] = {"skills": {}, "agents": {}}
+        self.check_links = check_links
+        self.cache = ResultCache(marketplace_path, self.stat_cache) if cache else None
+        # Whether the last run was answered from the result cache
+        self.cache_hit = False
+        # Filesystem inputs of the current run (collected only when caching)
+        self._inputs: Optional[Set[Path]] = None
+
+    def validate(self) -> Tuple[bool, List[str], List[str]]:
+        """
+        Run all validations.
+
+        Returns:
+            Tuple of (success, errors, warnings)
+        """
+        if self.cache is not None:
+            for finding in self._cached_findings():
+                (self.errors if finding.severity == 'error' else self.warnings).append(finding.message)
+        else:
+            for _ in self._run():
+                pass
+
+        return len(self.errors) == 0, self.errors, self.warnings
+
+    def iter_findings(self) -> Iterator[Finding]:
+        """
+        Run all validations, yielding structured findings as they are produced.
+
+        Findings for the top-level structure come first, followed by the
+        findings of each plugin as soon as that plugin has been checked.
+        Nothing is accumulated in self.errors / self.warnings, so memory use
+        does not grow with the number of findings.
+
+        Yields:
+            Finding objects
+        """
+        if self.cache is not None:
+            yield from self._cached_findings()
+            return
+        yield from self._iter_findings()
+
+    def _iter_findings(self) -> Iterator[Finding]:
+        """Run all validations, yielding structured findings (see iter_findings)."""
+        self._streaming = True
+        try:
+            for _ in self._run():
+                yield from self._flush()
+        finally:
+            self._streaming = False
+            self._pending = []
+
+    def _cached_findings(self) -> List[Finding]:
+        """
+        Return the findings from the result cache, validating on a miss.
+
+        After a fresh run the findings are stored with the fingerprints of
+        the inputs the run depended on, unless marketplace.json changed
+        while it was being validated.
+        """
+        self.stat_cache.syscalls += 1
+        try:
+            digest = hashlib.sha256(self.marketplace_path.read_bytes()).hexdigest()
+        except OSError:
+            return list(self._iter_findings())
+
+        options = json.dumps({
+            "deep": self.deep,
+            "use_index": self.use_index,
+            "stream": self.stream,
+            "check_links": self.check_links,
+            "validator": _validator_digest(),
+        }, sort_keys=True)
+        findings = self.cache.lookup(options, digest)
+        if findings is not None:
+            self.cache_hit = True
+            return findings
+
+        self._inputs = set()
+        try:
+            findings = list(self._iter_findings())
+            if self.index is not None:
+                self._inputs.update(self.repo_root / rel for rel in self.index.roots)
+                self._inputs.update(self.repo_root / rel for rel in self.index.scanned)
+            try:
+                unchanged = hashlib.sha256(self.marketplace_path.read_bytes()).hexdigest() == digest
+            except OSError:
+                unchanged = False
+            if unchanged:
+                self.cache.store(options, digest, self._inputs, findings)
+        finally:
+            self._inputs = None
+        return findings
+
+    def _run(self) -> Iterator[None]:
+        """Run all checks, yielding after each step so that findings can be handed out."""
+        if self.stream:
+            yield from self._run_streaming()
+            return
+
+        # Load and parse JSON
+        with self._timed('load'):
+            loaded = self._load()
+        yield
+        if not loaded:
+            return
+
+        # Run validation checks
+        with self._timed('structure'):
+            self._validate_structure()
+        yield
+        with self._timed('index'):
+            self._build_index()
+
+        if "plugins" not in self.data or not isinstance(self.data["plugins"], list):
+            return
+        for idx, plugin in enumerate(self.data["plugins"]):
+            self._validate_plugin_timed(plugin, idx)
+            yield
+
+        with self._timed('orphans'):
+            self._validate_orphans()
+        yield
+        if self.check_links:
+            with self._timed('links'):
+                self._validate_links()
+            yield
+
+    def _run_streaming(self) -> Iterator[None]:
+        """
+        Validate plugins while decoding, then the top-level structure.
+
+        Each plugin entry is dropped once checked, but its name and paths stay
+        in the cross-plugin indexes, so memory grows linearly (and slowly)
+        with the number of plugins.
+        """
+        self.data = {}
+        self.stat_cache.syscalls += 1
+        try:
+            f = open(self.marketplace_path, 'r', encoding='utf-8')
+        except FileNotFoundError:
+            self._error("file-not-found", f"File not found: {self.marketplace_path}", path=str(self.marketplace_path))
+            yield
+            return
+        except OSError as e:
+            self._unreadable(e)
+            yield
+            return
+
+        with f:
+            items = iter(MarketplaceStreamReader(f))
+            while True:
+                try:
+                    with self._timed('load'):
+                        key, idx, value = next(items, (None, None, None))
+                except json.JSONDecodeError as e:
+                    self._error("invalid-json", f"Invalid JSON syntax: {e}")
+                    yield
+                    return
+                except (OSError, UnicodeDecodeError) as e:
+                    self._unreadable(e)
+                    yield
+                    return
+                if key is None:
+                    break
+                if idx is None:
+                    self.data[key] = value
+                    continue
+
+                if self.use_index:
+                    with self._timed('index'):
+                        self._extend_index(value)
+                self._validate_plugin_timed(value, idx)
+                yield
+
+        with self._timed('structure'):
+            self._validate_structure()
+        yield
+        if isinstance(self.data.get("plugins"), list):
+            with self._timed('orphans'):
+                self._validate_orphans()
+            yield
+        if self.check_links:
+            with self._timed('links'):
+                self._validate_links()
+            yield
+
+    @contextmanager
+    def _timed(self, check: str, plugin: Optional[str] = None) -> Iterator[None]:
+        """Report the wall time and syscalls of the enclosed block to the profiler, if any."""
+        if self.profiler is None:
+            yield
+            return
+        start = time.perf_counter()
+        syscalls = self.stat_cache.syscalls
+        try:
+            yield
+        finally:
+            self.profiler.record(check, plugin, time.perf_counter() - start, self.stat_cache.syscalls - syscalls)
+
+    def _flush(self) -> List[Finding]:
+        """Hand out and forget the pending findings."""
+        pending, self._pending = self._pending, []
+        return pending
+
+    def _error(self, code: str, message: str, **context: Optional[str]) -> None:
+        """Record an error (see _add)."""
+        self._add('error', code, message, **context)
+
+    def _warning(self, code: str, message: str, **context: Optional[str]) -> None:
+        """Record a warning (see _add)."""
+        self._add('warning', code, message, **context)
+
+    def _add(
+        self,
+        severity: str,
+        code: str,
+        message: str,
+        plugin: Optional[str] = None,
+        field: Optional[str] = None,
+        path: Optional[str] = None,
+    ) -> None:
+        """
+        Record a finding.
+
+        Args:
+            severity: 'error' or 'warning'
+            code: Stable machine-readable identifier (e.g. 'path-not-found')
+            message: Human-readable message, as shown in the text report
+            plugin: Name of the plugin the finding belongs to
+            field: Marketplace or frontmatter field concerned
+            path: Referenced path concerned
+        """
+        if self._streaming:
+            self._pending.append(Finding(severity, code, message, plugin, field, path))
+        elif severity == 'error':
+            self.errors.append(message)
+        else:
+            self.warnings.append(message)
+
+    def _load(self) -> bool:
+        """
+        Load and parse the marketplace file into self.data.
+
+        Returns:
+            True if the file was parsed successfully
+        """
+        self.stat_cache.syscalls += 1
+        try:
+            with open(self.marketplace_path, 'r', encoding='utf-8') as f:
+                self.data = json.load(f)
+        except json.JSONDecodeError as e:
+            self._error("invalid-json", f"Invalid JSON syntax: {e}")
+            return False
+        except FileNotFoundError:
+            self._error("file-not-found", f"File not found: {self.marketplace_path}", path=str(self.marketplace_path))
+            return False
+        except (OSError, UnicodeDecodeError) as e:
+            self._unreadable(e)
+            return False
+        return True
+
+    def _unreadable(self, e: Exception) -> None:
+        """Record a marketplace file that exists but cannot be read (a directory, no permission, not UTF-8)."""
+        reason = e.strerror if isinstance(e, OSError) and e.strerror else str(e)
+        self._error(
+            "file-unreadable", f"Cannot read {self.marketplace_path}: {reason}", path=str(self.marketplace_path)
+        )
+
+    def _validate_structure(self) -> None:
+        """Validate top-level structure."""
+        # Required fields
+        if "name" not in self.data:
+            self._error("missing-field", "Missing required field: 'name'", field="name")
+        elif not self._is_kebab_case(self.data["name"]):
+            self._error(
+                "not-kebab-case", f"Marketplace name '{self.data['name']}' should be in kebab-case", field="name"
+            )
+
+        if "owner" not in self.data:
+            self._error("missing-field", "Missing required field: 'owner'", field="owner")
+        else:
+            owner = self.data["owner"]
+            if not isinstance(owner, dict):
+                self._error("invalid-type", "Field 'owner' should be an object", field="owner")
+            else:
+                if "name" not in owner:
+                    self._error("missing-field", "Missing required field: 'owner.name'", field="owner.name")
+                if "email" not in owner:
+                    self._warning("missing-field", "Missing recommended field: 'owner.email'", field="owner.email")
+
+        if "plugins" not in self.data:
+            self._error("missing-field", "Missing required field: 'plugins'", field="plugins")
+        elif not isinstance(self.data["plugins"], list):
+            self._error("invalid-type", "Field 'plugins' should be an array", field="plugins")
+
+    def _referenced_paths(self) -> List[str]:
+        """Collect every agent, skill and MCP server path string in the marketplace."""
+        paths = []
+        plugins = self.data.get("plugins") if isinstance(self.data, dict) else None
+        if not isinstance(plugins, list):
+            return paths
+
+        for plugin in plugins:
+            paths.extend(self._plugin_paths(plugin))
+        return paths
+
+    @staticmethod
+    def _plugin_paths(plugin: Any) -> List[str]:
+        """Collect the agent, skill and MCP server path strings of one plugin."""
+        paths = []
+        if not isinstance(plugin, dict):
+            return paths
+        for field in ("agents", "skills"):
+            value = plugin.get(field)
+            if isinstance(value, list):
+                paths.extend(p for p in value if isinstance(p, str))
+        if isinstance(plugin.get("mcpServers"), str):
+            paths.append(plugin["mcpServers"])
+        return paths
+
+    @staticmethod
+    def _path_roots(paths: Iterable[str]) -> Set[str]:
+        """Return the top-level entries (first path components) of referenced paths."""
+        return {p.lstrip('./').split('/')[0] for p in paths if p.lstrip('./')}
+
+    def _build_index(self, previous: Optional[RepoIndex] = None) -> None:
+        """
+        Build the repository index if enabled (or if there are enough references).
+
+        Args:
+            previous: Index from an earlier run over the same repository; it
+                is reused (and extended with new roots) unless one of its
+                directories gained or lost entries since
+        """
+        if self.use_index is False:
+            return
+
+        paths = self._referenced_paths()
+        if self.use_index is None and len(paths) <= self.INDEX_THRESHOLD:
+            return
+
+        roots = self._path_roots(paths)
+        if previous is not None and previous.repo_root == self.repo_root and not previous.changed(self.stat_cache):
+            previous.fallback = self.stat_cache
+            previous.add_roots(roots)
+            self.index = previous
+        else:
+            self.index = RepoIndex(self.repo_root, roots, self.stat_cache)
+
+    def _extend_index(self, plugin: Any) -> None:
+        """Index the top-level entries referenced by one plugin (streaming mode)."""
+        roots = self._path_roots(self._plugin_paths(plugin))
+        if self.index is None:
+            self.index = RepoIndex(self.repo_root, roots, self.stat_cache)
+        else:
+            self.index.add_roots(roots)
+
+    def _path_kind(self, full_path: Path) -> Optional[str]:
+        """Classify a referenced path via the index when available, else the stat cache."""
+        if self.index is not None:
+            return self.index.kind(full_path)
+        return self.stat_cache.kind(full_path)
+
+    def _did_you_mean(self, full_path: Path, kind: str) -> str:
+        """Return a 'Did you mean' hint for a missing path (index mode only)."""
+        if self.index is None:
+            return ""
+        match = self.index.suggest(full_path, kind)
+        return f"\n  Did you mean: ./{match}" if match else ""
+
+    def _validate_plugin_timed(self, plugin: Any, idx: int) -> None:
+        """Validate a single plugin entry and its cross-plugin uniqueness, timing it as a 'plugin' check."""
+        if self._inputs is not None:
+            self._inputs.update(self._plugin_inputs(plugin))
+        if self.profiler is None:
+            self._validate_plugin(plugin, idx)
+            self._index_plugin(plugin, idx)
+            return
+        label = plugin.get("name") if isinstance(plugin, dict) else None
+        with self._timed('plugin', label if isinstance(label, str) else f"[{idx}]"):
+            self._validate_plugin(plugin, idx)
+            self._index_plugin(plugin, idx)
+
+    @staticmethod
+    def _normalize_path(path: str) -> str:
+        """Normalize a referenced path for comparison (same resolution as the path checks)."""
+        return os.path.normpath(path.lstrip('./')).replace(os.sep, '/')
+
+    def _index_plugin(self, plugin: Any, idx: int) -> None:
+        """
+        Add a plugin to the cross-plugin indexes, reporting duplicates.
+
+        Each lookup is a dict access, so checking n plugins is O(n) overall.
+
+        Args:
+            plugin: Plugin object
+            idx: Index in plugins array
+        """
+        if not isinstance(plugin, dict) or not isinstance(plugin.get("name"), str):
+            return
+
+        plugin_name = plugin["name"]
+        prefix = f"Plugin '{plugin_name}'"
+        first = self._plugin_names.setdefault(plugin_name, idx)
+        if first != idx:
+            self._error(
+                "duplicate-plugin-name", f"{prefix}: Duplicate plugin name (also used by plugin [{first}])",
+                plugin=plugin_name, field="name",
+            )
+
+        for field, label in (("skills", "Skill"), ("agents", "Agent")):
+            paths = plugin.get(field)
+            if not isinstance(paths, list):
+                continue
+            owners = self._path_owners[field]
+            seen: Set[str] = set()
+            for path in paths:
+                if not isinstance(path, str) or not path.lstrip('./'):
+                    continue
+                normalized = self._normalize_path(path)
+                if normalized in seen:
+                    self._warning(
+                        f"duplicate-{field[:-1]}", f"{prefix}: {label} '{path}' is listed more than once",
+                        plugin=plugin_name, field=field, path=path,
+                    )
+                    continue
+                seen.add(normalized)
+                owner = owners.setdefault(normalized, plugin_name)
+                if owner != plugin_name:
+                    self._warning(
+                        f"duplicate-{field[:-1]}", f"{prefix}: {label} '{path}' is also listed by plugin '{owner}'",
+                        plugin=plugin_name, field=field, path=path,
+                    )
+
+    def _validate_orphans(self) -> None:
+        """Report skill directories under skills/ that no plugin references."""
+        skills_root = self.repo_root / "skills"
+        if self._inputs is not None:
+            self._inputs.add(skills_root)
+        if self.stat_cache.kind(skills_root) != 'dir':
+            return
+
+        referenced = self._path_owners["skills"]
+        for skill_dir in sorted(self._scan_skill_dirs(skills_root)):
+            if skill_dir not in referenced:
+                self._warning(
+                    "orphan-skill", f"Skill directory not referenced by any plugin: ./{skill_dir}",
+                    field="skills", path=f"./{skill_dir}",
+                )
+
+    def _scan_skill_dirs(self, skills_root: Path) -> Set[str]:
+        """
+        Find skill directories (directories containing SKILL.md) with one scandir walk.
+
+        The walk does not descend into a skill directory, into hidden
+        directories, or through symlinked directories.
+
+        Returns:
+            Repository-relative POSIX paths of the skill directories
         """
-        Initialize validator.
+        found = set()
+        stack = ["skills"]
+        while stack:
+            rel_dir = stack.pop()
+            if self._inputs is not None:
+                self._inputs.add(self.repo_root / rel_dir)
+            self.stat_cache.syscalls += 1
+            try:
+                with os.scandir(self.repo_root / rel_dir) as entries:
+                    subdirs = []
+                    is_skill = False
+                    for entry in entries:
+                        if entry.name == "SKILL.md":
+                            is_skill = True
+                        elif not entry.name.startswith('.') and entry.is_dir(follow_symlinks=False):
+                            subdirs.append(f"{rel_dir}/{entry.name}")
+            except OSError:
+                continue
+            if is_skill and rel_dir != "skills":
+                found.add(rel_dir)
+            else:
+                stack.extend(subdirs)
+        return found
+
+    def _validate_links(self) -> None:
+        """
+        Check the links in the Markdown files of every referenced skill.
+
+        Each skill directory is scanned once, in parallel across skills, into
+        a global index of files, directories and heading anchors; all links
+        are then resolved against that index. Targets outside the scanned
+        skills fall back to the stat cache (and are parsed at most once when
+        an anchor into them is checked). External URLs are not checked.
+        """
+        owners = self._path_owners["skills"]
+        skills = sorted(s for s in owners if self.stat_cache.kind(self.repo_root / s) == 'dir')
+        if not skills:
+            return
+
+        if len(skills) == 1:
+            scans = [scan_skill_docs(self.repo_root / skills[0])]
+        else:
+            # Imported here: only needed for link checking
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(32, len(skills), (os.cpu_count() or 1) + 4)) as pool:
+                scans = list(pool.map(scan_skill_docs, [self.repo_root / s for s in skills]))
+
+        kinds: Dict[str, str] = {}
+        docs: Dict[str, MarkdownDoc] = {}
+        for scan in scans:
+            kinds.update(scan.kinds)
+            docs.update(scan.docs)
+            self.stat_cache.syscalls += scan.syscalls
+            if self._inputs is not None:
+                self._inputs.update(Path(p) for p in scan.scanned)
+                self._inputs.update(Path(p) for p in scan.docs)
+        roots = {os.path.normpath(self.repo_root / s) for s in skills}
+
+        for skill, scan in zip(skills, scans):
+            prefix = f"Plugin '{owners[skill]}'"
+            for doc_path in sorted(scan.docs):
+                display = os.path.relpath(doc_path, self.repo_root).replace(os.sep, '/')
+                for lineno, target in scan.docs[doc_path].links:
+                    problem = self._check_link(doc_path, target, kinds, docs, roots)
+                    if problem is None:
+                        continue
+                    code, reason = problem
+                    add = self._error if code == "broken-link" else self._warning
+                    add(
+                        code, f"{prefix}: {display}:{lineno}: Broken link '{target}' ({reason})",
+                        plugin=owners[skill], field="skills", path=display,
+                    )
+
+    def _check_link(
+        self,
+        doc_path: str,
+        target: str,
+        kinds: Dict[str, str],
+        docs: Dict[str, MarkdownDoc],
+        roots: Set[str],
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Resolve one link target against the link index.
 
         Args:
-            marketplace_path: Path to the marketplace.json file
+            doc_path: Normalized path of the Markdown file containing the link
+            target: Link target as written
+            kinds: Index of scanned files and directories
+            docs: Index of scanned Markdown files (extended with files parsed on demand)
+            roots: Normalized paths of the scanned skill directories
+
+        Returns:
+            None if the link resolves, else (finding code, reason)
         """
-        self.marketplace_path = marketplace_path
-        self.repo_root = marketplace_path.parent.parent
-        self.errors: List[str] = []
-        self.warnings: List[str] = []
+        if not target or target.startswith('//') or _URL_SCHEME_RE.match(target):
+            return None
+        path_part, _, anchor = target.partition('#')
+        path_part = urllib.parse.unquote(path_part.split('?', 1)[0])
 
-    def validate(self) -> Tuple[bool, List[str], List[str]]:
+        if not path_part:
+            resolved = doc_path
+        elif path_part.startswith('/'):
+            # GitHub resolves root-relative links against the repository root
+            resolved = os.path.normpath(self.repo_root / path_part.lstrip('/'))
+        else:
+            resolved = os.path.normpath(os.path.join(os.path.dirname(doc_path), path_part))
+
+        kind = kinds.get(resolved)
+        if kind is None and not self._under(resolved, roots):
+            if self._inputs is not None:
+                self._inputs.add(Path(resolved))
+            kind = self.stat_cache.kind(Path(resolved))
+        if kind is None:
+            return "broken-link", "no such file or directory"
+
+        if not anchor or kind != 'file' or not resolved.lower().endswith('.md'):
+            return None
+        doc = docs.get(resolved)
+        if doc is None:
+            self.stat_cache.syscalls += 1
+            doc = docs[resolved] = scan_markdown(Path(resolved))
+        anchor = urllib.parse.unquote(anchor)
+        if anchor in doc.anchors or anchor.lower() in doc.anchors:
+            return None
+        where = "this file" if resolved == doc_path else os.path.basename(resolved)
+        return "broken-anchor", f"no heading for '#{anchor}' in {where}"
+
+    @staticmethod
+    def _under(path: str, roots: Set[str]) -> bool:
+        """Return True if path is one of roots or lies below one of them."""
+        while True:
+            if path in roots:
+                return True
+            parent = os.path.dirname(path)
+            if parent == path:
+                return False
+            path = parent
+
+    def _validate_plugin_isolated(self, plugin: Dict[str, Any], idx: int) -> Tuple[List[str], List[str]]:
         """
-        Run all validations.
+        Validate a single plugin entry and return its findings separately.
+
+        Args:
+            plugin: Plugin object
+            idx: Index in plugins array
 
         Returns:
-            Tuple of (success, errors, warnings)
+            Tuple of (errors, warnings) produced by this plugin only
         """
-        # Load and parse JSON
+        saved = self.errors, self.warnings
+        self.errors, self.warnings = [], []
         try:
-            with open(self.marketplace_path, 'r', encoding='utf-8') as f:
-                self.data = json.load(f)
-        except json.JSONDecodeError as e:
-            self.errors.append(f"Invalid JSON syntax: {e}")
-            return False, self.errors, self.warnings
-        except FileNotFoundError:
-            self.errors.append(f"File not found: {self.marketplace_path}")
-            return False, self.errors, self.warnings
+            self._validate_plugin(plugin, idx)
+            return self.errors, self.warnings
+        finally:
+            self.errors, self.warnings = saved
 
-        # Run validation checks
-        self._validate_structure()
-        self._validate_plugins()
+    def _plugin_inputs(self, plugin: Any) -> List[Path]:
+        """
+        List the filesystem paths a plugin's checks depend on.
 
-        return len(self.errors) == 0, self.errors, self.warnings
+        Args:
+            plugin: Plugin object
 
-    def _validate_structure(self) -> None:
-        """Validate top-level structure."""
-        # Required fields
-        if "name" not in self.data:
-            self.errors.append("Missing required field: 'name'")
-        elif not self._is_kebab_case(self.data["name"]):
-            self.errors.append(f"Marketplace name '{self.data['name']}' should be in kebab-case")
+        Returns:
+            Full paths of every referenced agent, skill (and its SKILL.md)
+            and MCP server file
+        """
+        if not isinstance(plugin, dict):
+            return []
 
-        if "owner" not in self.data:
-            self.errors.append("Missing required field: 'owner'")
-        else:
-            owner = self.data["owner"]
-            if not isinstance(owner, dict):
-                self.errors.append("Field 'owner' should be an object")
-            else:
-                if "name" not in owner:
-                    self.errors.append("Missing required field: 'owner.name'")
-                if "email" not in owner:
-                    self.warnings.append("Missing recommended field: 'owner.email'")
+        inputs = []
+        for field in ("agents", "mcpServers"):
+            value = plugin.get(field)
+            values = value if isinstance(value, list) else [value]
+            inputs.extend(self.repo_root / p.lstrip('./') for p in values if isinstance(p, str))
 
-        if "plugins" not in self.data:
-            self.errors.append("Missing required field: 'plugins'")
-        elif not isinstance(self.data["plugins"], list):
-            self.errors.append("Field 'plugins' should be an array")
+        skills = plugin.get("skills")
+        if isinstance(skills, list):
+            for skill_path in skills:
+                if isinstance(skill_path, str):
+                    full_path = self.repo_root / skill_path.lstrip('./')
+                    inputs.append(full_path)
+                    inputs.append(full_path / "SKILL.md")
+        return inputs
 
-    def _validate_plugins(self) -> None:
-        """Validate all plugin entries."""
-        if "plugins" not in self.data or not isinstance(self.data["plugins"], list):
-            return
+    def _plugin_fingerprint(self, plugin: Any) -> Tuple:
+        """
+        Fingerprint a plugin's filesystem inputs as (path, mode, size, mtime) tuples.
 
-        for idx, plugin in enumerate(self.data["plugins"]):
-            self._validate_plugin(plugin, idx)
+        Any change to a referenced path (creation, deletion, type change or
+        modification) changes the fingerprint.
+        """
+        fingerprint = []
+        for path in self._plugin_inputs(plugin):
+            st = self.stat_cache.stat(path)
+            state = (st.st_mode, st.st_size, st.st_mtime_ns) if st is not None else None
+            fingerprint.append((str(path), state))
+        return tuple(fingerprint)
 
     def _validate_plugin(self, plugin: Dict[str, Any], idx: int) -> None:
         """
@@ -96,34 +1560,41 @@ class MarketplaceValidator:
 
         # Required fields
         if "name" not in plugin:
-            self.errors.append(f"{prefix}: Missing required field 'name'")
+            self._error("missing-field", f"{prefix}: Missing required field 'name'", field="name")
             return
 
         plugin_name = plugin["name"]
         prefix = f"Plugin '{plugin_name}'"
 
         if not self._is_kebab_case(plugin_name):
-            self.errors.append(f"{prefix}: Name should be in kebab-case")
+            self._error("not-kebab-case", f"{prefix}: Name should be in kebab-case", plugin=plugin_name, field="name")
 
         if "source" not in plugin:
-            self.errors.append(f"{prefix}: Missing required field 'source'")
+            self._error(
+                "missing-field", f"{prefix}: Missing required field 'source'", plugin=plugin_name, field="source"
+            )
 
         # Validate version format if present
         if "version" in plugin:
             if not self._is_valid_version(plugin["version"]):
-                self.warnings.append(
-                    f"{prefix}: Version '{plugin['version']}' should follow semver format (e.g., '0.1.0')"
+                self._warning(
+                    "invalid-version",
+                    f"{prefix}: Version '{plugin['version']}' should follow semver format (e.g., '0.1.0')",
+                    plugin=plugin_name, field="version",
                 )
 
         # Validate paths
         if "agents" in plugin:
-            self._validate_agent_paths(plugin["agents"], plugin_name)
+            with self._timed('agents'):
+                self._validate_agent_paths(plugin["agents"], plugin_name)
 
         if "skills" in plugin:
-            self._validate_skill_paths(plugin["skills"], plugin_name)
+            with self._timed('skills'):
+                self._validate_skill_paths(plugin["skills"], plugin_name)
 
         if "mcpServers" in plugin:
-            self._validate_mcp_server_path(plugin["mcpServers"], plugin_name)
+            with self._timed('mcpServers'):
+                self._validate_mcp_server_path(plugin["mcpServers"], plugin_name)
 
     def _validate_agent_paths(self, agents: Any, plugin_name: str) -> None:
         """
@@ -136,26 +1607,38 @@ class MarketplaceValidator:
         prefix = f"Plugin '{plugin_name}'"
 
         if not isinstance(agents, list):
-            self.errors.append(f"{prefix}: 'agents' should be an array")
+            self._error("invalid-type", f"{prefix}: 'agents' should be an array", plugin=plugin_name, field="agents")
             return
 
         for agent_path in agents:
             if not isinstance(agent_path, str):
-                self.errors.append(f"{prefix}: Agent path should be a string")
+                self._error(
+                    "invalid-type", f"{prefix}: Agent path should be a string", plugin=plugin_name, field="agents"
+                )
                 continue
 
             full_path = self.repo_root / agent_path.lstrip('./')
-            if not full_path.exists():
-                self.errors.append(
+            kind = self._path_kind(full_path)
+            if kind is None:
+                self._error(
+                    "path-not-found",
                     f"{prefix}: Agent file not found: {agent_path}\n"
                     f"  Expected at: {full_path}"
+                    f"{self._did_you_mean(full_path, 'file')}",
+                    plugin=plugin_name, field="agents", path=agent_path,
+                )
+            elif kind != 'file':
+                self._error(
+                    "wrong-path-type", f"{prefix}: Agent path is not a file: {agent_path}",
+                    plugin=plugin_name, field="agents", path=agent_path,
                 )
-            elif not full_path.is_file():
-                self.errors.append(f"{prefix}: Agent path is not a file: {agent_path}")
             elif not agent_path.endswith('.md'):
-                self.warnings.append(
-                    f"{prefix}: Agent file '{agent_path}' should have .md extension"
+                self._warning(
+                    "wrong-extension", f"{prefix}: Agent file '{agent_path}' should have .md extension",
+                    plugin=plugin_name, field="agents", path=agent_path,
                 )
+            elif self.deep:
+                self._validate_frontmatter(full_path, agent_path, full_path.stem, 'tools', plugin_name, "agents")
 
     def _validate_skill_paths(self, skills: Any, plugin_name: str) -> None:
         """
@@ -168,30 +1651,110 @@ class MarketplaceValidator:
         prefix = f"Plugin '{plugin_name}'"
 
         if not isinstance(skills, list):
-            self.errors.append(f"{prefix}: 'skills' should be an array")
+            self._error("invalid-type", f"{prefix}: 'skills' should be an array", plugin=plugin_name, field="skills")
             return
 
         for skill_path in skills:
             if not isinstance(skill_path, str):
-                self.errors.append(f"{prefix}: Skill path should be a string")
+                self._error(
+                    "invalid-type", f"{prefix}: Skill path should be a string", plugin=plugin_name, field="skills"
+                )
                 continue
 
             full_path = self.repo_root / skill_path.lstrip('./')
-            if not full_path.exists():
-                self.errors.append(
+            kind = self._path_kind(full_path)
+            if kind is None:
+                self._error(
+                    "path-not-found",
                     f"{prefix}: Skill directory not found: {skill_path}\n"
                     f"  Expected at: {full_path}"
+                    f"{self._did_you_mean(full_path, 'dir')}",
+                    plugin=plugin_name, field="skills", path=skill_path,
+                )
+            elif kind != 'dir':
+                self._error(
+                    "wrong-path-type", f"{prefix}: Skill path is not a directory: {skill_path}",
+                    plugin=plugin_name, field="skills", path=skill_path,
                 )
-            elif not full_path.is_dir():
-                self.errors.append(f"{prefix}: Skill path is not a directory: {skill_path}")
             else:
                 # Check for SKILL.md
                 skill_md = full_path / "SKILL.md"
-                if not skill_md.exists():
-                    self.errors.append(
-                        f"{prefix}: Missing SKILL.md in skill directory: {skill_path}"
+                if self._path_kind(skill_md) is None:
+                    self._error(
+                        "missing-skill-md", f"{prefix}: Missing SKILL.md in skill directory: {skill_path}",
+                        plugin=plugin_name, field="skills", path=skill_path,
+                    )
+                elif self.deep:
+                    self._validate_frontmatter(
+                        skill_md, f"{skill_path.rstrip('/')}/SKILL.md", full_path.name, 'allowed-tools',
+                        plugin_name, "skills",
                     )
 
+    def _validate_frontmatter(
+        self,
+        full_path: Path,
+        display_path: str,
+        expected_name: str,
+        tools_field: str,
+        plugin_name: str,
+        plugin_field: str,
+    ) -> None:
+        """
+        Validate the frontmatter of a referenced SKILL.md or agent file.
+
+        Args:
+            full_path: Path of the Markdown file
+            display_path: Path as shown in messages
+            expected_name: Name the file is referenced by (skill directory
+                name or agent file stem)
+            tools_field: Name of the tool list field ('allowed-tools' for
+                skills, 'tools' for agents)
+            plugin_name: Name of the owning plugin
+            plugin_field: Plugin field that references the file ('skills'
+                or 'agents')
+        """
+        prefix = f"Plugin '{plugin_name}'"
+        context = {"plugin": plugin_name, "path": display_path}
+
+        with self._timed('frontmatter'):
+            self.stat_cache.syscalls += 1
+            fields, error = read_frontmatter(full_path)
+        if error:
+            self._error("frontmatter-invalid", f"{prefix}: {display_path}: {error}", field=plugin_field, **context)
+            return
+
+        for field in ("name", "description"):
+            value = fields.get(field)
+            if not isinstance(value, str) or not value:
+                self._error(
+                    "frontmatter-missing-field", f"{prefix}: {display_path}: Missing frontmatter field '{field}'",
+                    field=field, **context,
+                )
+
+        name = fields.get("name")
+        if isinstance(name, str) and name:
+            if not self._is_kebab_case(name):
+                self._error(
+                    "not-kebab-case", f"{prefix}: {display_path}: Frontmatter name '{name}' should be in kebab-case",
+                    field="name", **context,
+                )
+            elif name != expected_name:
+                self._warning(
+                    "frontmatter-name-mismatch",
+                    f"{prefix}: {display_path}: Frontmatter name '{name}' does not match '{expected_name}'",
+                    field="name", **context,
+                )
+
+        tools = fields.get(tools_field)
+        if tools is not None and not (
+            isinstance(tools, str) or (isinstance(tools, list) and all(isinstance(t, str) and t for t in tools))
+        ):
+            self._error(
+                "invalid-type",
+                f"{prefix}: {display_path}: Frontmatter '{tools_field}' should be a list or comma-separated string",
+                field=tools_field, **context,
+            )
+
     def _validate_mcp_server_path(self, mcp_path: Any, plugin_name: str) -> None:
         """
         Validate MCP server path.
@@ -203,20 +1766,30 @@ class MarketplaceValidator:
         prefix = f"Plugin '{plugin_name}'"
 
         if not isinstance(mcp_path, str):
-            self.errors.append(f"{prefix}: 'mcpServers' should be a string")
+            self._error(
+                "invalid-type", f"{prefix}: 'mcpServers' should be a string", plugin=plugin_name, field="mcpServers"
+            )
             return
 
         full_path = self.repo_root / mcp_path.lstrip('./')
-        if not full_path.exists():
-            self.errors.append(
+        kind = self._path_kind(full_path)
+        if kind is None:
+            self._error(
+                "path-not-found",
                 f"{prefix}: MCP server file not found: {mcp_path}\n"
                 f"  Expected at: {full_path}"
+                f"{self._did_you_mean(full_path, 'file')}",
+                plugin=plugin_name, field="mcpServers", path=mcp_path,
+            )
+        elif kind != 'file':
+            self._error(
+                "wrong-path-type", f"{prefix}: MCP server path is not a file: {mcp_path}",
+                plugin=plugin_name, field="mcpServers", path=mcp_path,
             )
-        elif not full_path.is_file():
-            self.errors.append(f"{prefix}: MCP server path is not a file: {mcp_path}")
         elif not mcp_path.endswith('.json'):
-            self.warnings.append(
-                f"{prefix}: MCP server file '{mcp_path}' should have .json extension"
+            self._warning(
+                "wrong-extension", f"{prefix}: MCP server file '{mcp_path}' should have .json extension",
+                plugin=plugin_name, field="mcpServers", path=mcp_path,
             )
 
     @staticmethod
@@ -235,42 +1808,842 @@ class MarketplaceValidator:
         return all(part.isdigit() for part in parts)
 
 
-def main():
-    """Main entry point."""
-    if len(sys.argv) < 2:
-        print("Usage: python validate_marketplace.py <path-to-marketplace.json>")
-        sys.exit(1)
+class _InotifyWaiter:
+    """Block until something changes in a set of directories, using Linux inotify."""
 
-    marketplace_path = Path(sys.argv[1])
-    validator = MarketplaceValidator(marketplace_path)
-    success, errors, warnings = validator.validate()
+    # IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    # | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+    MASK = 0x002 | 0x004 | 0x008 | 0x040 | 0x080 | 0x100 | 0x200 | 0x400 | 0x800
 
-    # Print results
-    print("=" * 70)
-    print("Marketplace Validation Report")
-    print("=" * 70)
-    print(f"File: {marketplace_path}")
-    print()
+    def __init__(self):
+        import ctypes
+        import ctypes.util
+
+        libc_name = ctypes.util.find_library("c")
+        if not sys.platform.startswith("linux") or not libc_name:
+            raise OSError("inotify is not available")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self._libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+        self._fd = -1
+        self._watched: frozenset = frozenset()
+        self._reset(frozenset())
+
+    def _reset(self, directories: frozenset) -> None:
+        """Recreate the inotify instance watching exactly the given directories."""
+        if self._fd >= 0:
+            os.close(self._fd)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError("inotify_init1 failed")
+        for directory in directories:
+            self._libc.inotify_add_watch(self._fd, os.fsencode(directory), self.MASK)
+        self._watched = directories
+
+    def wait(self, directories: Set[str], debounce: float) -> None:
+        """
+        Wait for the next change event in any of the directories.
+
+        Args:
+            directories: Directories to watch
+            debounce: Seconds to keep draining events after the first one,
+                so that an editor's burst of writes triggers one re-run
+        """
+        import select
+
+        directories = frozenset(directories)
+        if directories != self._watched:
+            self._reset(directories)
+
+        select.select([self._fd], [], [])
+        self._drain()
+        while select.select([self._fd], [], [], debounce)[0]:
+            self._drain()
+
+    def _drain(self) -> None:
+        """Discard all pending events."""
+        try:
+            while os.read(self._fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+
+
+class _PollingWaiter:
+    """Fallback waiter that simply sleeps; each cycle re-checks inputs by mtime."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+
+    def wait(self, directories: Set[str], debounce: float) -> None:
+        """Sleep for one polling interval."""
+        time.sleep(self.interval)
+
+
+class MarketplaceWatcher:
+    """
+    Keep validating a marketplace file as it and its referenced paths change.
+
+    marketplace.json is only re-parsed when its own stat changes, and a
+    plugin's checks are only re-run when its entry or the stat of one of
+    its referenced paths changed. Unchanged plugins reuse their previous
+    findings.
+    """
+
+    def __init__(
+        self,
+        marketplace_path: Path,
+        use_index: Optional[bool] = None,
+        deep: bool = False,
+        interval: float = 0.5,
+        debounce: float = 0.05,
+        force_polling: bool = False,
+    ):
+        """
+        Initialize watcher.
+
+        Args:
+            marketplace_path: Path to the marketplace.json file
+            use_index: Passed through to MarketplaceValidator
+            deep: Passed through to MarketplaceValidator
+            interval: Polling interval in seconds (when inotify is unavailable)
+            debounce: Seconds to coalesce bursts of inotify events
+            force_polling: Use mtime polling even where inotify is available
+        """
+        self.marketplace_path = marketplace_path
+        self.use_index = use_index
+        self.deep = deep
+        self.debounce = debounce
+        self.waiter: Any = None
+        if not force_polling:
+            try:
+                self.waiter = _InotifyWaiter()
+            except OSError:
+                self.waiter = None
+        if self.waiter is None:
+            self.waiter = _PollingWaiter(interval)
+
+        # Sentinel so the first cycle always loads the file
+        self._marketplace_state: Any = object()
+        self._data: Any = None
+        self._load_errors: List[str] = []
+        self._plugin_results: Dict[Tuple, Tuple] = {}
+        self._index: Optional[RepoIndex] = None
+        self._inputs: List[Path] = []
+        self._watch_dirs: Set[str] = set()
+        self._last_report: Any = None
+
+    def run(self) -> None:
+        """Validate once, then re-validate on every change until interrupted."""
+        mode = "inotify" if isinstance(self.waiter, _InotifyWaiter) else "polling"
+        print(f"Watching {self.marketplace_path} ({mode}). Press Ctrl+C to stop.")
+        self.cycle()
+        try:
+            while True:
+                self.waiter.wait(self._watch_dirs, self.debounce)
+                self.cycle()
+        except KeyboardInterrupt:
+            print()
+
+    def cycle(self) -> bool:
+        """
+        Re-validate whatever changed since the previous cycle and report it.
+
+        Returns:
+            True if the validation succeeded
+        """
+        start = time.perf_counter()
+        errors, warnings, rerun, total = self.collect()
+        self._update_watch_dirs()
+        return self._report(errors, warnings, rerun, total, start)
+
+    def collect(self) -> Tuple[List[str], List[str], int, int]:
+        """
+        Re-validate whatever changed since the previous call.
+
+        Returns:
+            Tuple of (errors, warnings, plugins re-validated, total plugins)
+        """
+        validator = MarketplaceValidator(self.marketplace_path, use_index=self.use_index, deep=self.deep)
+
+        marketplace_st = validator.stat_cache.stat(self.marketplace_path)
+        marketplace_state = (
+            (marketplace_st.st_size, marketplace_st.st_mtime_ns) if marketplace_st is not None else None
+        )
+        if marketplace_state != self._marketplace_state:
+            self._marketplace_state = marketplace_state
+            self._data = None
+            self._load_errors = []
+            if validator._load():
+                self._data = validator.data
+            else:
+                self._load_errors = list(validator.errors)
+                self._plugin_results = {}
+
+        self._inputs = []
+        if self._data is None:
+            return list(self._load_errors), [], 0, 0
+
+        validator.data = self._data
+        validator._validate_structure()
+        # Reuse the index while no indexed directory gained or lost entries,
+        # so a save does not trigger a full repository walk
+        validator._build_index(self._index)
+        self._index = validator.index
+        errors, warnings = list(validator.errors), list(validator.warnings)
+
+        plugins = self._data.get("plugins") if isinstance(self._data, dict) else None
+        if not isinstance(plugins, list):
+            plugins = []
+
+        results = {}
+        rerun = 0
+        for idx, plugin in enumerate(plugins):
+            # Named plugins are keyed by content only, so inserting an entry
+            # does not invalidate every plugin after it
+            named = isinstance(plugin, dict) and "name" in plugin
+            key = (json.dumps(plugin, sort_keys=True, default=str), None if named else idx)
+            fingerprint = validator._plugin_fingerprint(plugin)
+            cached = self._plugin_results.get(key)
+            if cached is not None and cached[0] == fingerprint:
+                results[key] = cached
+            else:
+                results[key] = (fingerprint, *validator._validate_plugin_isolated(plugin, idx))
+                rerun += 1
+            errors.extend(results[key][1])
+            warnings.extend(results[key][2])
+            self._inputs.extend(validator._plugin_inputs(plugin))
+        self._plugin_results = results
+
+        # Cross-plugin checks depend on every plugin, so they always re-run
+        cross_errors, cross_warnings = len(validator.errors), len(validator.warnings)
+        for idx, plugin in enumerate(plugins):
+            validator._index_plugin(plugin, idx)
+        # Record the directories the orphan scan visits, so that adding,
+        # removing or moving a SKILL.md anywhere under skills/ triggers a cycle
+        validator._inputs = set()
+        validator._validate_orphans()
+        self._inputs.extend(sorted(validator._inputs))
+        validator._inputs = None
+        errors.extend(validator.errors[cross_errors:])
+        warnings.extend(validator.warnings[cross_warnings:])
+
+        return errors, warnings, rerun, len(plugins)
+
+    def _update_watch_dirs(self) -> None:
+        """
+        Recompute the directories to watch from the inputs of the last collect().
+
+        Called after every cycle, so directories created since the previous
+        cycle (e.g. a new skill under skills/) are picked up.
+        """
+        self._watch_dirs = {str(self.marketplace_path.parent)}
+        for path in self._inputs:
+            self._watch_dirs.update(self._dirs_to_watch(path))
+
+    def _dirs_to_watch(self, path: Path) -> List[str]:
+        """Directories whose events can affect a path: its nearest existing ancestor, and itself if a directory."""
+        dirs = []
+        if path.is_dir():
+            dirs.append(str(path))
+        parent = path.parent
+        while not parent.is_dir() and parent != parent.parent:
+            parent = parent.parent
+        dirs.append(str(parent))
+        return dirs
+
+    def _report(self, errors: List[str], warnings: List[str], rerun: int, total: int, start: float) -> bool:
+        """Print the report if anything was re-checked or the findings changed."""
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        report = (tuple(errors), tuple(warnings))
+        success = not errors
+        if report != self._last_report:
+            print(f"\n[{time.strftime('%H:%M:%S')}] Re-validated {rerun} of {total} plugin(s) in {elapsed_ms:.1f} ms")
+            print_report(self.marketplace_path, errors, warnings)
+        elif rerun:
+            print(
+                f"[{time.strftime('%H:%M:%S')}] Re-validated {rerun} of {total} plugin(s) "
+                f"in {elapsed_ms:.1f} ms: no changes"
+            )
+        self._last_report = report
+        return success
+
+
+def print_report(marketplace_path: Path, errors: List[str], warnings: List[str], stream: Any = None) -> bool:
+    """
+    Print the human-readable validation report.
+
+    Args:
+        marketplace_path: Path shown in the header
+        errors: Error messages
+        warnings: Warning messages
+        stream: Output stream (default: stdout)
+
+    Returns:
+        True if there were no errors
+    """
+    stream = stream if stream is not None else sys.stdout
+    print("=" * 70, file=stream)
+    print("Marketplace Validation Report", file=stream)
+    print("=" * 70, file=stream)
+    print(f"File: {marketplace_path}", file=stream)
+    print(file=stream)
 
     if warnings:
-        print(f"⚠️  Warnings ({len(warnings)}):")
+        print(f"⚠️  Warnings ({len(warnings)}):", file=stream)
         for warning in warnings:
-            print(f"  - {warning}")
-        print()
+            print(f"  - {warning}", file=stream)
+        print(file=stream)
 
     if errors:
-        print(f"❌ Errors ({len(errors)}):")
+        print(f"❌ Errors ({len(errors)}):", file=stream)
         for error in errors:
-            print(f"  - {error}")
-        print()
-        print("Validation FAILED")
-        sys.exit(1)
-    else:
-        print("✅ Validation PASSED")
-        if warnings:
-            print(f"   ({len(warnings)} warning(s) found)")
+            print(f"  - {error}", file=stream)
+        print(file=stream)
+        print("Validation FAILED", file=stream)
+        return False
+
+    print("✅ Validation PASSED", file=stream)
+    if warnings:
+        print(f"   ({len(warnings)} warning(s) found)", file=stream)
+    return True
+
+
+class ValidationServer:
+    """
+    Long-lived validation service speaking JSON-RPC 2.0, one message per line.
+
+    Each (path, options) combination keeps a MarketplaceWatcher, so repeated
+    requests skip interpreter start-up, re-parse marketplace.json only when
+    it changed, and re-run a plugin's checks only when its entry or the stat
+    of one of its inputs changed.
+
+    Methods:
+        validate: params {"path": str, "deep": bool, "use_index": bool|null}
+            -> {"path", "success", "errors", "warnings", "report",
+                "revalidated", "plugins", "elapsed_ms"}
+        ping: -> "pong"
+        shutdown: -> null, then the server stops
+    """
+
+    PARSE_ERROR = -32700
+    INVALID_REQUEST = -32600
+    METHOD_NOT_FOUND = -32601
+    INVALID_PARAMS = -32602
+    INTERNAL_ERROR = -32603
+
+    def __init__(self):
+        self._watchers: Dict[Tuple[str, Optional[bool], bool], MarketplaceWatcher] = {}
+        # Requests from concurrent socket connections share the watchers
+        self._lock = threading.Lock()
+        self.stopped = False
+
+    def handle(self, line: str) -> Optional[str]:
+        """
+        Handle one request line.
+
+        Returns:
+            The response line, or None for a notification (request without id)
+        """
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            return self._response(None, error=(self.PARSE_ERROR, f"Parse error: {e}"))
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return self._response(None, error=(self.INVALID_REQUEST, "Invalid request"))
+
+        request_id = request.get("id")
+        params = request.get("params", {})
+        handler = {"validate": self._validate, "ping": self._ping, "shutdown": self._shutdown}.get(request["method"])
+        if handler is None:
+            result: Any = None
+            error: Optional[Tuple[int, str]] = (self.METHOD_NOT_FOUND, f"Method not found: {request['method']}")
+        elif not isinstance(params, dict):
+            result, error = None, (self.INVALID_PARAMS, "params should be an object")
+        else:
+            try:
+                result, error = handler(params), None
+            except ValueError as e:
+                result, error = None, (self.INVALID_PARAMS, str(e))
+            except Exception as e:
+                # One bad request must not take the long-running server down
+                result, error = None, (self.INTERNAL_ERROR, f"Internal error: {type(e).__name__}: {e}")
+
+        if "id" not in request:
+            return None
+        return self._response(request_id, result=result, error=error)
+
+    @staticmethod
+    def _response(request_id: Any, result: Any = None, error: Optional[Tuple[int, str]] = None) -> str:
+        """Serialize a JSON-RPC response."""
+        response: Dict[str, Any] = {"jsonrpc": "2.0", "id": request_id}
+        if error is not None:
+            response["error"] = {"code": error[0], "message": error[1]}
+        else:
+            response["result"] = result
+        return json.dumps(response, ensure_ascii=False)
+
+    def _validate(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate one marketplace file, reusing the warm state for it."""
+        path = params.get("path")
+        deep = params.get("deep", False)
+        use_index = params.get("use_index")
+        if not isinstance(path, str) or not path:
+            raise ValueError("'path' should be a non-empty string")
+        if not isinstance(deep, bool) or use_index not in (None, True, False):
+            raise ValueError("'deep' and 'use_index' should be booleans")
+
+        start = time.perf_counter()
+        key = (os.path.abspath(path), use_index, deep)
+        with self._lock:
+            watcher = self._watchers.get(key)
+            if watcher is None:
+                watcher = MarketplaceWatcher(Path(key[0]), use_index=use_index, deep=deep, force_polling=True)
+                self._watchers[key] = watcher
+            errors, warnings, rerun, total = watcher.collect()
+
+        report = io.StringIO()
+        success = print_report(Path(path), errors, warnings, stream=report)
+        return {
+            "path": path,
+            "success": success,
+            "errors": errors,
+            "warnings": warnings,
+            "report": report.getvalue(),
+            "revalidated": rerun,
+            "plugins": total,
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 3),
+        }
+
+    @staticmethod
+    def _ping(params: Dict[str, Any]) -> str:
+        """Liveness check."""
+        return "pong"
+
+    def _shutdown(self, params: Dict[str, Any]) -> None:
+        """Ask the serving loop to stop after this response."""
+        self.stopped = True
+
+    def serve_stdio(self, stdin: Any = None, stdout: Any = None) -> None:
+        """Serve requests read from stdin, writing responses to stdout, until EOF or shutdown."""
+        stdin = stdin if stdin is not None else sys.stdin
+        stdout = stdout if stdout is not None else sys.stdout
+        for line in stdin:
+            if not line.strip():
+                continue
+            response = self.handle(line)
+            if response is not None:
+                stdout.write(response + "\n")
+                stdout.flush()
+            if self.stopped:
+                break
+
+    def serve_socket(self, socket_path: Path) -> None:
+        """
+        Serve requests on a Unix domain socket until shutdown, Ctrl+C or SIGTERM.
+
+        Each connection may send any number of request lines. The socket
+        file is created with owner-only permissions and removed on exit. A
+        stale socket file left by a crashed server is replaced, but one that
+        still accepts connections is not.
+
+        Raises:
+            OSError: If another server is listening on socket_path
+        """
+        import signal
+        import socket
+        import socketserver
+
+        service = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                for raw in self.rfile:
+                    line = raw.decode('utf-8', errors='replace')
+                    if not line.strip():
+                        continue
+                    response = service.handle(line)
+                    if response is not None:
+                        self.wfile.write(response.encode('utf-8') + b"\n")
+                        self.wfile.flush()
+                    if service.stopped:
+                        threading.Thread(target=self.server.shutdown, daemon=True).start()
+                        return
+
+        if socket_path.is_socket():
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(str(socket_path))
+            except OSError:
+                # Nobody is listening: a stale file from a server that died
+                socket_path.unlink()
+            else:
+                raise OSError(errno.EADDRINUSE, "another validation server is listening on this socket", str(socket_path))
+            finally:
+                probe.close()
+
+        socketserver.ThreadingUnixStreamServer.daemon_threads = True
+        old_umask = os.umask(0o077)
+        try:
+            server = socketserver.ThreadingUnixStreamServer(str(socket_path), Handler)
+        finally:
+            os.umask(old_umask)
+        bound = os.stat(socket_path)
+
+        # SIGTERM (the usual supervisor stop) unwinds like Ctrl+C, so the
+        # socket file is removed below
+        def terminate(signum: int, frame: Any) -> None:
+            raise KeyboardInterrupt
+
+        previous_handler = None
+        if threading.current_thread() is threading.main_thread():
+            previous_handler = signal.signal(signal.SIGTERM, terminate)
+        try:
+            with server:
+                server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if previous_handler is not None:
+                signal.signal(signal.SIGTERM, previous_handler)
+            # Only remove the socket if it is still the one this server bound
+            try:
+                st = os.stat(socket_path)
+                if (st.st_dev, st.st_ino) == (bound.st_dev, bound.st_ino):
+                    socket_path.unlink()
+            except OSError:
+                pass
+
+
+def expand_marketplace_paths(patterns: Iterable[str]) -> List[Path]:
+    """
+    Expand command-line arguments into marketplace file paths.
+
+    Arguments containing glob characters are expanded (``**`` is recursive
+    and, on Python 3.11+, also descends into dot-directories such as
+    ``.claude-plugin``). Plain paths are kept as-is so that a missing file is
+    reported as not found. Duplicates are dropped, keeping the first occurrence.
+
+    Args:
+        patterns: Paths or glob patterns
+
+    Returns:
+        List of marketplace paths in argument order
+
+    Raises:
+        ValueError: If a glob pattern matches no files
+    """
+    options = {'include_hidden': True} if sys.version_info >= (3, 11) else {}
+    paths: List[Path] = []
+    seen: Set[str] = set()
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern, recursive=True, **options))
+            if not matches:
+                raise ValueError(f"pattern matched no files: {pattern}")
+        else:
+            matches = [pattern]
+        for match in matches:
+            key = os.path.normpath(os.path.abspath(match))
+            if key not in seen:
+                seen.add(key)
+                paths.append(Path(match))
+    return paths
+
+
+_VALIDATOR_DIGEST: Optional[str] = None
+
+
+def _validator_digest() -> str:
+    """SHA-256 of this script, so that cached results do not outlive a change to the checks."""
+    global _VALIDATOR_DIGEST
+    if _VALIDATOR_DIGEST is None:
+        with open(__file__, 'rb') as f:
+            _VALIDATOR_DIGEST = hashlib.sha256(f.read()).hexdigest()
+    return _VALIDATOR_DIGEST
+
+
+def _validate_one(marketplace_path: Path, options: Dict[str, Any]) -> Tuple[bool, List[str], List[str]]:
+    """Validate a single marketplace file (module-level so worker processes can run it)."""
+    return MarketplaceValidator(marketplace_path, **options).validate()
+
+
+def _worker_count(jobs: Optional[int], marketplace_paths: List[Path], options: Dict[str, Any]) -> int:
+    """Number of worker processes to use; 1 means validate in-process."""
+    if options.get("profiler") is not None:
+        # All timings must land in the one profiler object
+        return 1
+    return min(jobs or os.cpu_count() or 1, len(marketplace_paths))
+
+
+def validate_many(
+    marketplace_paths: List[Path],
+    jobs: Optional[int] = None,
+    **options: Any,
+) -> List[Tuple[bool, List[str], List[str]]]:
+    """
+    Validate several marketplace files, in parallel across processes.
+
+    Args:
+        marketplace_paths: Marketplace files to validate
+        jobs: Number of worker processes (default: CPU count). With one job,
+            one file, or a profiler, everything runs in the current process.
+        **options: Keyword arguments for MarketplaceValidator
+
+    Returns:
+        One (success, errors, warnings) tuple per path, in input order
+    """
+    jobs = _worker_count(jobs, marketplace_paths, options)
+    if jobs <= 1:
+        return [_validate_one(path, options) for path in marketplace_paths]
+
+    # Imported here: it is slow to import and only needed for parallel runs
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(_validate_one, marketplace_paths, [options] * len(marketplace_paths)))
+
+
+def _finding_records(marketplace_path: Path, options: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Collect one marketplace file's findings as NDJSON records (module-level for worker processes)."""
+    validator = MarketplaceValidator(marketplace_path, **options)
+    return [_finding_record(marketplace_path, finding) for finding in validator.iter_findings()]
+
+
+def _finding_record(marketplace_path: Path, finding: Finding) -> Dict[str, Any]:
+    """Return a finding as an NDJSON record tagged with its marketplace file."""
+    return {"marketplace": str(marketplace_path), **finding.to_dict()}
+
+
+def stream_ndjson(
+    marketplace_paths: List[Path],
+    jobs: Optional[int] = None,
+    output: Any = None,
+    **options: Any,
+) -> bool:
+    """
+    Write findings as NDJSON, one JSON object per line.
+
+    In-process, each finding is written as soon as its plugin has been
+    checked. With worker processes, the findings of each file are written
+    when that file is done, in input order.
+
+    Args:
+        marketplace_paths: Marketplace files to validate
+        jobs: Number of worker processes (see validate_many)
+        output: Output stream (default: stdout)
+        **options: Keyword arguments for MarketplaceValidator
+
+    Returns:
+        True if no error was found
+    """
+    output = output if output is not None else sys.stdout
+    success = True
+
+    def write(record: Dict[str, Any]) -> None:
+        nonlocal success
+        success = success and record["severity"] != "error"
+        output.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    jobs = _worker_count(jobs, marketplace_paths, options)
+    if jobs <= 1:
+        for marketplace_path in marketplace_paths:
+            validator = MarketplaceValidator(marketplace_path, **options)
+            for finding in validator.iter_findings():
+                write(_finding_record(marketplace_path, finding))
+                output.flush()
+        return success
+
+    # Imported here: it is slow to import and only needed for parallel runs
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for records in pool.map(_finding_records, marketplace_paths, [options] * len(marketplace_paths)):
+            for record in records:
+                write(record)
+            output.flush()
+    return success
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Validate a .claude-plugin/marketplace.json file.",
+    )
+    parser.add_argument(
+        "marketplaces", nargs="*", metavar="marketplace",
+        help="Path(s) to marketplace.json; glob patterns such as '**/.claude-plugin/marketplace.json' are expanded",
+    )
+    index_group = parser.add_mutually_exclusive_group()
+    index_group.add_argument(
+        "--index", dest="use_index", action="store_true", default=None,
+        help="Always resolve paths from a pre-built repository index",
+    )
+    index_group.add_argument(
+        "--no-index", dest="use_index", action="store_false",
+        help="Never build the repository index (stat each path instead)",
+    )
+    parser.add_argument(
+        "--format", choices=["text", "ndjson"], default="text",
+        help="Output format: human-readable report, or one JSON finding per line (default: text)",
+    )
+    parser.add_argument(
+        "--deep", action="store_true",
+        help="Also validate the frontmatter (name, description, tools) of referenced SKILL.md and agent files",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None,
+        help="Worker processes when validating several files (default: CPU count)",
+    )
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="Decode the plugins array incrementally and validate each plugin as it is read "
+             "(memory per plugin stays constant; the cross-plugin duplicate index grows with the plugin count)",
+    )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="Print wall time and filesystem syscalls per check type and the slowest plugins "
+             "(validates in-process)",
+    )
+    parser.add_argument(
+        "--profile-top", type=int, default=10, metavar="N",
+        help="Number of slowest plugins listed by --profile (default: 10)",
+    )
+    parser.add_argument(
+        "--profile-out", type=Path, metavar="FILE",
+        help="With --profile, also write cProfile statistics to FILE (readable with pstats)",
+    )
+    parser.add_argument(
+        "--check-links", action="store_true",
+        help="Also check relative links and '#anchor' fragments in the Markdown files of every referenced skill",
+    )
+    parser.add_argument(
+        "--cache", action="store_true",
+        help="Reuse the result stored in .claude-plugin/.validation-cache.json when marketplace.json and "
+             "every referenced path are unchanged (mtime and size), and store it after a fresh run",
+    )
+    parser.add_argument(
+        "--serve", action="store_true",
+        help="Run as a long-lived JSON-RPC validation server on stdin/stdout (or --socket)",
+    )
+    parser.add_argument(
+        "--socket", type=Path, metavar="PATH",
+        help="With --serve, listen on this Unix domain socket instead of stdin/stdout",
+    )
+    parser.add_argument(
+        "--watch", action="store_true",
+        help="Keep running and re-validate whenever marketplace.json or a referenced path changes",
+    )
+    parser.add_argument(
+        "--poll", action="store_true",
+        help="With --watch, use mtime polling instead of inotify",
+    )
+    parser.add_argument(
+        "--interval", type=float, default=0.5,
+        help="Polling interval in seconds for --watch (default: 0.5)",
+    )
+    args = parser.parse_args()
+
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    if args.serve:
+        if args.marketplaces:
+            parser.error("--serve does not take marketplace paths (send them as requests)")
+        server = ValidationServer()
+        if args.socket is not None:
+            try:
+                server.serve_socket(args.socket)
+            except OSError as e:
+                print(f"Cannot serve on {args.socket}: {e.strerror or e}", file=sys.stderr)
+                sys.exit(2)
+        else:
+            server.serve_stdio()
+        sys.exit(0)
+    if args.socket is not None:
+        parser.error("--socket requires --serve")
+    if not args.marketplaces:
+        parser.error("the following arguments are required: marketplace")
+
+    try:
+        marketplace_paths = expand_marketplace_paths(args.marketplaces)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.watch:
+        if len(marketplace_paths) != 1:
+            parser.error("--watch accepts exactly one marketplace file")
+        if args.format != "text":
+            parser.error("--watch only supports --format text")
+        if args.profile or args.stream or args.cache or args.check_links:
+            parser.error("--watch cannot be combined with --profile, --stream, --cache or --check-links")
+        watcher = MarketplaceWatcher(
+            marketplace_paths[0], use_index=args.use_index, deep=args.deep,
+            interval=args.interval, force_polling=args.poll,
+        )
+        watcher.run()
         sys.exit(0)
 
+    if args.profile_out and not args.profile:
+        parser.error("--profile-out requires --profile")
+
+    profiler = ValidationProfiler() if args.profile else None
+    c_profile = None
+    if args.profile_out:
+        import cProfile
+        c_profile = cProfile.Profile()
+
+    def finish_profile(stream: Any) -> None:
+        """Print the profile and dump cProfile statistics, if profiling."""
+        if c_profile is not None:
+            c_profile.disable()
+            c_profile.dump_stats(str(args.profile_out))
+        if profiler is not None:
+            print(file=stream)
+            profiler.print_report(top=args.profile_top, stream=stream)
+            if c_profile is not None:
+                print(f"cProfile statistics written to {args.profile_out}", file=stream)
+
+    options = {
+        "use_index": args.use_index, "deep": args.deep, "profiler": profiler, "stream": args.stream,
+        "cache": args.cache, "check_links": args.check_links,
+    }
+    if c_profile is not None:
+        c_profile.enable()
+
+    if args.format == "ndjson":
+        try:
+            success = stream_ndjson(marketplace_paths, jobs=args.jobs, **options)
+        except BrokenPipeError:
+            # The reader went away (e.g. piped into `head`); stop quietly
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            sys.exit(1)
+        # Keep stdout pure NDJSON
+        finish_profile(sys.stderr)
+        sys.exit(0 if success else 1)
+
+    results = validate_many(marketplace_paths, jobs=args.jobs, **options)
+
+    # Print results
+    failed = []
+    for i, (marketplace_path, (success, errors, warnings)) in enumerate(zip(marketplace_paths, results)):
+        if i:
+            print()
+        if not print_report(marketplace_path, errors, warnings):
+            failed.append(marketplace_path)
+
+    if len(marketplace_paths) > 1:
+        print()
+        print("=" * 70)
+        print(
+            f"Validated {len(marketplace_paths)} marketplace file(s): "
+            f"{len(marketplace_paths) - len(failed)} passed, {len(failed)} failed"
+        )
+        for marketplace_path in failed:
+            print(f"  ❌ {marketplace_path}")
+
+    finish_profile(sys.stdout)
+    sys.exit(1 if failed else 0)
+
 
 if __name__ == "__main__":
     main()
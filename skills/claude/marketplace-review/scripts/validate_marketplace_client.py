@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Thin client for the marketplace validation server.
+
+Sends "validate" requests to a server started with
+``validate_marketplace.py --serve --socket PATH`` and prints its reports.
+Only the socket and json modules are imported, so each call costs little
+more than interpreter start-up.
+"""
+
+import json
+import os
+import socket
+import sys
+
+
+USAGE = "usage: validate_marketplace_client.py SOCKET [--deep] marketplace.json [...]"
+
+
+def main():
+    """Main entry point."""
+    args = sys.argv[1:]
+    deep = "--deep" in args
+    args = [a for a in args if a != "--deep"]
+    if len(args) < 2 or any(a.startswith("-") for a in args):
+        print(USAGE, file=sys.stderr)
+        sys.exit(2)
+
+    socket_path, marketplace_paths = args[0], args[1:]
+    try:
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        conn.connect(socket_path)
+    except OSError as e:
+        print(f"Cannot connect to validation server at {socket_path}: {e.strerror}", file=sys.stderr)
+        sys.exit(2)
+
+    # Pipeline all requests, then read the responses in order
+    with conn, conn.makefile("rwb") as f:
+        for request_id, path in enumerate(marketplace_paths):
+            request = {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": "validate",
+                "params": {"path": os.path.abspath(path), "deep": deep},
+            }
+            f.write(json.dumps(request).encode("utf-8") + b"\n")
+        f.flush()
+
+        failed = False
+        for i, path in enumerate(marketplace_paths):
+            line = f.readline()
+            if not line:
+                print("Validation server closed the connection", file=sys.stderr)
+                sys.exit(2)
+            response = json.loads(line)
+            if "error" in response:
+                print(f"{path}: {response['error']['message']}", file=sys.stderr)
+                failed = True
+                continue
+            if i:
+                print()
+            sys.stdout.write(response["result"]["report"])
+            failed = failed or not response["result"]["success"]
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+"""
+Tests for validate_marketplace.py.
+
+    python3 -m unittest discover skills/claude/marketplace-review/tests
+"""
+
+import io
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+SCRIPT = SCRIPTS_DIR / "validate_marketplace.py"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import validate_marketplace  # noqa: E402
+
+
+SKILL_MD = "---\nname: {name}\ndescription: A test skill\n---\n# {name}\n"
+
+
+def make_marketplace(root: Path) -> Path:
+    """Create a marketplace with one plugin referencing skills/foo/used."""
+    (root / ".claude-plugin").mkdir()
+    (root / "skills" / "foo" / "used").mkdir(parents=True)
+    (root / "skills" / "foo" / "used" / "SKILL.md").write_text(SKILL_MD.format(name="used"))
+    (root / "skills" / "foo" / "bar").mkdir()
+    marketplace = root / ".claude-plugin" / "marketplace.json"
+    marketplace.write_text(json.dumps({
+        "name": "test-marketplace",
+        "owner": {"name": "Test", "email": "test@example.com"},
+        "plugins": [{
+            "name": "test-plugin",
+            "source": "./",
+            "description": "Test plugin",
+            "version": "0.1.0",
+            "skills": ["./skills/foo/used"],
+        }],
+    }))
+    return marketplace
+
+
+class WatcherTest(unittest.TestCase):
+    """MarketplaceWatcher must notice SKILL.md changes under skills/."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.marketplace = make_marketplace(self.root)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def orphan_warnings(self, watcher):
+        _, warnings, _, _ = watcher.collect()
+        watcher._update_watch_dirs()
+        return [w for w in warnings if "not referenced by any plugin" in w]
+
+    def test_scanned_skill_dirs_are_watched(self):
+        watcher = validate_marketplace.MarketplaceWatcher(self.marketplace, force_polling=True)
+        self.assertEqual(self.orphan_warnings(watcher), [])
+        for rel in ("skills", "skills/foo", "skills/foo/bar", "skills/foo/used"):
+            self.assertIn(str(self.root / rel), watcher._watch_dirs)
+
+    def test_new_subdirectory_is_watched_after_cycle(self):
+        watcher = validate_marketplace.MarketplaceWatcher(self.marketplace, force_polling=True)
+        self.orphan_warnings(watcher)
+        (self.root / "skills" / "foo" / "bar" / "baz").mkdir()
+        self.orphan_warnings(watcher)
+        self.assertIn(str(self.root / "skills" / "foo" / "bar" / "baz"), watcher._watch_dirs)
+
+    def test_adding_skill_md_triggers_cycle(self):
+        try:
+            watcher = validate_marketplace.MarketplaceWatcher(self.marketplace)
+        except OSError:
+            self.skipTest("inotify is not available")
+        if not isinstance(watcher.waiter, validate_marketplace._InotifyWaiter):
+            self.skipTest("inotify is not available")
+        self.assertEqual(self.orphan_warnings(watcher), [])
+
+        # Register the watches before the change, then wait in the background
+        watcher.waiter._reset(frozenset(watcher._watch_dirs))
+        woke = threading.Event()
+        thread = threading.Thread(
+            target=lambda: (watcher.waiter.wait(watcher._watch_dirs, 0.01), woke.set()), daemon=True
+        )
+        thread.start()
+        (self.root / "skills" / "foo" / "bar" / "SKILL.md").write_text(SKILL_MD.format(name="bar"))
+        self.assertTrue(woke.wait(5), "adding a SKILL.md did not wake the watcher")
+
+        warnings = self.orphan_warnings(watcher)
+        self.assertEqual(len(warnings), 1)
+        self.assertIn("./skills/foo/bar", warnings[0])
+
+    def test_moving_skill_md_updates_orphans(self):
+        watcher = validate_marketplace.MarketplaceWatcher(self.marketplace, force_polling=True)
+        bar = self.root / "skills" / "foo" / "bar"
+        (bar / "SKILL.md").write_text(SKILL_MD.format(name="bar"))
+        self.assertEqual(len(self.orphan_warnings(watcher)), 1)
+        (bar / "SKILL.md").rename(self.root / "skills" / "foo" / "SKILL.md.moved")
+        self.assertEqual(self.orphan_warnings(watcher), [])
+
+
+class WatcherIndexTest(unittest.TestCase):
+    """The repository index must survive watch cycles until a directory changes."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.marketplace = make_marketplace(self.root)
+        self.watcher = validate_marketplace.MarketplaceWatcher(
+            self.marketplace, use_index=True, force_polling=True
+        )
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def cycle(self):
+        errors, _, _, _ = self.watcher.collect()
+        return errors
+
+    def test_index_is_reused_when_file_content_changes(self):
+        self.assertEqual(self.cycle(), [])
+        index = self.watcher._index
+        self.assertIsNotNone(index)
+        skill_md = self.root / "skills" / "foo" / "used" / "SKILL.md"
+        skill_md.write_text(SKILL_MD.format(name="used") + "More text\n")
+        self.assertEqual(self.cycle(), [])
+        self.assertIs(self.watcher._index, index)
+
+    def test_index_is_rebuilt_when_directory_gains_entry(self):
+        data = json.loads(self.marketplace.read_text())
+        data["plugins"][0]["skills"].append("./skills/foo/new")
+        self.marketplace.write_text(json.dumps(data))
+        self.assertTrue(any("./skills/foo/new" in e for e in self.cycle()))
+        index = self.watcher._index
+
+        (self.root / "skills" / "foo" / "new").mkdir()
+        (self.root / "skills" / "foo" / "new" / "SKILL.md").write_text(SKILL_MD.format(name="new"))
+        self.assertEqual(self.cycle(), [])
+        self.assertIsNot(self.watcher._index, index)
+
+
+class ExpandPathsTest(unittest.TestCase):
+    """Glob arguments on the command line."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.marketplace = make_marketplace(self.root)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    @unittest.skipIf(sys.version_info < (3, 11), "include_hidden needs Python 3.11")
+    def test_recursive_glob_enters_dot_directories(self):
+        paths = validate_marketplace.expand_marketplace_paths([str(self.root / "**" / "marketplace.json")])
+        self.assertEqual(paths, [self.marketplace])
+
+    def test_pattern_without_matches_is_an_error(self):
+        result = subprocess.run(
+            [sys.executable, str(SCRIPT), "plugins/**/marketplace.json"],
+            cwd=self.root, capture_output=True, text=True, timeout=30,
+        )
+        self.assertEqual(result.returncode, 2)
+        self.assertIn("pattern matched no files: plugins/**/marketplace.json", result.stderr)
+        self.assertNotIn("File not found", result.stdout)
+
+
+class StreamReaderTest(unittest.TestCase):
+    """MarketplaceStreamReader must decode values split across reads."""
+
+    def test_numbers_split_across_chunks(self):
+        text = '{"version": 12345.5e-3, "plugins": [1e5, -42, {"n": 7}], "x": 10}'
+        for chunk_size in (1, 2, 3, 7):
+            with self.subTest(chunk_size=chunk_size):
+                reader = validate_marketplace.MarketplaceStreamReader(io.StringIO(text), chunk_size)
+                self.assertEqual(list(reader), [
+                    ("version", None, 12345.5e-3),
+                    ("plugins", None, []),
+                    ("plugins", 0, 1e5),
+                    ("plugins", 1, -42),
+                    ("plugins", 2, {"n": 7}),
+                    ("x", None, 10),
+                ])
+
+
+class ServeSocketTest(unittest.TestCase):
+    """Lifecycle of the socket file of --serve --socket."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.socket_path = Path(self._tmp.name) / "validate.sock"
+        self.servers = []
+
+    def tearDown(self):
+        for server in self.servers:
+            if server.poll() is None:
+                server.kill()
+                server.wait()
+        self._tmp.cleanup()
+
+    def start_server(self) -> subprocess.Popen:
+        server = subprocess.Popen(
+            [sys.executable, str(SCRIPT), "--serve", "--socket", str(self.socket_path)],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        )
+        self.servers.append(server)
+        return server
+
+    def wait_until_listening(self, server: subprocess.Popen) -> None:
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            self.assertIsNone(server.poll(), "server exited early")
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                try:
+                    probe.connect(str(self.socket_path))
+                    return
+                except OSError:
+                    time.sleep(0.05)
+        self.fail("server did not start listening")
+
+    def test_sigterm_removes_socket(self):
+        server = self.start_server()
+        self.wait_until_listening(server)
+        server.send_signal(signal.SIGTERM)
+        self.assertEqual(server.wait(10), 0)
+        self.assertFalse(os.path.lexists(self.socket_path))
+
+    def test_refuses_socket_of_running_server(self):
+        first = self.start_server()
+        self.wait_until_listening(first)
+        second = self.start_server()
+        self.assertEqual(second.wait(10), 2)
+        self.assertIn(b"another validation server", second.stderr.read())
+        # The first server keeps its socket
+        self.assertIsNone(first.poll())
+        self.wait_until_listening(first)
+
+    def test_replaces_stale_socket(self):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+            stale.bind(str(self.socket_path))
+        server = self.start_server()
+        self.wait_until_listening(server)
+        server.send_signal(signal.SIGTERM)
+        self.assertEqual(server.wait(10), 0)
+        self.assertFalse(os.path.lexists(self.socket_path))
+
+
+class ServerRequestTest(unittest.TestCase):
+    """A bad validate request must produce a response, not kill the server."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def validate(self, server, path: Path) -> dict:
+        request = {"jsonrpc": "2.0", "id": 1, "method": "validate", "params": {"path": str(path)}}
+        return json.loads(server.handle(json.dumps(request)))
+
+    def test_directory_is_reported_as_finding(self):
+        response = self.validate(validate_marketplace.ValidationServer(), self.root)
+        self.assertFalse(response["result"]["success"])
+        self.assertIn("Is a directory", response["result"]["errors"][0])
+
+    def test_non_utf8_file_is_reported_as_finding(self):
+        path = self.root / "marketplace.json"
+        path.write_bytes(b'{"name": "\xff"}')
+        response = self.validate(validate_marketplace.ValidationServer(), path)
+        self.assertFalse(response["result"]["success"])
+        self.assertIn("Cannot read", response["result"]["errors"][0])
+
+    def test_unexpected_exception_becomes_error_response(self):
+        original = validate_marketplace.MarketplaceWatcher.collect
+
+        def broken(watcher):
+            raise RuntimeError("boom")
+
+        validate_marketplace.MarketplaceWatcher.collect = broken
+        try:
+            response = self.validate(validate_marketplace.ValidationServer(), make_marketplace(self.root))
+        finally:
+            validate_marketplace.MarketplaceWatcher.collect = original
+        self.assertEqual(response["error"]["code"], validate_marketplace.ValidationServer.INTERNAL_ERROR)
+        self.assertIn("boom", response["error"]["message"])
+
+    def test_stdio_server_survives_bad_requests(self):
+        requests = [
+            {"jsonrpc": "2.0", "id": 1, "method": "validate", "params": {"path": str(self.root)}},
+            {"jsonrpc": "2.0", "id": 2, "method": "ping"},
+        ]
+        result = subprocess.run(
+            [sys.executable, str(SCRIPT), "--serve"],
+            input="".join(json.dumps(r) + "\n" for r in requests),
+            capture_output=True, text=True, timeout=30,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        responses = [json.loads(line) for line in result.stdout.splitlines()]
+        self.assertEqual([r["id"] for r in responses], [1, 2])
+        self.assertFalse(responses[0]["result"]["success"])
+        self.assertEqual(responses[1]["result"], "pong")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+Laravel Mail Scaffold Generator ベンチマーク
+
+generate_mail_scaffold.py の MailScaffoldGenerator を合成データで駆動し、
+スループット・段階ごとのレイテンシ（テンプレート読み込み / 置換 / 書き込み）・
+ピークメモリを計測します。結果は JSON に保存でき、別のコミットで計測した
+ベースラインと比較して性能の劣化を検出できます。
+
+使用方法:
+    # 既定のサイズ（1 / 100 / 10000 件）で計測
+    python3 benchmark_mail_scaffold.py
+
+    # サイズを指定して計測し、結果をベースラインとして保存
+    python3 benchmark_mail_scaffold.py --sizes 1,100 --save baseline.json
+
+    # ベースラインと比較（10% 以上劣化した指標があれば終了コード 1）
+    python3 benchmark_mail_scaffold.py --compare baseline.json --threshold 10
+"""
+
+import argparse
+import contextlib
+import json
+import math
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List
+
+from generate_mail_scaffold import (
+    CompiledTemplate,
+    GenerationManifest,
+    MailScaffoldGenerator,
+    MailSpec,
+    ScaffoldTransaction,
+    TemplateCache,
+)
+
+# 置換ステージで計測するレンダラー
+RENDERERS = [
+    '_generate_mailable',
+    '_generate_notification',
+    '_generate_test',
+    '_generate_twig_html',
+    '_generate_twig_text',
+    '_generate_virtual_resource_html',
+    '_generate_virtual_resource_text',
+]
+
+# end-to-end 実行中に計測する段階（1 件あたりの所要時間として報告する）
+STAGES = ['plan', 'template_load', 'substitution', 'write', 'manifest']
+
+# 指標名の接尾辞ごとの良し悪しの向き（True: 大きいほど良い）
+HIGHER_IS_BETTER = {
+    'per_sec': True,
+    '_ms': False,
+    '_us': False,
+    '_mb': False,
+}
+
+
+def synthetic_specs(count: int) -> List[MailSpec]:
+    """合成データのメール指定を作成する（受信者タイプは順番に割り当てる）"""
+    recipients = MailScaffoldGenerator.RECIPIENT_TYPES
+    return [
+        MailSpec(
+            name=f'Benchmark{i:05d}Notified',
+            model=f'BenchModel{i % 17}',
+            recipient=recipients[i % len(recipients)],
+        )
+        for i in range(count)
+    ]
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """サンプルのパーセンタイル値を求める（最近傍法）"""
+    ordered = sorted(samples)
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def measure(fn: Callable[[], None], repeat: int) -> List[float]:
+    """fn を repeat 回実行し、1 回あたりの所要時間（秒）のリストを返す"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def bench_template_load(generator: MailScaffoldGenerator, repeat: int) -> Dict[str, float]:
+    """テンプレート読み込み（キャッシュなし / キャッシュ済み）の所要時間を計測する"""
+    relative_paths = [
+        'mailable-template.php',
+        'notification-template.php',
+        'mail-test-template.php',
+        'twig/email-template.twig',
+        'twig/email-template_plain.twig',
+        'twig/virtual_resource_override.twig',
+        'twig/virtual_resource_override_plain.twig',
+    ]
+
+    def cold() -> None:
+        cache = TemplateCache(generator.templates_dir, generator.engine)
+        for relative_path in relative_paths:
+            cache.get(relative_path)
+
+    warm_cache = TemplateCache(generator.templates_dir, generator.engine)
+    cold_samples = measure(cold, repeat)
+    warm_samples = measure(lambda: [warm_cache.get(p) for p in relative_paths], repeat)
+
+    return {
+        'cold_all_templates_ms': statistics.median(cold_samples) * 1000,
+        'warm_all_templates_us': statistics.median(warm_samples) * 1_000_000,
+    }
+
+
+def bench_substitution(generator: MailScaffoldGenerator, repeat: int) -> Dict[str, Dict[str, float]]:
+    """受信者タイプごとに各レンダラーの置換時間を計測する"""
+    results = {}
+    for recipient in MailScaffoldGenerator.RECIPIENT_TYPES:
+        replacements = generator._create_replacements('BenchmarkNotified', 'Application', recipient)
+        for renderer in RENDERERS:
+            fn = getattr(generator, renderer)
+            fn(replacements)  # テンプレートをキャッシュに載せる
+            samples = measure(lambda: fn(replacements), repeat)
+            results[f'{renderer}[{recipient}]'] = {
+                'p50_us': statistics.median(samples) * 1_000_000,
+                'p95_us': percentile(samples, 95) * 1_000_000,
+            }
+    return results
+
+
+def bench_write(generator: MailScaffoldGenerator, root: Path, repeat: int) -> Dict[str, float]:
+    """1 件分（最大 7 ファイル）の書き込み時間を計測する"""
+    files = generator.render(synthetic_specs(1)[0])
+    samples = []
+    for i in range(repeat):
+        project_root = root / f'write-{i}'
+        targets = generator._targets(project_root, files)
+        start = time.perf_counter()
+        with ScaffoldTransaction('overwrite') as transaction:
+            transaction.stage(targets)
+            transaction.commit()
+        samples.append(time.perf_counter() - start)
+    return {
+        'per_mailable_p50_ms': statistics.median(samples) * 1000,
+        'per_mailable_p95_ms': percentile(samples, 95) * 1000,
+        'per_file_p50_us': statistics.median(samples) / len(files) * 1_000_000,
+    }
+
+
+class StageTimer:
+    """
+    end-to-end 実行中の段階ごとの所要時間を集計する
+
+    計測対象のメソッドを patch() の間だけ計時付きのものに差し替えます
+    （並列生成時も集計できるよう、加算はロックで保護します）。
+    """
+
+    def __init__(self):
+        self.totals: Dict[str, float] = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def wrap(self, stage: str, fn: Callable) -> Callable:
+        """fn の所要時間を stage に加算するラッパーを返す"""
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    self.totals[stage] += elapsed
+        return timed
+
+    @contextlib.contextmanager
+    def patch(self, generator: MailScaffoldGenerator) -> Iterator[None]:
+        """
+        衝突計画・テンプレート読み込み・置換・書き込み・生成マニフェストの保存を計時する
+
+        書き込みは一時ファイルの書き出し（prepare）とリネームによる確定（commit）の合計です。
+        """
+        class_patches = [
+            (CompiledTemplate, 'render', 'substitution'),
+            (ScaffoldTransaction, 'prepare', 'write'),
+            (ScaffoldTransaction, 'commit', 'write'),
+            (GenerationManifest, 'save', 'manifest'),
+        ]
+        originals = [(owner, name, getattr(owner, name)) for owner, name, _ in class_patches]
+        for owner, name, stage in class_patches:
+            setattr(owner, name, self.wrap(stage, getattr(owner, name)))
+        generator.template_cache.get = self.wrap('template_load', generator.template_cache.get)
+        generator.plan = self.wrap('plan', generator.plan)
+        try:
+            yield
+        finally:
+            for owner, name, original in originals:
+                setattr(owner, name, original)
+            del generator.template_cache.get
+            del generator.plan
+
+
+def bench_end_to_end(generator: MailScaffoldGenerator, root: Path, count: int, mode: str, workers: int) -> Dict[str, float]:
+    """
+    generate() / generate_batch() で count 件を生成し、スループットとピークメモリを計測する
+
+    tracemalloc は処理を大きく遅くするため、スループットの計測とピークメモリの計測は
+    別々に実行します。段階ごとのレイテンシ（1 件あたり）はスループットの計測時に集計します。
+
+    generate() は呼び出しごとにプロジェクトの生成マニフェストを書き直すため、
+    'generate' では 1 件ごとに別のプロジェクトルートを使います（同じルートに書き込むと、
+    件数に比例して大きくなるマニフェストの書き直しが計測の大半を占めてしまうため）。
+
+    Args:
+        mode: 'generate'（1 件ずつ generate() を呼ぶ）または 'batch'（generate_batch() でまとめて生成）
+    """
+    specs = synthetic_specs(count)
+
+    def run(project_root: Path) -> None:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+            if mode == 'generate':
+                for i, spec in enumerate(specs):
+                    generator.generate(
+                        name=spec.name,
+                        model=spec.model,
+                        recipient=spec.recipient,
+                        project_root=project_root / f'{i:05d}',
+                        overwrite='overwrite',
+                        workers=workers,
+                        output='summary',
+                    )
+            else:
+                with ScaffoldTransaction('overwrite', workers) as transaction:
+                    for _ in generator.generate_batch(specs, project_root, transaction, workers):
+                        pass
+                    transaction.commit()
+
+    timer = StageTimer()
+    with timer.patch(generator):
+        start = time.perf_counter()
+        run(root / f'{mode}-{count}')
+        elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    run(root / f'{mode}-{count}-memory')
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    results = {
+        'elapsed_ms': elapsed * 1000,
+        'mailables_per_sec': count / elapsed,
+        'peak_memory_mb': peak / (1024 * 1024),
+    }
+    for stage in STAGES:
+        results[f'{stage}_us'] = timer.totals[stage] / count * 1_000_000
+    return results
+
+
+def run_benchmarks(args: argparse.Namespace) -> Dict:
+    """すべてのベンチマークを実行して結果を返す"""
+    skill_dir = Path(__file__).resolve().parent.parent
+    generator = MailScaffoldGenerator(skill_dir)
+
+    results: Dict = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'sizes': args.sizes,
+            'workers': args.jobs,
+        },
+        'template_load': bench_template_load(generator, args.repeat),
+        'substitution': bench_substitution(generator, args.repeat),
+        'write': {},
+        'end_to_end': {},
+    }
+
+    for label, base_dir in targets(args):
+        root = Path(tempfile.mkdtemp(prefix='mail-scaffold-bench-', dir=base_dir))
+        try:
+            results['write'][label] = bench_write(generator, root, max(1, args.repeat // 10))
+            for count in args.sizes:
+                for mode in ('generate', 'batch'):
+                    if mode == 'generate' and count > args.max_generate:
+                        continue
+                    key = f'{label}/{mode}/{count}'
+                    print(f"  running {key} ...", file=sys.stderr, flush=True)
+                    results['end_to_end'][key] = bench_end_to_end(generator, root, count, mode, args.jobs)
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    return results
+
+
+def targets(args: argparse.Namespace) -> List:
+    """書き込み先（ラベル, ディレクトリ）の一覧"""
+    result = []
+    if args.tmpfs_dir and Path(args.tmpfs_dir).is_dir():
+        result.append(('tmpfs', args.tmpfs_dir))
+    else:
+        print(f"tmpfs ディレクトリが見つからないためスキップします: {args.tmpfs_dir}", file=sys.stderr)
+    result.append(('disk', args.disk_dir))
+    return result
+
+
+def flatten(results: Dict, prefix: str = '') -> Dict[str, float]:
+    """ネストした結果を 'a.b.c' 形式のキーに展開する（meta は除く）"""
+    flat = {}
+    for key, value in results.items():
+        if key == 'meta' and not prefix:
+            continue
+        name = f'{prefix}.{key}' if prefix else key
+        if isinstance(value, dict):
+            flat.update(flatten(value, name))
+        elif isinstance(value, (int, float)):
+            flat[name] = float(value)
+    return flat
+
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """
+    ベースラインと比較し、threshold（%）以上劣化した指標を返す
+    """
+    regressions = []
+    base = flatten(baseline)
+    print(f"\n{'metric':<70} {'baseline':>12} {'current':>12} {'change':>9}")
+    for name, value in sorted(flatten(current).items()):
+        if name not in base or base[name] == 0:
+            continue
+        higher_is_better = next((v for suffix, v in HIGHER_IS_BETTER.items() if name.endswith(suffix)), False)
+        change = (value - base[name]) / base[name] * 100
+        worse = -change if higher_is_better else change
+        marker = ' ❌' if worse >= threshold else ''
+        print(f"{name:<70} {base[name]:>12.2f} {value:>12.2f} {change:>+8.1f}%{marker}")
+        if worse >= threshold:
+            regressions.append(name)
+    return regressions
+
+
+def print_report(results: Dict) -> None:
+    """結果を表形式で出力する"""
+    print("=" * 80)
+    print("Mail Scaffold Benchmark")
+    print("=" * 80)
+
+    print("\n[template load]")
+    for name, value in results['template_load'].items():
+        print(f"  {name:<40} {value:>12.2f}")
+
+    print("\n[substitution]")
+    for name, metrics in results['substitution'].items():
+        print(f"  {name:<60} p50 {metrics['p50_us']:>8.1f} us  p95 {metrics['p95_us']:>8.1f} us")
+
+    print("\n[write]")
+    for label, metrics in results['write'].items():
+        for name, value in metrics.items():
+            print(f"  {label:<6} {name:<30} {value:>12.2f}")
+
+    print("\n[end to end]")
+    print(f"  {'scenario':<28} {'elapsed ms':>12} {'mailables/s':>12} {'peak MB':>9}")
+    for key, metrics in results['end_to_end'].items():
+        print(
+            f"  {key:<28} {metrics['elapsed_ms']:>12.1f} "
+            f"{metrics['mailables_per_sec']:>12.1f} {metrics['peak_memory_mb']:>9.2f}"
+        )
+
+    print("\n[stages per mailable, us]")
+    print(f"  {'scenario':<28}" + ''.join(f" {stage:>13}" for stage in STAGES))
+    for key, metrics in results['end_to_end'].items():
+        print(f"  {key:<28}" + ''.join(f" {metrics.get(f'{stage}_us', 0.0):>13.1f}" for stage in STAGES))
+
+
+def parse_sizes(value: str) -> List[int]:
+    """カンマ区切りのサイズ指定を解釈する"""
+    try:
+        sizes = [int(part) for part in value.split(',') if part.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid sizes: {value}")
+    if not sizes or any(size < 1 for size in sizes):
+        raise argparse.ArgumentTypeError(f"invalid sizes: {value}")
+    return sizes
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='MailScaffoldGenerator のベンチマークを実行します',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--sizes', type=parse_sizes, default=[1, 100, 10000],
+                        help='生成するメール件数（カンマ区切り、既定: 1,100,10000）')
+    parser.add_argument('--max-generate', type=int, default=10000,
+                        help='generate() を 1 件ずつ呼ぶシナリオを実行する最大件数（既定: 10000）')
+    parser.add_argument('--repeat', type=int, default=200,
+                        help='レイテンシ計測の繰り返し回数（既定: 200）')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='生成と書き込みに使うスレッド数（既定: 1）')
+    parser.add_argument('--tmpfs-dir', default='/dev/shm',
+                        help='tmpfs 上の書き込み先ディレクトリ（既定: /dev/shm）')
+    parser.add_argument('--disk-dir', default=tempfile.gettempdir(),
+                        help=f'ディスク上の書き込み先ディレクトリ（既定: {tempfile.gettempdir()}）')
+    parser.add_argument('--save', type=Path, help='結果を JSON で保存するパス')
+    parser.add_argument('--compare', type=Path, help='比較するベースライン JSON')
+    parser.add_argument('--threshold', type=float, default=10.0,
+                        help='劣化とみなす変化率（%%、既定: 10）')
+    args = parser.parse_args()
+
+    results = run_benchmarks(args)
+    print_report(results)
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2, ensure_ascii=False) + '\n')
+        print(f"\n結果を保存しました: {args.save}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} 件の指標が {args.threshold}% 以上劣化しました")
+            sys.exit(1)
+        print("\n✅ ベースラインからの劣化はありません")
+
+
+if __name__ == '__main__':
+    main()
@@ -11,15 +11,1092 @@ Laravel Mail Scaffold Generator
     # コマンドラインモード
     python3 generate_mail_scaffold.py --name JobofferApplied --model Application --recipient consumer
 
+    # マニフェストモード（JSON / CSV に列挙した複数のメールを一括生成）
+    python3 generate_mail_scaffold.py --manifest mails.csv --project-root /path/to/project
+
+    # アーカイブ出力（生成したファイルを 1 つの tar / zip にまとめる。"-" で標準出力）
+    python3 generate_mail_scaffold.py --manifest mails.csv --archive - | docker cp - container:/var/www
+
+    # 再生成（テンプレートを更新した後、影響のある生成済みファイルだけを生成し直す）
+    python3 generate_mail_scaffold.py --regenerate --project-root /path/to/project
+
     # ヘルプ
     python3 generate_mail_scaffold.py --help
 """
 
 import argparse
+import csv
+import hashlib
+import io
+import json
 import os
+import re
+import shutil
 import sys
+import tarfile
+import tempfile
+import threading
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Collection, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+
+# マニフェストの flags 列で指定できるフラグと MailSpec の属性の対応
+MANIFEST_FLAGS = {
+    'no-notification': 'generate_notification',
+    'no-test': 'generate_test',
+    'no-twig': 'generate_twig',
+    'no-virtual-resource': 'generate_virtual_resource',
+}
+
+
+# 生成結果の出力形式
+OUTPUT_MODES = ['full', 'summary', 'json']
+
+# 既存ファイルと衝突したときの扱い
+OVERWRITE_POLICIES = ['prompt', 'skip', 'overwrite', 'fail']
+
+# アーカイブ出力の形式
+ARCHIVE_FORMATS = ['tar', 'tgz', 'zip']
+
+# プロジェクトに書き込んだファイルの生成元を記録するファイル（プロジェクトのルート直下）
+GENERATION_MANIFEST_NAME = '.mail-scaffold.json'
+
+
+# テンプレート中のプレースホルダー（_create_replacements はこれらをキーとする置換マップを返す）
+PLACEHOLDERS = (
+    'YourMailableNameTest',
+    'YourMailableName',
+    'YourNotificationName',
+    'YourModel',
+    '$model',
+    'seedModel',
+    'to_consumer',
+    'your_template',
+)
+
+# 置換マップにないが、プレースホルダーらしく見える文字列（未置換として報告する）
+_PLACEHOLDER_LIKE_PATTERN = re.compile(r'\bYour[A-Z]\w*|\byour_\w+')
+
+
+@dataclass
+class SubstitutionReport:
+    """置換結果の報告"""
+
+    # 置換マップにあるがテンプレートに現れなかったプレースホルダー
+    unused: Tuple[str, ...] = ()
+    # テンプレートに残ったまま置換されなかったプレースホルダー
+    unmatched: Tuple[str, ...] = ()
+
+
+@dataclass
+class CompiledTemplate:
+    """
+    プレースホルダー位置で分割済みのテンプレート
+
+    literals[0] + slots[0] + literals[1] + ... + literals[-1] が元のテキストになる。
+    unknown はリテラル部分に残ったプレースホルダーらしき文字列。
+    sha256 は元のテンプレートファイルのハッシュ（TemplateCache で読み込んだ場合のみ）。
+    """
+
+    literals: Tuple[str, ...]
+    slots: Tuple[str, ...]
+    unknown: Tuple[str, ...] = ()
+    sha256: str = ''
+
+    def render(self, replacements: Dict[str, str]) -> Tuple[str, SubstitutionReport]:
+        """
+        slots を置換マップの値で埋めて連結する（1 パス）
+
+        置換マップにないプレースホルダーはそのまま残し、unmatched として報告します。
+        """
+        parts = [self.literals[0]]
+        missing = set()
+        for slot, literal in zip(self.slots, self.literals[1:]):
+            value = replacements.get(slot)
+            if value is None:
+                missing.add(slot)
+                value = slot
+            parts.append(value)
+            parts.append(literal)
+
+        used = set(self.slots)
+        report = SubstitutionReport(
+            unused=tuple(sorted(p for p in replacements if p not in used)),
+            unmatched=tuple(sorted(missing.union(self.unknown))),
+        )
+        return ''.join(parts), report
+
+
+class SubstitutionEngine:
+    """
+    プレースホルダーを 1 パスで置換するエンジン
+
+    すべてのプレースホルダーを 1 つの正規表現にまとめ、長いものから順に照合します。
+    'YourMailableNameTest' と 'YourMailableName' のように前方一致するものがあっても、
+    置換結果が再び照合されることはないため、追加順序に関係なく出力は決定的です。
+    """
+
+    def __init__(self, placeholders: Iterable[str]):
+        """
+        Args:
+            placeholders: 置換対象のプレースホルダー
+        """
+        # 長さの降順、同じ長さなら辞書順で並べる（正規表現の選択は先勝ちのため）
+        self.placeholders = tuple(sorted(set(placeholders), key=lambda p: (-len(p), p)))
+        self._pattern = re.compile('(' + '|'.join(re.escape(p) for p in self.placeholders) + ')')
+
+    def compile(self, text: str) -> CompiledTemplate:
+        """テンプレートをプレースホルダー位置で分割する"""
+        parts = self._pattern.split(text)
+        literals = tuple(parts[0::2])
+        unknown = {m.group(0) for literal in literals for m in _PLACEHOLDER_LIKE_PATTERN.finditer(literal)}
+        return CompiledTemplate(literals, tuple(parts[1::2]), tuple(sorted(unknown)))
+
+    def substitute(self, text: str, replacements: Dict[str, str]) -> Tuple[str, SubstitutionReport]:
+        """テキストをコンパイルして置換する（キャッシュを介さない場合用）"""
+        return self.compile(text).render(replacements)
+
+
+class TemplateCache:
+    """
+    templates_dir 配下のテンプレートをコンパイル済みの状態で保持するキャッシュ
+
+    各エントリはファイルの mtime / サイズで検証し、変更されていれば読み直します。
+    cache_file を指定すると、コンパイル結果をディスクに保存して次回以降の実行で再利用します。
+    """
+
+    VERSION = 3
+
+    def __init__(self, templates_dir: Path, engine: SubstitutionEngine, cache_file: Optional[Path] = None):
+        """
+        Args:
+            templates_dir: テンプレートのディレクトリ
+            engine: テンプレートのコンパイルに使う置換エンジン
+            cache_file: コンパイル結果を永続化するファイル（Noneの場合はメモリのみ）
+        """
+        self.templates_dir = templates_dir
+        self.engine = engine
+        self.cache_file = cache_file
+        self._entries: Dict[str, Tuple[int, int, CompiledTemplate]] = {}
+        self._dirty = False
+
+        if cache_file:
+            self._load_cache_file()
+
+    def get(self, relative_path: str) -> CompiledTemplate:
+        """コンパイル済みテンプレートを取得する（未読込・変更済みの場合は読み込み直す）"""
+        path = self.templates_dir / relative_path
+        st = path.stat()
+
+        entry = self._entries.get(relative_path)
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return entry[2]
+
+        data = path.read_bytes()
+        compiled = self.engine.compile(data.decode('utf-8'))
+        compiled.sha256 = hashlib.sha256(data).hexdigest()
+        self._entries[relative_path] = (st.st_mtime_ns, st.st_size, compiled)
+        self._dirty = True
+        return compiled
+
+    def save(self) -> None:
+        """コンパイル結果を cache_file に書き出す（変更がない場合は何もしない）"""
+        if not self.cache_file or not self._dirty:
+            return
+
+        data = {
+            'version': self.VERSION,
+            'templates_dir': str(self.templates_dir.resolve()),
+            'placeholders': list(self.engine.placeholders),
+            'templates': {
+                relative_path: {
+                    'mtime_ns': mtime_ns,
+                    'size': size,
+                    'literals': list(compiled.literals),
+                    'slots': list(compiled.slots),
+                    'unknown': list(compiled.unknown),
+                    'sha256': compiled.sha256,
+                }
+                for relative_path, (mtime_ns, size, compiled) in sorted(self._entries.items())
+            },
+        }
+
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_file.with_name(self.cache_file.name + '.tmp')
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False))
+        os.replace(tmp_path, self.cache_file)
+        self._dirty = False
+
+    def _load_cache_file(self) -> None:
+        """cache_file を読み込む（壊れている・条件が異なる場合は無視する）"""
+        try:
+            data = json.loads(self.cache_file.read_text())
+        except (OSError, ValueError):
+            return
+
+        if (
+            not isinstance(data, dict)
+            or data.get('version') != self.VERSION
+            or data.get('templates_dir') != str(self.templates_dir.resolve())
+            or data.get('placeholders') != list(self.engine.placeholders)
+        ):
+            return
+
+        for relative_path, entry in data.get('templates', {}).items():
+            try:
+                compiled = CompiledTemplate(
+                    tuple(entry['literals']), tuple(entry['slots']), tuple(entry['unknown']), entry['sha256']
+                )
+                self._entries[relative_path] = (entry['mtime_ns'], entry['size'], compiled)
+            except (KeyError, TypeError):
+                continue
+
+
+@dataclass
+class MailSpec:
+    """生成するメール 1 件分の指定"""
+
+    name: str
+    model: str
+    recipient: str
+    generate_notification: bool = True
+    generate_test: bool = True
+    generate_twig: bool = True
+    generate_virtual_resource: bool = True
+
+
+@dataclass
+class GeneratedFile:
+    """生成されたファイル 1 件（relative_path は server/ からの相対パス）"""
+
+    label: str
+    relative_path: str
+    content: str
+    report: SubstitutionReport = field(default_factory=SubstitutionReport)
+    # 生成元のテンプレート（templates_dir からの相対パス）とそのハッシュ
+    template: str = ''
+    template_sha256: str = ''
+
+
+@dataclass
+class BatchResult:
+    """バッチ生成における 1 行分の結果"""
+
+    spec: MailSpec
+    files: List[GeneratedFile] = field(default_factory=list)
+    error: Optional[str] = None
+    # transaction に登録する一時ファイル（generate_batch 内部で使用）
+    staged: List['StagedFile'] = field(default_factory=list)
+
+
+def _serial_map(fn: Callable, items: List) -> List:
+    """items の各要素に fn を順番に適用する"""
+    return [fn(item) for item in items]
+
+
+@dataclass
+class StagedFile:
+    """トランザクションに登録された書き込み 1 件"""
+
+    target: Path
+    # 'created' / 'overwritten' / 'skipped' / 'unchanged' / 'archived'
+    status: str
+    # 生成した内容のバイト数と SHA-256
+    size: int = 0
+    sha256: str = ''
+    temp_path: Optional[Path] = None
+    # 上書き前の内容（ロールバック用）
+    previous: Optional[bytes] = None
+
+
+class ScaffoldPlan:
+    """
+    書き込み先の衝突を生成前にまとめて求めた計画
+
+    書き込み先のディレクトリ（app/Mail、resources/views/emails/to_* など）ごとに
+    os.scandir を 1 回だけ行い、既存ファイルとの衝突をファイルごとの stat なしで
+    判定します。resolve() で overwrite ポリシーを適用すると、書き込まないファイルが
+    skipped に入ります（呼び出し側はそれらを生成しません）。
+
+    既存ファイルのうち生成内容と同じもの（unchanged）は衝突とみなしません
+    （MailScaffoldGenerator.plan() に skip_unchanged を指定した場合に判定されます）。
+    """
+
+    def __init__(self, root: Path, relative_paths: Iterable[str]):
+        """
+        Args:
+            root: 相対パスの基準ディレクトリ（<project-root>/server）
+            relative_paths: 書き込み先の root からの相対パス
+
+        Raises:
+            OSError: ディレクトリを読み込めない場合（存在しない場合を除く）
+        """
+        self.root = root
+        self.targets: List[str] = list(dict.fromkeys(relative_paths))
+        self.existing: Set[str] = set()
+        self.unchanged: Set[str] = set()
+        self.skipped: Set[str] = set()
+        self._paths: Dict[Path, str] = {root / relative_path: relative_path for relative_path in self.targets}
+
+        listings: Dict[Path, Set[str]] = {}
+        for path, relative_path in self._paths.items():
+            directory = path.parent
+            if directory not in listings:
+                try:
+                    with os.scandir(directory) as entries:
+                        listings[directory] = {entry.name for entry in entries}
+                except (FileNotFoundError, NotADirectoryError):
+                    listings[directory] = set()
+            if path.name in listings[directory]:
+                self.existing.add(relative_path)
+        self.directories = len(listings)
+
+    @property
+    def conflicts(self) -> List[str]:
+        """既存ファイルと衝突する書き込み先（計画順。内容が同じものは除く）"""
+        return [
+            relative_path for relative_path in self.targets
+            if relative_path in self.existing and relative_path not in self.unchanged
+        ]
+
+    def covers(self, target: Path) -> bool:
+        """target がこの計画の書き込み先か"""
+        return target in self._paths
+
+    def exists(self, target: Path) -> bool:
+        """計画時の走査で target が存在したか"""
+        return self._paths.get(target) in self.existing
+
+    def resolve(self, policy: str, stream=None) -> None:
+        """
+        衝突に overwrite ポリシーを適用し、書き込まないファイルを決める
+
+        prompt の場合は衝突の一覧を 1 回だけ表示し、まとめて上書き・スキップするか、
+        1 件ずつ確認するかを選ばせます。
+
+        Args:
+            policy: 既存ファイルと衝突したときの扱い（prompt/skip/overwrite/fail）
+            stream: 一覧と確認の出力先（Noneの場合は標準出力）
+
+        Raises:
+            FileExistsError: policy が 'fail' で既存ファイルと衝突した場合
+        """
+        conflicts = self.conflicts
+        if not conflicts or policy == 'overwrite':
+            return
+        if policy == 'fail':
+            raise FileExistsError(
+                "既存ファイルと衝突しました: " + ', '.join(str(self.root / relative_path) for relative_path in conflicts)
+            )
+        if policy == 'skip':
+            self.skipped.update(conflicts)
+            return
+
+        stream = stream or sys.stdout
+        print(f"\n既存ファイルと衝突する書き込み先が {len(conflicts)} 件あります:", file=stream)
+        for relative_path in conflicts:
+            print(f"  {self.root / relative_path}", file=stream)
+        print("上書きしますか？ (a: すべて上書き / i: 1 件ずつ確認 / N: すべてスキップ): ", end='', file=stream, flush=True)
+        response = input().strip().lower()
+        if response == 'a':
+            return
+        if response != 'i':
+            self.skipped.update(conflicts)
+            return
+        for relative_path in conflicts:
+            print(f"{self.root / relative_path} を上書きしますか？ (y/N): ", end='', file=stream, flush=True)
+            if input().strip().lower() != 'y':
+                self.skipped.add(relative_path)
+
+    def skipped_files(self) -> List[StagedFile]:
+        """書き込まないファイルの書き込み結果（内容は生成しないため size / sha256 は空）"""
+        return [
+            StagedFile(self.root / relative_path, 'skipped')
+            for relative_path in self.targets if relative_path in self.skipped
+        ]
+
+    def describe(self, policy: str = 'overwrite') -> List[str]:
+        """
+        計画を人が読める行のリストにする
+
+        Args:
+            policy: 表示に使う overwrite ポリシー（overwrite 以外では未解決の衝突を「衝突」と表示する）
+        """
+        lines = []
+        for relative_path in self.targets:
+            if relative_path in self.skipped:
+                action = 'スキップ'
+            elif relative_path in self.unchanged:
+                action = '変更なし'
+            elif relative_path in self.existing:
+                action = '上書き' if policy == 'overwrite' else '衝突'
+            else:
+                action = '作成'
+            lines.append(f"{action}: {self.root / relative_path}")
+        created = len(self.targets) - len(self.existing)
+        lines.append(
+            f"\n計画: {len(self.targets)} ファイル（作成 {created} / 衝突 {len(self.conflicts)} / "
+            f"変更なし {len(self.unchanged)} / スキップ {len(self.skipped)}）、"
+            f"走査したディレクトリ {self.directories}"
+        )
+        return lines
+
+
+class ScaffoldTransaction:
+    """
+    複数ファイルの書き込みをまとめて確定するトランザクション
+
+    stage() は内容を書き込み先と同じディレクトリの一時ファイルに書き出すだけで、
+    commit() で初めて os.replace によるアトミックなリネームを行います。
+    途中で失敗した場合は rollback() で一時ファイルを削除し、確定済みのファイルも
+    元の状態に戻すため、Mailable だけが作られて Notification がない、といった
+    中途半端な状態は残りません。
+
+    workers に 2 以上を指定すると、存在確認・一時ファイルの書き出し・リネームを
+    その数を上限とするスレッドプールで並列に行います（ネットワークマウント先など
+    I/O のレイテンシが大きい場合向け）。結果の順序は登録順のまま変わりません。
+
+    skip_unchanged を指定すると、既存ファイルと生成内容の SHA-256 を比較し、
+    同じであればファイルに一切触れません（mtime が変わらないため、opcache や
+    Docker レイヤーなど mtime に依存するキャッシュを無効化しません）。
+
+    plan を渡すと、計画に含まれる書き込み先はファイルごとの存在確認を省き、
+    計画時の走査結果を使います。計画の衝突は resolve() で扱いが決まっているため、
+    policy による確認やスキップは計画に含まれない書き込み先にだけ適用されます。
+    """
+
+    def __init__(
+        self,
+        policy: str = 'prompt',
+        workers: int = 1,
+        skip_unchanged: bool = False,
+        plan: Optional[ScaffoldPlan] = None,
+    ):
+        """
+        Args:
+            policy: 既存ファイルと衝突したときの扱い（prompt/skip/overwrite/fail）
+            workers: ファイル I/O に使うスレッド数
+            skip_unchanged: 既存ファイルと内容が同じ場合は衝突とみなさず、書き込まない
+            plan: resolve() 済みの衝突計画
+        """
+        if policy not in OVERWRITE_POLICIES:
+            raise ValueError(f"policy must be one of: {', '.join(OVERWRITE_POLICIES)}")
+        if workers < 1:
+            raise ValueError("workers must be 1 or greater")
+
+        self.policy = policy
+        self.workers = workers
+        self.skip_unchanged = skip_unchanged
+        self.plan = plan
+        self.staged: List[StagedFile] = []
+        self._created_dirs: List[Path] = []
+        self._dirs_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._closed = False
+        # 一時ファイルは 0600 で作られるため、通常の作成と同じパーミッションに揃える
+        umask = os.umask(0)
+        os.umask(umask)
+        self._file_mode = 0o666 & ~umask
+
+    def __enter__(self) -> 'ScaffoldTransaction':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if not self._closed:
+            self.rollback()
+
+    def stage(self, files: List[Tuple[Path, str]]) -> List[StagedFile]:
+        """
+        書き込み内容を一時ファイルに書き出してトランザクションに登録する
+
+        Args:
+            files: (書き込み先, 内容) のリスト
+
+        Returns:
+            登録された書き込みのリスト
+
+        Raises:
+            FileExistsError: policy が 'fail' で既存ファイルと衝突した場合
+        """
+        staged = self.prepare(files)
+        self.record(staged)
+        return staged
+
+    def prepare(self, files: List[Tuple[Path, str]], parallel: bool = True) -> List[StagedFile]:
+        """
+        書き込み内容を一時ファイルに書き出す（トランザクションへの登録は record() で行う）
+
+        衝突の判定をすべて済ませてからディレクトリをまとめて作成し、
+        その後で一時ファイルを書き出します。複数のスレッドから同時に呼び出せます。
+
+        Args:
+            files: (書き込み先, 内容) のリスト
+            parallel: ファイル I/O をスレッドプールで並列に行うか
+                      （呼び出し元がすでにワーカースレッドの場合は False を指定する）
+
+        Returns:
+            一時ファイルに書き出した書き込みのリスト（files と同じ順序）
+
+        Raises:
+            FileExistsError: policy が 'fail' で既存ファイルと衝突した場合
+        """
+        run = self._map if parallel else _serial_map
+
+        # 内容は一度だけエンコードし、サイズとハッシュもここで求める
+        encoded = [(target, content.encode('utf-8')) for target, content in files]
+        digests = {target: hashlib.sha256(data).hexdigest() for target, data in encoded}
+
+        def check_existing(item: Tuple[Path, bytes]) -> Optional[str]:
+            target, data = item
+            if self.plan is not None and self.plan.covers(target):
+                # 計画時の走査結果を使い、ファイルごとの stat を省く
+                if not self.plan.exists(target):
+                    return None
+                if not self.skip_unchanged:
+                    return 'conflict'
+            try:
+                st = target.stat()
+            except FileNotFoundError:
+                return None
+            # 内容が同じ既存ファイルには触れない（mtime も更新しない）
+            if (
+                self.skip_unchanged
+                and st.st_size == len(data)
+                and hashlib.sha256(target.read_bytes()).hexdigest() == digests[target]
+            ):
+                return 'unchanged'
+            return 'conflict'
+
+        states = dict(zip((target for target, _ in encoded), run(check_existing, encoded)))
+        unchanged = {target for target, state in states.items() if state == 'unchanged'}
+        conflicts = [target for target, _ in encoded if states[target] == 'conflict']
+        # 計画に含まれる衝突は resolve() で上書きが決まっている
+        unplanned = [target for target in conflicts if self.plan is None or not self.plan.covers(target)]
+        if unplanned and self.policy == 'fail':
+            raise FileExistsError(
+                "既存ファイルと衝突しました: " + ', '.join(str(target) for target in unplanned)
+            )
+
+        skipped = set()
+        if self.policy == 'skip':
+            skipped.update(unplanned)
+        elif self.policy == 'prompt':
+            for target in unplanned:
+                response = input(f"\n{target} は既に存在します。上書きしますか？ (y/N): ")
+                if response.lower() != 'y':
+                    skipped.add(target)
+
+        self._make_dirs({target.parent for target, _ in encoded if target not in skipped and target not in unchanged})
+
+        conflicts = set(conflicts)
+
+        def prepare_one(item: Tuple[Path, bytes]) -> Union[StagedFile, OSError]:
+            target, data = item
+            staged = StagedFile(target, 'skipped', len(data), digests[target])
+            try:
+                if target in unchanged:
+                    staged.status = 'unchanged'
+                    return staged
+                if target in skipped:
+                    return staged
+                if target in conflicts:
+                    staged.status = 'overwritten'
+                    staged.previous = target.read_bytes()
+                else:
+                    staged.status = 'created'
+                staged.temp_path = self._write_temp(target, data)
+                return staged
+            except OSError as e:
+                return e
+
+        results = run(prepare_one, encoded)
+        errors = [result for result in results if isinstance(result, OSError)]
+        if errors:
+            # 書き出し済みの一時ファイルを片付けてから失敗を伝える
+            self._discard([result for result in results if isinstance(result, StagedFile)])
+            raise errors[0]
+        return results
+
+    def record(self, staged: List[StagedFile]) -> None:
+        """prepare() で書き出した書き込みを登録する（commit() はこの順序で確定する）"""
+        self.staged.extend(staged)
+
+    def commit(self) -> List[StagedFile]:
+        """
+        一時ファイルを書き込み先にリネームして確定する
+
+        Returns:
+            登録されたすべての書き込み
+        """
+        pending = [staged for staged in self.staged if staged.temp_path is not None]
+
+        def replace(staged: StagedFile) -> Optional[OSError]:
+            try:
+                os.replace(staged.temp_path, staged.target)
+            except OSError as e:
+                return e
+            staged.temp_path = None
+            return None
+
+        errors = [error for error in self._map(replace, pending) if error is not None]
+        if errors:
+            self._restore([staged for staged in pending if staged.temp_path is None])
+            self.rollback()
+            raise errors[0]
+
+        self._closed = True
+        self._shutdown()
+        return self.staged
+
+    def rollback(self) -> None:
+        """未確定の一時ファイルと、このトランザクションで作成したディレクトリを削除する"""
+        self._discard(self.staged)
+
+        for directory in reversed(self._created_dirs):
+            try:
+                directory.rmdir()
+            except OSError:
+                pass
+        self._created_dirs = []
+        self._closed = True
+        self._shutdown()
+
+    def _discard(self, staged_files: List[StagedFile]) -> None:
+        """未確定の一時ファイルを削除する"""
+        for staged in staged_files:
+            if staged.temp_path is not None:
+                try:
+                    staged.temp_path.unlink()
+                except FileNotFoundError:
+                    pass
+                staged.temp_path = None
+
+    def _map(self, fn: Callable, items: List) -> List:
+        """items の各要素に fn を適用する（workers が 2 以上ならスレッドプールで並列に行う）"""
+        if self.workers <= 1 or len(items) <= 1:
+            return _serial_map(fn, items)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        return list(self._executor.map(fn, items))
+
+    def _shutdown(self) -> None:
+        """スレッドプールを終了する"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _make_dirs(self, directories: Iterable[Path]) -> None:
+        """ディレクトリをまとめて作成し、新たに作ったものを記録する"""
+        with self._dirs_lock:
+            for directory in sorted(directories):
+                missing = []
+                current = directory
+                while not current.exists():
+                    missing.append(current)
+                    current = current.parent
+                for path in reversed(missing):
+                    path.mkdir(exist_ok=True)
+                    self._created_dirs.append(path)
+
+    def _write_temp(self, target: Path, data: bytes) -> Path:
+        """書き込み先と同じディレクトリに一時ファイルを作成する"""
+        fd, temp_name = tempfile.mkstemp(dir=target.parent, prefix=f'.{target.name}.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.chmod(temp_name, self._file_mode)
+        except BaseException:
+            os.unlink(temp_name)
+            raise
+        return Path(temp_name)
+
+    def _restore(self, committed: List[StagedFile]) -> None:
+        """確定済みの書き込みを元に戻す"""
+        for staged in reversed(committed):
+            try:
+                if staged.previous is None:
+                    staged.target.unlink()
+                else:
+                    staged.target.write_bytes(staged.previous)
+            except OSError:
+                pass
+
+
+class ScaffoldArchive:
+    """
+    生成したファイルを 1 つの tar / zip アーカイブにまとめて書き出すトランザクション
+
+    ScaffoldTransaction と同じ stage() / prepare() / record() / commit() / rollback() を持つため、
+    generate_batch() にそのまま渡せます。多数の小さなファイルを作成する代わりに
+    1 本のストリームを順に書き出すので、`docker cp -` でコンテナへ渡す場合などに向きます。
+    アーカイブ内のパスは書き込み先のパス（server/app/Mail/... など）そのままです。
+
+    アーカイブは出力先と同じディレクトリの一時ファイル（出力先が '-' の場合はスプール）に
+    書き出し、commit() で初めて出力先へリネーム（または標準出力へ送出）します。
+    途中で失敗した場合は rollback() で破棄するため、不完全なアーカイブは残りません。
+    """
+
+    # アーカイブには既存ファイルとの衝突がないため、常に上書きと同じ扱い
+    policy = 'overwrite'
+
+    # 出力先が '-' の場合に、この大きさまではメモリ上に保持する
+    SPOOL_SIZE = 16 * 1024 * 1024
+
+    def __init__(self, destination: str, archive_format: Optional[str] = None):
+        """
+        Args:
+            destination: 出力先のパス（'-' の場合は標準出力）
+            archive_format: アーカイブの形式（tar/tgz/zip。Noneの場合は拡張子から判別）
+
+        Raises:
+            ValueError: 形式を判別できない場合
+        """
+        archive_format = archive_format or self.detect_format(destination)
+        if archive_format not in ARCHIVE_FORMATS:
+            raise ValueError(f"archive_format must be one of: {', '.join(ARCHIVE_FORMATS)}")
+
+        self.destination = destination
+        self.format = archive_format
+        self.staged: List[StagedFile] = []
+        self._mtime = int(time.time())
+        self._lock = threading.Lock()
+        # prepare() で予約したメンバー名と、record() で書き出すまでの内容
+        self._names: set = set()
+        self._pending: Dict[Path, bytes] = {}
+        self._dirs: set = set()
+        self._closed = False
+        umask = os.umask(0)
+        os.umask(umask)
+        self._file_mode = 0o666 & ~umask
+
+        self._temp_path: Optional[Path] = None
+        if destination == '-':
+            self._file = tempfile.SpooledTemporaryFile(max_size=self.SPOOL_SIZE)
+        else:
+            target = Path(destination)
+            fd, temp_name = tempfile.mkstemp(dir=target.parent, prefix=f'.{target.name}.', suffix='.tmp')
+            self._file = os.fdopen(fd, 'w+b')
+            self._temp_path = Path(temp_name)
+
+        self._tar: Optional[tarfile.TarFile] = None
+        self._zip: Optional[zipfile.ZipFile] = None
+        if archive_format == 'zip':
+            self._zip = zipfile.ZipFile(self._file, 'w', zipfile.ZIP_DEFLATED)
+        else:
+            mode = 'w:gz' if archive_format == 'tgz' else 'w'
+            self._tar = tarfile.open(fileobj=self._file, mode=mode, format=tarfile.PAX_FORMAT)
+
+    @staticmethod
+    def detect_format(destination: str) -> str:
+        """
+        出力先の拡張子からアーカイブの形式を判別する（'-' の場合は tar）
+
+        Raises:
+            ValueError: 判別できない場合
+        """
+        name = destination.lower()
+        if destination == '-' or name.endswith('.tar'):
+            return 'tar'
+        if name.endswith(('.tar.gz', '.tgz')):
+            return 'tgz'
+        if name.endswith('.zip'):
+            return 'zip'
+        raise ValueError(
+            f"アーカイブの形式を判別できません: {destination}"
+            f"（拡張子を .tar / .tar.gz / .tgz / .zip にするか、--archive-format を指定してください）"
+        )
+
+    def __enter__(self) -> 'ScaffoldArchive':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if not self._closed:
+            self.rollback()
+
+    def stage(self, files: List[Tuple[Path, str]]) -> List[StagedFile]:
+        """
+        ファイルをアーカイブに追加する
+
+        Args:
+            files: (アーカイブ内のパス, 内容) のリスト
+
+        Returns:
+            追加したファイルのリスト
+        """
+        staged = self.prepare(files)
+        self.record(staged)
+        return staged
+
+    def prepare(self, files: List[Tuple[Path, str]], parallel: bool = True) -> List[StagedFile]:
+        """
+        内容をエンコードしてアーカイブ内のパスを予約する（書き出しは record() で行う）
+
+        複数のスレッドから同時に呼び出せます。
+
+        Args:
+            files: (アーカイブ内のパス, 内容) のリスト
+            parallel: ScaffoldTransaction.prepare() との互換のための引数（使用しない）
+
+        Returns:
+            予約したファイルのリスト（files と同じ順序）
+
+        Raises:
+            FileExistsError: 同じパスがすでにアーカイブに含まれている場合
+        """
+        encoded = [(target, content.encode('utf-8')) for target, content in files]
+        with self._lock:
+            names = [target.as_posix() for target, _ in encoded]
+            duplicates = [name for i, name in enumerate(names) if name in self._names or name in names[:i]]
+            if duplicates:
+                raise FileExistsError("アーカイブ内でパスが重複しています: " + ', '.join(duplicates))
+            self._names.update(names)
+            self._pending.update(encoded)
+
+        return [
+            StagedFile(target, 'archived', len(data), hashlib.sha256(data).hexdigest())
+            for target, data in encoded
+        ]
+
+    def record(self, staged: List[StagedFile]) -> None:
+        """prepare() で予約したファイルを、この順序でアーカイブに書き出す"""
+        for staged_file in staged:
+            self._add_member(staged_file.target.as_posix(), self._pending.pop(staged_file.target))
+        self.staged.extend(staged)
+
+    def commit(self) -> List[StagedFile]:
+        """
+        アーカイブを閉じて出力先へ確定する
+
+        Returns:
+            追加したすべてのファイル
+        """
+        try:
+            if self._tar is not None:
+                self._tar.close()
+            else:
+                self._zip.close()
+
+            if self._temp_path is None:
+                self._file.seek(0)
+                shutil.copyfileobj(self._file, sys.stdout.buffer)
+                sys.stdout.buffer.flush()
+                self._file.close()
+            else:
+                self._file.close()
+                os.chmod(self._temp_path, self._file_mode)
+                os.replace(self._temp_path, self.destination)
+                self._temp_path = None
+        except BaseException:
+            self.rollback()
+            raise
+
+        self._closed = True
+        return self.staged
+
+    def rollback(self) -> None:
+        """書き出し途中のアーカイブを破棄する"""
+        self._closed = True
+        self._pending.clear()
+        try:
+            self._file.close()
+        except OSError:
+            pass
+        if self._temp_path is not None:
+            try:
+                self._temp_path.unlink()
+            except FileNotFoundError:
+                pass
+            self._temp_path = None
+
+    def _add_member(self, name: str, data: bytes) -> None:
+        """ファイル 1 件をアーカイブに書き出す（tar では親ディレクトリのエントリも追加する）"""
+        if self._zip is not None:
+            info = zipfile.ZipInfo(name, date_time=time.localtime(self._mtime)[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o100644 << 16
+            self._zip.writestr(info, data)
+            return
+
+        parts = name.split('/')[:-1]
+        for i in range(1, len(parts) + 1):
+            directory = '/'.join(parts[:i])
+            if directory not in self._dirs:
+                self._dirs.add(directory)
+                self._tar.addfile(self._tar_info(directory, tarfile.DIRTYPE, 0o755))
+        info = self._tar_info(name, tarfile.REGTYPE, 0o644)
+        info.size = len(data)
+        self._tar.addfile(info, io.BytesIO(data))
+
+    def _tar_info(self, name: str, entry_type: bytes, mode: int) -> tarfile.TarInfo:
+        """tar のエントリ情報を作成する"""
+        info = tarfile.TarInfo(name)
+        info.type = entry_type
+        info.mode = mode
+        info.mtime = self._mtime
+        return info
+
+
+@dataclass
+class GenerationEntry:
+    """生成マニフェストに記録する、プロジェクトに書き込んだファイル 1 件分の生成元"""
+
+    label: str
+    template: str
+    template_sha256: str
+    # 置換マップの元になったメールの指定
+    name: str
+    model: str
+    recipient: str
+    # _create_replacements が返した置換マップ
+    replacements: Dict[str, str]
+    # 書き込んだ内容の SHA-256（手動で変更されたかの判定に使う）
+    sha256: str
+
+
+class GenerationManifest:
+    """
+    プロジェクトに書き込んだファイルと、その生成元を記録する生成マニフェスト
+
+    ファイルごとに生成元のテンプレート・テンプレートのハッシュ・置換マップを保持し、
+    テンプレートや置換マップが変わったファイルだけを再生成できるようにします。
+    キーは server/ からの相対パスです。
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: マニフェストファイルのパス（存在しない場合は空の状態で始める）
+
+        Raises:
+            ValueError: マニフェストファイルが壊れている場合
+        """
+        self.path = path
+        self.entries: Dict[str, GenerationEntry] = {}
+        self._dirty = False
+
+        try:
+            text = path.read_text()
+        except FileNotFoundError:
+            return
+
+        try:
+            data = json.loads(text)
+            if not isinstance(data, dict) or data.get('version') != self.VERSION:
+                raise ValueError('バージョンが異なります')
+            for relative_path, entry in data['outputs'].items():
+                self.entries[relative_path] = GenerationEntry(**entry)
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"生成マニフェストを読み込めません: {path}: {e}") from None
+
+    @classmethod
+    def for_project(cls, project_root: Path) -> 'GenerationManifest':
+        """プロジェクトのルート直下の生成マニフェストを開く"""
+        return cls(project_root / GENERATION_MANIFEST_NAME)
+
+    def record(self, relative_path: str, entry: GenerationEntry) -> None:
+        """ファイル 1 件分の生成元を記録する（同じパスの記録は置き換える）"""
+        if self.entries.get(relative_path) != entry:
+            self.entries[relative_path] = entry
+            self._dirty = True
+
+    def save(self) -> None:
+        """マニフェストファイルに書き出す（変更がない場合は何もしない）"""
+        if not self._dirty:
+            return
+
+        data = {
+            'version': self.VERSION,
+            'outputs': {relative_path: asdict(entry) for relative_path, entry in sorted(self.entries.items())},
+        }
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + '\n')
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+
+class ScaffoldReporter:
+    """
+    生成結果を出力形式に応じて出力するクラス
+
+    - full: 生成したファイルの内容をすべて表示する（従来の出力）
+    - summary: ファイルごとのパスとサイズ、書き込み結果のみ表示する
+    - json: 生成したファイル 1 件ごとに JSON を 1 行出力する（NDJSON）。
+      status は written / skipped / unchanged / archived（アーカイブに追加）/
+      rendered（書き込みなし）のいずれか。衝突計画でスキップしたファイルは生成しないため
+      bytes は 0、sha256 は空になる。
+      人が読むためのメッセージは標準エラー出力に回す
+    """
+
+    def __init__(self, mode: str = 'full', stream=None):
+        """
+        Args:
+            mode: 出力形式（full/summary/json）
+            stream: 出力先（Noneの場合は標準出力）
+        """
+        if mode not in OUTPUT_MODES:
+            raise ValueError(f"mode must be one of: {', '.join(OUTPUT_MODES)}")
+
+        self.mode = mode
+        self.stream = stream or sys.stdout
+
+    def rendered(self, files: List[GeneratedFile], will_write: bool) -> None:
+        """
+        生成したファイルを出力する
+
+        Args:
+            files: 生成したファイル
+            will_write: この後プロジェクトへ書き込むか（json では書き込み結果の出力時に記録する）
+        """
+        for generated in files:
+            if self.mode == 'full':
+                print(f"\n{'='*80}", file=self.stream)
+                print(f"{generated.label}: {generated.relative_path}", file=self.stream)
+                print(f"{'='*80}", file=self.stream)
+                print(generated.content, file=self.stream)
+            elif self.mode == 'summary':
+                print(f"{generated.label}: {generated.relative_path}", file=self.stream)
+            elif not will_write:
+                data = generated.content.encode('utf-8')
+                self._record(generated.relative_path, len(data), hashlib.sha256(data).hexdigest(), 'rendered')
+
+            if generated.report.unmatched:
+                print(
+                    f"⚠ 未置換のプレースホルダー: {', '.join(generated.report.unmatched)}（手動で置き換えてください）",
+                    file=sys.stderr,
+                )
+
+    def written(self, staged_files: Iterable[StagedFile]) -> None:
+        """書き込み結果を出力する"""
+        for staged in staged_files:
+            if self.mode == 'json':
+                status = staged.status if staged.status in ('skipped', 'unchanged', 'archived') else 'written'
+                self._record(str(staged.target), staged.size, staged.sha256, status)
+            elif staged.status == 'archived':
+                print(f"✓ アーカイブに追加しました: {staged.target}", file=self.stream)
+            elif staged.status == 'skipped':
+                print(f"スキップしました: {staged.target}", file=self.stream)
+            elif staged.status == 'unchanged':
+                print(f"変更なし: {staged.target}", file=self.stream)
+            elif staged.status == 'overwritten':
+                print(f"✓ 上書きしました: {staged.target}", file=self.stream)
+            else:
+                print(f"✓ 作成しました: {staged.target}", file=self.stream)
+
+    def message(self, text: str) -> None:
+        """人が読むためのメッセージを出力する（json では標準エラー出力へ）"""
+        print(text, file=sys.stderr if self.mode == 'json' else self.stream, flush=True)
+
+    def _record(self, path: str, size: int, sha256: str, status: str) -> None:
+        """ファイル 1 件分の JSON レコードを出力する"""
+        record = {'path': path, 'bytes': size, 'sha256': sha256, 'status': status}
+        print(json.dumps(record, ensure_ascii=False), file=self.stream, flush=True)
 
 
 class MailScaffoldGenerator:
@@ -27,13 +1104,27 @@ class MailScaffoldGenerator:
 
     RECIPIENT_TYPES = ['consumer', 'partner', 'administrator']
 
-    def __init__(self, skill_dir: Path):
+    def __init__(self, skill_dir: Path, template_cache_file: Optional[Path] = None):
         """
         Args:
             skill_dir: スキルのルートディレクトリ
+            template_cache_file: コンパイル済みテンプレートの保存先（Noneの場合は保存しない）
         """
         self.skill_dir = skill_dir
         self.templates_dir = skill_dir / 'assets' / 'templates'
+        self.engine = SubstitutionEngine(PLACEHOLDERS)
+        self.template_cache = TemplateCache(self.templates_dir, self.engine, template_cache_file)
+
+    def _render_template(self, relative_path: str, r: Dict[str, str]) -> Tuple[str, SubstitutionReport, str, str]:
+        """
+        キャッシュ済みテンプレートのプレースホルダーを置換マップで置換する
+
+        Returns:
+            (内容, 置換結果の報告, テンプレートのパス, テンプレートのハッシュ)
+        """
+        compiled = self.template_cache.get(relative_path)
+        content, report = compiled.render(r)
+        return content, report, relative_path, compiled.sha256
 
     def generate(
         self,
@@ -45,7 +1136,13 @@ class MailScaffoldGenerator:
         generate_test: bool = True,
         generate_twig: bool = True,
         generate_virtual_resource: bool = True,
-    ) -> None:
+        overwrite: str = 'prompt',
+        workers: int = 1,
+        output: str = 'full',
+        skip_unchanged: bool = False,
+        archive: Optional[str] = None,
+        archive_format: Optional[str] = None,
+    ) -> List[GeneratedFile]:
         """
         メール関連のファイルを生成する
 
@@ -58,217 +1155,353 @@ class MailScaffoldGenerator:
             generate_test: テストクラスを生成するか
             generate_twig: Twig テンプレートを生成するか
             generate_virtual_resource: VirtualResource オーバーライドファイルを生成するか
+            overwrite: 既存ファイルと衝突したときの扱い（prompt/skip/overwrite/fail）
+            workers: ファイルの書き込みに使うスレッド数
+            output: 出力形式（full/summary/json）
+            skip_unchanged: 既存ファイルと内容が同じ場合は書き込まない
+            archive: プロジェクトに書き込む代わりに出力するアーカイブのパス（'-' の場合は標準出力）
+            archive_format: アーカイブの形式（tar/tgz/zip。Noneの場合は拡張子から判別）
+
+        Returns:
+            生成されたファイルのリスト
+        """
+        spec = MailSpec(
+            name=name,
+            model=model,
+            recipient=recipient,
+            generate_notification=generate_notification,
+            generate_test=generate_test,
+            generate_twig=generate_twig,
+            generate_virtual_resource=generate_virtual_resource,
+        )
+        generation_manifest = GenerationManifest.for_project(project_root) if project_root and not archive else None
+        # アーカイブを標準出力に書く場合、それ以外の出力は標準エラー出力に回す
+        reporter = ScaffoldReporter(output, sys.stderr if archive == '-' else None)
+        plan = None
+        if project_root and not archive:
+            # 衝突を生成前にまとめて判定し、書き込まないファイルは生成しない
+            plan = self.plan([spec], project_root, skip_unchanged)
+            plan.resolve(overwrite, sys.stderr if output == 'json' else None)
+        files = self.render(spec, skip=plan.skipped if plan else ())
+        reporter.rendered(files, will_write=project_root is not None or archive is not None)
+
+        if archive:
+            with ScaffoldArchive(archive, archive_format) as archive_transaction:
+                # アーカイブ内のパスは server/ から始まる相対パスにする
+                archive_transaction.stage(self._targets(Path(), files))
+                reporter.written(archive_transaction.commit())
+        elif project_root:
+            with ScaffoldTransaction(overwrite, workers, skip_unchanged, plan) as transaction:
+                transaction.record(plan.skipped_files())
+                staged_files = transaction.stage(self._targets(project_root, files))
+                reporter.written(transaction.commit())
+            self.record_generation(generation_manifest, spec, files, staged_files)
+            generation_manifest.save()
+
+        return files
+
+    def generate_batch(
+        self,
+        specs: Iterable[MailSpec],
+        project_root: Optional[Path] = None,
+        transaction: Optional[ScaffoldTransaction] = None,
+        workers: int = 1,
+        plan: Optional[ScaffoldPlan] = None,
+    ) -> Iterator[BatchResult]:
+        """
+        複数のメールを 1 プロセスでまとめて生成する
+
+        テンプレートはジェネレーター内で一度だけ読み込まれ、全行で共有されます。
+        結果は 1 行生成し終えるごとに yield されるため、呼び出し側は逐次
+        サマリーを出力できます。
+
+        transaction を渡すと全行の出力をそのトランザクションに登録するだけで確定はしないため、
+        呼び出し側がバッチ全体をまとめて commit() / rollback() できます。
+        省略した場合は行ごとにトランザクションを作成して確定します。
+        transaction には ScaffoldArchive も渡せます（project_root には Path() を渡すと、
+        アーカイブ内のパスが server/ から始まる相対パスになります）。
+
+        workers に 2 以上を指定すると、各行の生成と一時ファイルの書き出しを
+        その数を上限とするスレッドプールで行います。同時に処理中の行は workers の
+        2 倍までに制限され、結果は入力と同じ順序で yield されます。
+
+        plan を渡すと、計画でスキップと決まったファイルは生成しません
+        （衝突の確認は計画時に済んでいるため、prompt ポリシーでも並列に生成できます）。
+
+        Args:
+            specs: 生成するメールの指定
+            project_root: プロジェクトのルートディレクトリ（Noneの場合は書き込まない）
+            transaction: 出力を登録するトランザクション
+            workers: 生成に使うスレッド数
+            plan: resolve() 済みの衝突計画（transaction にも同じものを渡す）
+
+        Yields:
+            行ごとの生成結果（失敗した行は error にメッセージが入る）
+        """
+        if workers > 1 and project_root and (transaction is None or (transaction.policy == 'prompt' and plan is None)):
+            raise ValueError("並列生成では prompt 以外の overwrite ポリシーか、衝突計画を持つトランザクションが必要です")
+        skip = plan.skipped if plan else ()
+
+        def run(spec: MailSpec) -> BatchResult:
+            try:
+                files = self.render(spec, skip)
+            except ValueError as e:
+                return BatchResult(spec=spec, error=str(e))
+
+            staged = []
+            if project_root:
+                targets = self._targets(project_root, files)
+                try:
+                    if transaction is not None:
+                        # 並列生成時はこの関数自体がワーカースレッドで動くため、I/O は直列に行う
+                        staged = transaction.prepare(targets, parallel=workers <= 1)
+                    else:
+                        with ScaffoldTransaction() as row_transaction:
+                            row_transaction.stage(targets)
+                            row_transaction.commit()
+                except OSError as e:
+                    return BatchResult(spec=spec, error=str(e))
+
+            return BatchResult(spec=spec, files=files, staged=staged)
+
+        def record(result: BatchResult) -> BatchResult:
+            if transaction is not None:
+                transaction.record(result.staged)
+            return result
+
+        if workers <= 1:
+            for spec in specs:
+                yield record(run(spec))
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            try:
+                for spec in specs:
+                    pending.append(executor.submit(run, spec))
+                    if len(pending) >= workers * 2:
+                        yield record(pending.popleft().result())
+                while pending:
+                    yield record(pending.popleft().result())
+            finally:
+                # 途中で中断された場合も、書き出し済みの一時ファイルを rollback() で片付けられるよう登録する
+                for future in pending:
+                    if not future.cancel():
+                        record(future.result())
+
+    def render(self, spec: MailSpec, skip: Collection[str] = ()) -> List[GeneratedFile]:
         """
-        if recipient not in self.RECIPIENT_TYPES:
+        1 件分のファイル内容を生成する（書き込みは行わない）
+
+        Args:
+            spec: 生成するメールの指定
+            skip: 生成しないファイルの server/ からの相対パス
+
+        Returns:
+            生成されたファイルのリスト（出力順）
+        """
+        if spec.recipient not in self.RECIPIENT_TYPES:
             raise ValueError(f"recipient must be one of: {', '.join(self.RECIPIENT_TYPES)}")
 
         # プレースホルダーの置換マップ
-        replacements = self._create_replacements(name, model, recipient)
+        replacements = self._create_replacements(spec.name, spec.model, spec.recipient)
+        return [
+            GeneratedFile(label, relative_path, *generate(replacements))
+            for label, relative_path, generate in self._outputs(spec)
+            if relative_path not in skip
+        ]
+
+    def plan(self, specs: Iterable[MailSpec], project_root: Path, skip_unchanged: bool = False) -> ScaffoldPlan:
+        """
+        生成前に全書き込み先を求め、既存ファイルとの衝突を書き込み先のディレクトリごとに判定する
 
-        # Mailable クラスを生成
-        mailable_content = self._generate_mailable(replacements)
-        print(f"\n{'='*80}")
-        print(f"Mailable Class: app/Mail/{name}.php")
-        print(f"{'='*80}")
-        print(mailable_content)
+        受信者タイプが不正な指定は生成時にエラーになるため、計画には含めません。
+        skip_unchanged を指定すると、既存ファイルと衝突する書き込み先だけを生成して
+        内容を比較し、同じものを衝突から除きます（書き込むかどうかは
+        ScaffoldTransaction が改めて判定します）。
 
-        if project_root:
-            self._write_file(
-                project_root / 'server' / 'app' / 'Mail' / f'{name}.php',
-                mailable_content
-            )
+        Args:
+            specs: 生成するメールの指定
+            project_root: プロジェクトのルートディレクトリ
+            skip_unchanged: 既存ファイルと内容が同じ書き込み先を衝突とみなさない
 
-        # Notification クラスを生成
-        if generate_notification:
-            notification_name = f"{name}Notification"
-            notification_content = self._generate_notification(replacements, notification_name)
-            print(f"\n{'='*80}")
-            print(f"Notification Class: app/Notifications/{notification_name}.php")
-            print(f"{'='*80}")
-            print(notification_content)
+        Returns:
+            衝突計画（ポリシーの適用は resolve() で行う）
 
-            if project_root:
-                self._write_file(
-                    project_root / 'server' / 'app' / 'Notifications' / f'{notification_name}.php',
-                    notification_content
-                )
+        Raises:
+            OSError: ディレクトリやテンプレートを読み込めない場合
+        """
+        specs = [spec for spec in specs if spec.recipient in self.RECIPIENT_TYPES]
+        plan = ScaffoldPlan(project_root / 'server', [
+            relative_path for spec in specs for _, relative_path, _ in self._outputs(spec)
+        ])
+        if not skip_unchanged or not plan.existing:
+            return plan
+
+        for spec in specs:
+            outputs = [output for output in self._outputs(spec) if output[1] in plan.existing]
+            if not outputs:
+                continue
+            replacements = self._create_replacements(spec.name, spec.model, spec.recipient)
+            for _, relative_path, generate in outputs:
+                data = generate(replacements)[0].encode('utf-8')
+                target = plan.root / relative_path
+                try:
+                    if target.stat().st_size == len(data) and target.read_bytes() == data:
+                        plan.unchanged.add(relative_path)
+                except OSError:
+                    continue
+        return plan
+
+    def _outputs(self, spec: MailSpec) -> List[Tuple[str, str, Callable]]:
+        """1 件分の生成対象の (ラベル, server/ からの相対パス, 生成メソッド) のリスト（出力順）"""
+        template_name = self._camel_to_snake(spec.name)
+        recipient_dir = f'to_{spec.recipient}'
+        name = spec.name
+
+        # Mailable クラス
+        outputs = [('Mailable Class', f'app/Mail/{name}.php', self._generate_mailable)]
+
+        # Notification クラス
+        if spec.generate_notification:
+            outputs.append(('Notification Class', f'app/Notifications/{name}Notification.php', self._generate_notification))
+
+        # Test クラス
+        if spec.generate_test:
+            outputs.append(('Test Class', f'tests/Feature/Mail/{name}Test.php', self._generate_test))
+
+        # Twig テンプレート
+        if spec.generate_twig:
+            twig_dir = f'resources/views/emails/{recipient_dir}'
+            outputs.append(('HTML Template', f'{twig_dir}/{template_name}.twig', self._generate_twig_html))
+            outputs.append(('Text Template', f'{twig_dir}/{template_name}_plain.twig', self._generate_twig_text))
+
+        # VirtualResource オーバーライドファイル
+        if spec.generate_virtual_resource:
+            vr_dir = f'database/seeders/data/virtual_resources/views/emails/{recipient_dir}'
+            outputs.append(('VirtualResource HTML', f'{vr_dir}/{template_name}.twig', self._generate_virtual_resource_html))
+            outputs.append((
+                'VirtualResource Text', f'{vr_dir}/{template_name}_plain.twig', self._generate_virtual_resource_text
+            ))
+
+        return outputs
+
+    def record_generation(
+        self,
+        generation_manifest: GenerationManifest,
+        spec: MailSpec,
+        files: List[GeneratedFile],
+        staged_files: List[StagedFile],
+    ) -> None:
+        """
+        プロジェクトに書き込んだファイルの生成元を生成マニフェストに記録する
 
-        # Test クラスを生成
-        if generate_test:
-            test_name = f"{name}Test"
-            test_content = self._generate_test(replacements, test_name)
-            print(f"\n{'='*80}")
-            print(f"Test Class: tests/Feature/Mail/{test_name}.php")
-            print(f"{'='*80}")
-            print(test_content)
+        スキップしたファイル（既存の内容を残したもの）は記録しません。
 
-            if project_root:
-                self._write_file(
-                    project_root / 'server' / 'tests' / 'Feature' / 'Mail' / f'{test_name}.php',
-                    test_content
-                )
+        Args:
+            generation_manifest: 記録先の生成マニフェスト
+            spec: 生成したメールの指定
+            files: 生成したファイル
+            staged_files: files と同じ順序の書き込み結果
+        """
+        replacements = self._create_replacements(spec.name, spec.model, spec.recipient)
+        for generated, staged in zip(files, staged_files):
+            if staged.status == 'skipped':
+                continue
+            generation_manifest.record(generated.relative_path, GenerationEntry(
+                label=generated.label,
+                template=generated.template,
+                template_sha256=generated.template_sha256,
+                name=spec.name,
+                model=spec.model,
+                recipient=spec.recipient,
+                replacements=replacements,
+                sha256=staged.sha256,
+            ))
+
+    def regenerate(self, generation_manifest: GenerationManifest) -> Iterator[Tuple[str, Optional[GeneratedFile]]]:
+        """
+        生成マニフェストに記録されたファイルのうち、生成元が変わったものだけを生成し直す
 
-        # Twig テンプレートを生成
-        if generate_twig:
-            template_name = replacements['template_name']
-            recipient_dir = f"to_{recipient}"
-
-            # HTML テンプレート
-            html_content = self._generate_twig_html(replacements)
-            print(f"\n{'='*80}")
-            print(f"HTML Template: resources/views/emails/{recipient_dir}/{template_name}.twig")
-            print(f"{'='*80}")
-            print(html_content)
-
-            # Plain Text テンプレート
-            text_content = self._generate_twig_text(replacements)
-            print(f"\n{'='*80}")
-            print(f"Text Template: resources/views/emails/{recipient_dir}/{template_name}_plain.twig")
-            print(f"{'='*80}")
-            print(text_content)
+        テンプレートのハッシュと置換マップを記録と比較し、どちらも同じファイルは
+        生成せずに None を返します（テンプレートはキャッシュ経由で取得するため、
+        変更されていなければ stat のみで判定できます）。
 
-            if project_root:
-                twig_dir = project_root / 'server' / 'resources' / 'views' / 'emails' / recipient_dir
-                self._write_file(twig_dir / f'{template_name}.twig', html_content)
-                self._write_file(twig_dir / f'{template_name}_plain.twig', text_content)
-
-        # VirtualResource オーバーライドファイルを生成
-        if generate_virtual_resource:
-            template_name = replacements['template_name']
-            recipient_dir = f"to_{recipient}"
-
-            # HTML版オーバーライド
-            vr_html_content = self._generate_virtual_resource_html(replacements)
-            print(f"\n{'='*80}")
-            print(f"VirtualResource HTML: database/seeders/data/virtual_resources/views/emails/{recipient_dir}/{template_name}.twig")
-            print(f"{'='*80}")
-            print(vr_html_content)
-
-            # Plain Text版オーバーライド
-            vr_text_content = self._generate_virtual_resource_text(replacements)
-            print(f"\n{'='*80}")
-            print(f"VirtualResource Text: database/seeders/data/virtual_resources/views/emails/{recipient_dir}/{template_name}_plain.twig")
-            print(f"{'='*80}")
-            print(vr_text_content)
+        Args:
+            generation_manifest: 生成マニフェスト
 
-            if project_root:
-                vr_dir = project_root / 'server' / 'database' / 'seeders' / 'data' / 'virtual_resources' / 'views' / 'emails' / recipient_dir
-                self._write_file(vr_dir / f'{template_name}.twig', vr_html_content)
-                self._write_file(vr_dir / f'{template_name}_plain.twig', vr_text_content)
+        Yields:
+            (server/ からの相対パス, 生成し直したファイル。最新の場合は None)
+
+        Raises:
+            OSError: テンプレートを読み込めない場合
+        """
+        for relative_path, entry in sorted(generation_manifest.entries.items()):
+            replacements = self._create_replacements(entry.name, entry.model, entry.recipient)
+            compiled = self.template_cache.get(entry.template)
+            if compiled.sha256 == entry.template_sha256 and replacements == entry.replacements:
+                yield relative_path, None
+                continue
+
+            content, report = compiled.render(replacements)
+            yield relative_path, GeneratedFile(
+                entry.label, relative_path, content, report, entry.template, compiled.sha256
+            )
 
     def _create_replacements(self, name: str, model: str, recipient: str) -> Dict[str, str]:
-        """プレースホルダーの置換マップを作成"""
+        """プレースホルダーの置換マップを作成（キーは PLACEHOLDERS）"""
         # キャメルケースをスネークケースに変換
         template_name = self._camel_to_snake(name)
+        model_var = model[0].lower() + model[1:]  # Application -> application
 
         return {
-            'mailable_name': name,
-            'notification_name': f'{name}Notification',
-            'model_name': model,
-            'model_var': model[0].lower() + model[1:],  # Application -> application
-            'recipient_type': recipient,
-            'recipient_dir': f'to_{recipient}',
-            'template_name': template_name,
+            'YourMailableNameTest': f'{name}Test',
+            'YourMailableName': name,
+            'YourNotificationName': f'{name}Notification',
+            'YourModel': model,
+            '$model': f'${model_var}',
+            'seedModel': f'seed{model}',
+            'to_consumer': f'to_{recipient}',
+            'your_template': template_name,
         }
 
     def _camel_to_snake(self, name: str) -> str:
         """キャメルケースをスネークケースに変換"""
-        import re
         s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
         return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
 
-    def _generate_mailable(self, r: Dict[str, str]) -> str:
+    def _generate_mailable(self, r: Dict[str, str]) -> Tuple[str, SubstitutionReport, str, str]:
         """Mailable クラスを生成"""
-        template_path = self.templates_dir / 'mailable-template.php'
-        content = template_path.read_text()
-
-        content = content.replace('YourMailableName', r['mailable_name'])
-        content = content.replace('YourModel', r['model_name'])
-        content = content.replace('$model', f"${r['model_var']}")
-        content = content.replace('to_consumer', r['recipient_dir'])
-        content = content.replace('your_template', r['template_name'])
+        return self._render_template('mailable-template.php', r)
 
-        return content
-
-    def _generate_notification(self, r: Dict[str, str], notification_name: str) -> str:
+    def _generate_notification(self, r: Dict[str, str]) -> Tuple[str, SubstitutionReport, str, str]:
         """Notification クラスを生成"""
-        template_path = self.templates_dir / 'notification-template.php'
-        content = template_path.read_text()
-
-        content = content.replace('YourNotificationName', notification_name)
-        content = content.replace('YourMailableName', r['mailable_name'])
-        content = content.replace('YourModel', r['model_name'])
-        content = content.replace('$model', f"${r['model_var']}")
+        return self._render_template('notification-template.php', r)
 
-        return content
-
-    def _generate_test(self, r: Dict[str, str], test_name: str) -> str:
+    def _generate_test(self, r: Dict[str, str]) -> Tuple[str, SubstitutionReport, str, str]:
         """Test クラスを生成"""
-        template_path = self.templates_dir / 'mail-test-template.php'
-        content = template_path.read_text()
-
-        content = content.replace('YourMailableNameTest', test_name)
-        content = content.replace('YourMailableName', r['mailable_name'])
-        content = content.replace('YourModel', r['model_name'])
-        content = content.replace('seedModel', f"seed{r['model_name']}")
-        content = content.replace('to_consumer', r['recipient_dir'])
-        content = content.replace('your_template', r['template_name'])
+        return self._render_template('mail-test-template.php', r)
 
-        return content
-
-    def _generate_twig_html(self, r: Dict[str, str]) -> str:
+    def _generate_twig_html(self, r: Dict[str, str]) -> Tuple[str, SubstitutionReport, str, str]:
         """HTML Twig テンプレートを生成"""
-        template_path = self.templates_dir / 'twig' / 'email-template.twig'
-        content = template_path.read_text()
-
-        # 基本的な置換（必要に応じてカスタマイズ）
-        return content
+        return self._render_template('twig/email-template.twig', r)
 
-    def _generate_twig_text(self, r: Dict[str, str]) -> str:
+    def _generate_twig_text(self, r: Dict[str, str]) -> Tuple[str, SubstitutionReport, str, str]:
         """Plain Text Twig テンプレートを生成"""
-        template_path = self.templates_dir / 'twig' / 'email-template_plain.twig'
-        content = template_path.read_text()
+        return self._render_template('twig/email-template_plain.twig', r)
 
-        # 基本的な置換（必要に応じてカスタマイズ）
-        return content
-
-    def _generate_virtual_resource_html(self, r: Dict[str, str]) -> str:
+    def _generate_virtual_resource_html(self, r: Dict[str, str]) -> Tuple[str, SubstitutionReport, str, str]:
         """VirtualResource HTML オーバーライドファイルを生成"""
-        template_path = self.templates_dir / 'twig' / 'virtual_resource_override.twig'
-        content = template_path.read_text()
-
-        # プレースホルダーを置換
-        content = content.replace('to_consumer', r['recipient_dir'])
-        content = content.replace('your_template', r['template_name'])
+        return self._render_template('twig/virtual_resource_override.twig', r)
 
-        return content
-
-    def _generate_virtual_resource_text(self, r: Dict[str, str]) -> str:
+    def _generate_virtual_resource_text(self, r: Dict[str, str]) -> Tuple[str, SubstitutionReport, str, str]:
         """VirtualResource Plain Text オーバーライドファイルを生成"""
-        template_path = self.templates_dir / 'twig' / 'virtual_resource_override_plain.twig'
-        content = template_path.read_text()
-
-        # プレースホルダーを置換
-        content = content.replace('to_consumer', r['recipient_dir'])
-        content = content.replace('your_template', r['template_name'])
+        return self._render_template('twig/virtual_resource_override_plain.twig', r)
 
-        return content
-
-    def _write_file(self, path: Path, content: str) -> None:
-        """ファイルを書き込む"""
-        # ディレクトリが存在しない場合は作成
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        # ファイルが既に存在する場合は確認
-        if path.exists():
-            response = input(f"\n{path} は既に存在します。上書きしますか？ (y/N): ")
-            if response.lower() != 'y':
-                print(f"スキップしました: {path}")
-                return
-
-        # ファイルを書き込む
-        path.write_text(content)
-        print(f"✓ 作成しました: {path}")
+    @staticmethod
+    def _targets(project_root: Path, files: List[GeneratedFile]) -> List[Tuple[Path, str]]:
+        """生成したファイルの (書き込み先, 内容) のリストを作成する"""
+        return [(project_root / 'server' / generated.relative_path, generated.content) for generated in files]
 
 
 def interactive_mode(generator: MailScaffoldGenerator) -> None:
@@ -332,6 +1565,281 @@ def interactive_mode(generator: MailScaffoldGenerator) -> None:
     print("=" * 80)
 
 
+def load_manifest(manifest_path: Path) -> List[MailSpec]:
+    """
+    マニフェストファイル（JSON / CSV）を読み込む
+
+    JSON はオブジェクトの配列、または {"mailables": [...]} 形式。
+    CSV はヘッダー行付きで name, model, recipient, flags 列を持つ。
+    flags には --no-notification などのオプション名から "--" を除いたものを
+    カンマまたは空白区切りで指定する（例: "no-test no-twig"）。
+
+    Args:
+        manifest_path: マニフェストファイルのパス
+
+    Returns:
+        行ごとの MailSpec のリスト
+    """
+    suffix = manifest_path.suffix.lower()
+    if suffix == '.json':
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        rows = data.get('mailables') if isinstance(data, dict) else data
+        if not isinstance(rows, list):
+            raise ValueError("JSON マニフェストは配列、または 'mailables' 配列を持つオブジェクトである必要があります")
+    elif suffix == '.csv':
+        with open(manifest_path, 'r', encoding='utf-8', newline='') as f:
+            rows = list(csv.DictReader(f))
+    else:
+        raise ValueError(f"未対応のマニフェスト形式です: {manifest_path}（.json または .csv を指定してください）")
+
+    specs = []
+    for line_no, row in enumerate(rows, 1):
+        if not isinstance(row, dict):
+            raise ValueError(f"{line_no} 行目: オブジェクトである必要があります")
+
+        values = {}
+        for key in ('name', 'model', 'recipient'):
+            value = (row.get(key) or '').strip()
+            if not value:
+                raise ValueError(f"{line_no} 行目: '{key}' は必須です")
+            values[key] = value
+
+        flags = row.get('flags') or []
+        if isinstance(flags, str):
+            flags = flags.replace(',', ' ').split()
+        for flag in flags:
+            attribute = MANIFEST_FLAGS.get(flag.strip().lstrip('-'))
+            if attribute is None:
+                raise ValueError(
+                    f"{line_no} 行目: 不明なフラグです: {flag}"
+                    f"（{', '.join(MANIFEST_FLAGS)} のいずれかを指定してください）"
+                )
+            values[attribute] = False
+
+        specs.append(MailSpec(**values))
+
+    return specs
+
+
+def manifest_mode(
+    generator: MailScaffoldGenerator,
+    manifest_path: Path,
+    project_root: Optional[Path],
+    overwrite: str = 'prompt',
+    workers: int = 1,
+    output: str = 'summary',
+    skip_unchanged: bool = False,
+    archive: Optional[str] = None,
+    archive_format: Optional[str] = None,
+) -> bool:
+    """
+    マニフェストに列挙されたメールを一括生成し、行ごとのサマリーを逐次出力する
+
+    ファイルはバッチ全体で 1 つのトランザクションにまとめ、すべての行が成功した場合のみ
+    書き込みを確定します。既存ファイルとの衝突は生成前に全行分まとめて判定し
+    （ScaffoldPlan）、書き込まないファイルは生成しません。archive を指定した場合は、
+    プロジェクトに書き込む代わりに全行のファイルを 1 つのアーカイブにまとめて出力します。
+
+    Returns:
+        すべての行が成功した場合 True
+    """
+    # アーカイブを標準出力に書く場合、それ以外の出力は標準エラー出力に回す
+    reporter = ScaffoldReporter(output, sys.stderr if archive == '-' else None)
+    try:
+        specs = load_manifest(manifest_path)
+    except (OSError, ValueError) as e:
+        reporter.message(f"エラー: マニフェストを読み込めません: {e}")
+        return False
+
+    generation_manifest = None
+    plan = None
+    if archive:
+        try:
+            transaction = ScaffoldArchive(archive, archive_format)
+        except (OSError, ValueError) as e:
+            reporter.message(f"エラー: アーカイブを作成できません: {e}")
+            return False
+        # アーカイブ内のパスは server/ から始まる相対パスにする
+        project_root = Path()
+    else:
+        if project_root:
+            try:
+                generation_manifest = GenerationManifest.for_project(project_root)
+                # 全行の衝突を生成前にまとめて判定する（prompt でも確認は 1 回で済む）
+                plan = generator.plan(specs, project_root, skip_unchanged)
+                plan.resolve(overwrite, sys.stderr if output == 'json' else None)
+            except (OSError, ValueError) as e:
+                reporter.message(f"エラー: {e}")
+                return False
+        transaction = ScaffoldTransaction(overwrite, workers, skip_unchanged, plan)
+        if plan is not None:
+            transaction.record(plan.skipped_files())
+
+    total = len(specs)
+    failed = 0
+    with transaction:
+        results = generator.generate_batch(specs, project_root, transaction, workers, plan)
+        for index, result in enumerate(results, 1):
+            spec = result.spec
+            if result.error:
+                failed += 1
+                reporter.message(f"[{index}/{total}] ✗ {spec.name} ({spec.recipient}): {result.error}")
+                continue
+
+            if output == 'full' or (output == 'json' and not project_root):
+                reporter.rendered(result.files, will_write=project_root is not None)
+            unmatched = sorted({p for generated in result.files for p in generated.report.unmatched})
+            note = f" (未置換: {', '.join(unmatched)})" if unmatched else ''
+            reporter.message(f"[{index}/{total}] ✓ {spec.name} ({spec.recipient}): {len(result.files)} ファイル{note}")
+            if generation_manifest is not None:
+                # 記録はメモリ上に留め、書き込みを確定した後で保存する
+                generator.record_generation(generation_manifest, spec, result.files, result.staged)
+
+        if project_root:
+            if failed:
+                transaction.rollback()
+                reporter.message("\nエラーがあったため、ファイルは書き込みませんでした")
+            else:
+                staged_files = transaction.commit()
+                if output == 'json':
+                    reporter.written(staged_files)
+                if archive:
+                    destination = '標準出力' if archive == '-' else archive
+                    reporter.message(f"\nアーカイブ: {len(staged_files)} ファイルを {destination} に書き込みました")
+                else:
+                    counts = {status: 0 for status in ('created', 'overwritten', 'skipped', 'unchanged')}
+                    for staged in staged_files:
+                        counts[staged.status] += 1
+                    reporter.message(
+                        f"\n書き込み: 作成 {counts['created']} / 上書き {counts['overwritten']} / "
+                        f"スキップ {counts['skipped']} / 変更なし {counts['unchanged']}"
+                    )
+                    generation_manifest.save()
+
+    reporter.message("\n" + "=" * 80)
+    if failed:
+        reporter.message(f"✗ {total} 件中 {failed} 件の生成に失敗しました (成功 {total - failed} 件 / 失敗 {failed} 件)")
+    else:
+        reporter.message(f"✓ 生成が完了しました！ (成功 {total} 件 / 失敗 0 件)")
+    reporter.message("=" * 80)
+
+    return failed == 0
+
+
+def plan_mode(
+    generator: MailScaffoldGenerator,
+    specs: List[MailSpec],
+    project_root: Path,
+    overwrite: str = 'prompt',
+    skip_unchanged: bool = False,
+) -> bool:
+    """
+    何も書き込まずに、書き込み先ごとの作成・衝突の計画を表示する
+
+    Returns:
+        overwrite が fail で衝突がある場合 False
+    """
+    try:
+        plan = generator.plan(specs, project_root, skip_unchanged)
+    except OSError as e:
+        print(f"エラー: {e}")
+        return False
+    if overwrite == 'skip':
+        plan.resolve(overwrite)
+    for line in plan.describe(overwrite):
+        print(line)
+    return not (overwrite == 'fail' and plan.conflicts)
+
+
+def regenerate_mode(
+    generator: MailScaffoldGenerator,
+    project_root: Path,
+    overwrite: str = 'prompt',
+    workers: int = 1,
+    output: str = 'summary',
+) -> bool:
+    """
+    生成マニフェストに記録されたファイルのうち、テンプレートか置換マップが変わったものだけを再生成する
+
+    生成後に手動で変更されたファイル（内容が記録したハッシュと異なる、または削除されたもの）は
+    overwrite に従って扱います（prompt: 確認する / skip: スキップ / overwrite: 上書き /
+    fail: 何も書き込まずに終了）。それ以外のファイルは確認せずに上書きします。
+
+    Returns:
+        エラーがなかった場合 True
+    """
+    reporter = ScaffoldReporter(output)
+    try:
+        generation_manifest = GenerationManifest.for_project(project_root)
+    except (OSError, ValueError) as e:
+        reporter.message(f"エラー: {e}")
+        return False
+    if not generation_manifest.entries:
+        reporter.message(f"生成マニフェストに記録がありません: {generation_manifest.path}")
+        return True
+
+    files = []
+    current = 0
+    try:
+        for relative_path, generated in generator.regenerate(generation_manifest):
+            if generated is None:
+                current += 1
+            else:
+                files.append(generated)
+    except OSError as e:
+        reporter.message(f"エラー: テンプレートを読み込めません: {e}")
+        return False
+
+    # 生成後に手動で変更されたファイルを探す
+    modified = []
+    for generated in files:
+        target = project_root / 'server' / generated.relative_path
+        try:
+            sha256 = hashlib.sha256(target.read_bytes()).hexdigest()
+        except FileNotFoundError:
+            sha256 = None
+        if sha256 != generation_manifest.entries[generated.relative_path].sha256:
+            modified.append(generated)
+
+    if modified and overwrite == 'fail':
+        reporter.message(
+            "エラー: 生成後に変更されたファイルがあるため、何も書き込みませんでした: "
+            + ', '.join(generated.relative_path for generated in modified)
+        )
+        return False
+
+    skipped = []
+    for generated in modified:
+        if overwrite == 'skip':
+            skipped.append(generated)
+        elif overwrite == 'prompt':
+            response = input(f"\n{generated.relative_path} は生成後に変更されています。再生成しますか？ (y/N): ")
+            if response.lower() != 'y':
+                skipped.append(generated)
+    files = [generated for generated in files if generated not in skipped]
+
+    if output == 'full':
+        reporter.rendered(files, will_write=True)
+    with ScaffoldTransaction('overwrite', workers, skip_unchanged=True) as transaction:
+        transaction.stage(generator._targets(project_root, files))
+        staged_files = transaction.commit()
+    reporter.written(staged_files)
+
+    for generated, staged in zip(files, staged_files):
+        entry = generation_manifest.entries[generated.relative_path]
+        spec = MailSpec(name=entry.name, model=entry.model, recipient=entry.recipient)
+        generator.record_generation(generation_manifest, spec, [generated], [staged])
+    generation_manifest.save()
+
+    for generated in skipped:
+        reporter.message(f"スキップしました（生成後に変更されています）: {generated.relative_path}")
+    reporter.message(
+        f"\n再生成: {len(files)} ファイル / 最新 {current} ファイル / スキップ {len(skipped)} ファイル"
+    )
+    return True
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Laravel メール関連のスキャフォールドを生成します',
@@ -349,6 +1857,26 @@ def main():
 
   # ファイルをプロジェクトに書き込む
   python3 generate_mail_scaffold.py --name JobofferApplied --model Application --recipient consumer --project-root /path/to/project
+
+  # マニフェストに列挙したメールを一括生成（CSV 例: name,model,recipient,flags）
+  python3 generate_mail_scaffold.py --manifest mails.csv --project-root /path/to/project
+
+  # 生成したファイルごとに JSON を 1 行出力（パス・サイズ・ハッシュ・書き込み結果）
+  python3 generate_mail_scaffold.py --manifest mails.csv --project-root /path/to/project --overwrite skip --output json
+
+  # CI などで確認なしに実行（既存ファイルがあれば何も書き込まずに失敗）
+  python3 generate_mail_scaffold.py --manifest mails.csv --project-root /path/to/project --overwrite fail
+
+  # 何も書き込まずに、既存ファイルとの衝突の計画だけを表示する
+  python3 generate_mail_scaffold.py --manifest mails.csv --project-root /path/to/project --plan
+
+  # プロジェクトに書き込む代わりに 1 つのアーカイブにまとめる（"-" で標準出力に tar を出力）
+  python3 generate_mail_scaffold.py --manifest mails.csv --archive mails.tar.gz
+  python3 generate_mail_scaffold.py --manifest mails.csv --archive - | docker cp - container:/var/www
+
+  # テンプレートを更新した後、影響のある生成済みファイルだけを再生成する
+  # （プロジェクトに書き込んだファイルの生成元は <project-root>/.mail-scaffold.json に記録される）
+  python3 generate_mail_scaffold.py --regenerate --project-root /path/to/project --overwrite skip
         """
     )
 
@@ -358,6 +1886,32 @@ def main():
                         help='受信者タイプ')
     parser.add_argument('--project-root', type=Path,
                         help='プロジェクトのルートディレクトリ（ファイルを書き込む場合）')
+    parser.add_argument('--manifest', type=Path,
+                        help='一括生成するメールを列挙したマニフェスト（.json / .csv）')
+    parser.add_argument('--regenerate', action='store_true',
+                        help='生成マニフェストに記録されたファイルのうち、テンプレートか置換マップが'
+                             '変わったものだけを再生成する（--project-root が必要）')
+    parser.add_argument('--archive', metavar='PATH',
+                        help='プロジェクトに書き込む代わりに、生成したファイルを 1 つのアーカイブにまとめて出力する'
+                             '（.tar / .tar.gz / .tgz / .zip。"-" の場合は標準出力）')
+    parser.add_argument('--archive-format', choices=ARCHIVE_FORMATS,
+                        help='アーカイブの形式（既定は --archive の拡張子から判別。"-" の場合は tar）')
+    parser.add_argument('--overwrite', choices=OVERWRITE_POLICIES, default='prompt',
+                        help='既存ファイルと衝突したときの扱い（prompt: 衝突の一覧を表示してまとめて確認する / '
+                             'skip: スキップ / overwrite: 上書き / fail: 何も書き込まずに終了）')
+    parser.add_argument('--plan', action='store_true',
+                        help='何も書き込まずに、書き込み先ごとの作成・衝突の計画を表示する'
+                             '（--project-root が必要。--overwrite fail で衝突があれば終了コード 1）')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='生成と書き込みに使うスレッド数（既定: 1。2 以上で並列に書き込む）')
+    parser.add_argument('--output', choices=OUTPUT_MODES,
+                        help='出力形式（full: ファイル内容をすべて表示 / summary: パスと結果のみ / '
+                             'json: ファイルごとに JSON を 1 行出力）。'
+                             '既定はマニフェストモードでは summary、それ以外は full')
+    parser.add_argument('--skip-unchanged', action='store_true',
+                        help='既存ファイルと内容が同じ場合は書き込まない（mtime を更新しない）')
+    parser.add_argument('--template-cache', type=Path,
+                        help='コンパイル済みテンプレートを保存するキャッシュファイル（次回以降の実行で再利用）')
     parser.add_argument('--no-notification', action='store_true',
                         help='Notification クラスを生成しない')
     parser.add_argument('--no-test', action='store_true',
@@ -368,30 +1922,121 @@ def main():
                         help='VirtualResource オーバーライドファイルを生成しない')
 
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error('--jobs には 1 以上を指定してください')
+    if args.plan:
+        if not args.project_root:
+            parser.error('--plan には --project-root を指定してください')
+        if args.regenerate or args.archive:
+            parser.error('--plan は --regenerate / --archive と同時に指定できません')
+        if not args.manifest and not (args.name and args.model and args.recipient):
+            parser.error('--plan はマニフェストモードまたはコマンドラインモードで指定してください')
+    if args.regenerate:
+        if not args.project_root:
+            parser.error('--regenerate には --project-root を指定してください')
+        if args.manifest or args.name or args.archive:
+            parser.error('--regenerate は --manifest / --name / --archive と同時に指定できません')
+    if args.archive_format and not args.archive:
+        parser.error('--archive-format は --archive と組み合わせて指定してください')
+    if args.archive:
+        if args.project_root:
+            parser.error('--archive と --project-root は同時に指定できません')
+        if not args.manifest and not (args.name and args.model and args.recipient):
+            parser.error('--archive はマニフェストモードまたはコマンドラインモードで指定してください')
+        if not args.archive_format:
+            try:
+                ScaffoldArchive.detect_format(args.archive)
+            except ValueError as e:
+                parser.error(str(e))
 
     # スキルディレクトリを取得
     skill_dir = Path(__file__).parent.parent
-    generator = MailScaffoldGenerator(skill_dir)
+    generator = MailScaffoldGenerator(skill_dir, template_cache_file=args.template_cache)
+
+    if args.regenerate:
+        # 再生成モード
+        success = regenerate_mode(
+            generator,
+            args.project_root,
+            args.overwrite,
+            args.jobs,
+            args.output or 'summary',
+        )
+        generator.template_cache.save()
+        sys.exit(0 if success else 1)
+
+    if args.plan:
+        # 衝突計画の表示のみ
+        if args.manifest:
+            try:
+                specs = load_manifest(args.manifest)
+            except (OSError, ValueError) as e:
+                print(f"エラー: マニフェストを読み込めません: {e}")
+                sys.exit(1)
+        else:
+            specs = [MailSpec(
+                name=args.name,
+                model=args.model,
+                recipient=args.recipient,
+                generate_notification=not args.no_notification,
+                generate_test=not args.no_test,
+                generate_twig=not args.no_twig,
+                generate_virtual_resource=not args.no_virtual_resource,
+            )]
+        sys.exit(0 if plan_mode(generator, specs, args.project_root, args.overwrite, args.skip_unchanged) else 1)
+
+    if args.manifest:
+        # マニフェストモード
+        success = manifest_mode(
+            generator,
+            args.manifest,
+            args.project_root,
+            args.overwrite,
+            args.jobs,
+            args.output or 'summary',
+            args.skip_unchanged,
+            args.archive,
+            args.archive_format,
+        )
+        generator.template_cache.save()
+        sys.exit(0 if success else 1)
 
     # コマンドライン引数が指定されていない場合はインタラクティブモード
     if not args.name or not args.model or not args.recipient:
         interactive_mode(generator)
     else:
         # コマンドラインモード
-        generator.generate(
-            name=args.name,
-            model=args.model,
-            recipient=args.recipient,
-            project_root=args.project_root,
-            generate_notification=not args.no_notification,
-            generate_test=not args.no_test,
-            generate_twig=not args.no_twig,
-            generate_virtual_resource=not args.no_virtual_resource,
-        )
-
-        print("\n" + "=" * 80)
-        print("✓ 生成が完了しました！")
-        print("=" * 80)
+        try:
+            generator.generate(
+                name=args.name,
+                model=args.model,
+                recipient=args.recipient,
+                project_root=args.project_root,
+                generate_notification=not args.no_notification,
+                generate_test=not args.no_test,
+                generate_twig=not args.no_twig,
+                generate_virtual_resource=not args.no_virtual_resource,
+                overwrite=args.overwrite,
+                workers=args.jobs,
+                output=args.output or 'full',
+                skip_unchanged=args.skip_unchanged,
+                archive=args.archive,
+                archive_format=args.archive_format,
+            )
+        except (OSError, ValueError) as e:
+            # FileExistsError のほか、アーカイブの出力先に書き込めない・生成マニフェストが壊れている場合
+            error_stream = sys.stderr if args.output == 'json' or args.archive == '-' else sys.stdout
+            print(f"エラー: {e}", file=error_stream)
+            sys.exit(1)
+
+        if args.output != 'json':
+            # アーカイブを標準出力に書く場合は標準エラー出力に表示する
+            stream = sys.stderr if args.archive == '-' else sys.stdout
+            print("\n" + "=" * 80, file=stream)
+            print("✓ 生成が完了しました！", file=stream)
+            print("=" * 80, file=stream)
+
+    generator.template_cache.save()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,137 @@
+"""
+generate_mail_scaffold.py のテスト
+
+    python3 -m unittest discover skills/jobantenna/laravel-mail/tests
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+SCRIPT = Path(__file__).resolve().parent.parent / 'scripts' / 'generate_mail_scaffold.py'
+SPEC = ['--name', 'JobofferApplied', '--model', 'Application', '--recipient', 'consumer']
+
+
+def run(*args: str, stdin: str = '') -> subprocess.CompletedProcess:
+    """スクリプトを実行する"""
+    return subprocess.run(
+        [sys.executable, str(SCRIPT), *args], input=stdin, capture_output=True, text=True, timeout=60
+    )
+
+
+class SkipUnchangedPolicyTest(unittest.TestCase):
+    """--skip-unchanged と各 --overwrite ポリシーの組み合わせ"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        result = run(*SPEC, '--project-root', str(self.root), '--output', 'summary')
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        self.mailable = self.root / 'server' / 'app' / 'Mail' / 'JobofferApplied.php'
+        self.files = sorted(p for p in (self.root / 'server').rglob('*') if p.is_file())
+        self.assertEqual(len(self.files), 7)
+        self.mtimes = {p: p.stat().st_mtime_ns for p in self.files}
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def generate_json(self, policy: str, stdin: str = '') -> subprocess.CompletedProcess:
+        return run(
+            *SPEC, '--project-root', str(self.root), '--overwrite', policy,
+            '--skip-unchanged', '--output', 'json', stdin=stdin,
+        )
+
+    def statuses(self, result: subprocess.CompletedProcess) -> dict:
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        return {Path(record['path']): record for record in records}
+
+    def assert_all_unchanged(self, result: subprocess.CompletedProcess) -> None:
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        records = self.statuses(result)
+        self.assertEqual(sorted(records), self.files)
+        for record in records.values():
+            self.assertEqual(record['status'], 'unchanged')
+            self.assertGreater(record['bytes'], 0)
+            self.assertEqual(len(record['sha256']), 64)
+        self.assertEqual({p: p.stat().st_mtime_ns for p in self.files}, self.mtimes)
+
+    def test_fail(self):
+        self.assert_all_unchanged(self.generate_json('fail'))
+
+    def test_skip(self):
+        self.assert_all_unchanged(self.generate_json('skip'))
+
+    def test_prompt_does_not_ask(self):
+        # 入力がなければ確認時に EOFError で失敗する
+        result = self.generate_json('prompt')
+        self.assert_all_unchanged(result)
+        self.assertNotIn('上書きしますか', result.stderr)
+
+    def test_overwrite(self):
+        self.assert_all_unchanged(self.generate_json('overwrite'))
+
+    def test_fail_with_modified_file(self):
+        self.mailable.write_text('edited')
+        result = self.generate_json('fail')
+        self.assertEqual(result.returncode, 1)
+        self.assertIn(str(self.mailable), result.stderr)
+        self.assertNotIn('JobofferAppliedNotification.php', result.stderr)
+        self.assertEqual(self.mailable.read_text(), 'edited')
+
+    def test_skip_with_modified_file(self):
+        self.mailable.write_text('edited')
+        records = self.statuses(self.generate_json('skip'))
+        self.assertEqual(records.pop(self.mailable)['status'], 'skipped')
+        self.assertEqual({record['status'] for record in records.values()}, {'unchanged'})
+        self.assertEqual(self.mailable.read_text(), 'edited')
+
+    def test_prompt_with_modified_file(self):
+        self.mailable.write_text('edited')
+        result = self.generate_json('prompt', stdin='a\n')
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stderr.count(str(self.root / 'server')), 1)
+        records = self.statuses(result)
+        self.assertEqual(records.pop(self.mailable)['status'], 'written')
+        self.assertEqual({record['status'] for record in records.values()}, {'unchanged'})
+        self.assertNotEqual(self.mailable.read_text(), 'edited')
+
+    def test_plan(self):
+        self.mailable.write_text('edited')
+        result = run(*SPEC, '--project-root', str(self.root), '--plan', '--overwrite', 'fail', '--skip-unchanged')
+        self.assertEqual(result.returncode, 1)
+        self.assertIn('衝突 1 / 変更なし 6', result.stdout)
+
+
+class ManifestSummaryTest(unittest.TestCase):
+    """マニフェストモードの最終サマリー"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def run_manifest(self, rows: str) -> subprocess.CompletedProcess:
+        manifest = self.dir / 'mails.csv'
+        manifest.write_text('name,model,recipient\n' + rows)
+        return run('--manifest', str(manifest))
+
+    def test_success_banner(self):
+        result = self.run_manifest('JobofferApplied,Application,consumer\n')
+        self.assertEqual(result.returncode, 0)
+        self.assertIn('✓ 生成が完了しました！', result.stdout)
+
+    def test_failure_summary(self):
+        result = self.run_manifest('JobofferApplied,Application,consumer\nBroken,Application,nobody\n')
+        self.assertEqual(result.returncode, 1)
+        self.assertNotIn('生成が完了しました', result.stdout)
+        self.assertIn('2 件中 1 件の生成に失敗しました', result.stdout)
+
+
+if __name__ == '__main__':
+    unittest.main()